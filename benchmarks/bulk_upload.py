@@ -0,0 +1,121 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+"""Bulk analysis result upload benchmarks."""
+
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from qiskit_ibm_experiment import IBMExperimentService
+
+# Simulated round trip time of each request.
+LATENCY = 0.02
+# Number of analysis results uploaded, as for a 127 qubit T1 experiment.
+NUM_RESULTS = 127
+
+
+class _UploadHandler(BaseHTTPRequestHandler):
+    """Handler accepting analysis results after a delay."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Return an access token or the created analysis results."""
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(LATENCY)
+        if self.path.endswith("/loginWithToken"):
+            data = {"id": "access-token"}
+        elif self.path.endswith("/analysis_results/bulk"):
+            if not self.server.bulk_endpoint:
+                self._send(404, {"error": {"message": "Not found", "code": 404}})
+                return
+            data = {"analysis_results": json.loads(body)}
+        else:
+            data = json.loads(body)
+            data.setdefault("uuid", str(uuid.uuid4()))
+        self._send(200, data)
+
+    def _send(self, status, data):
+        """Send a JSON response."""
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Do not log the requests."""
+
+
+class BulkUpload:
+    """Upload the analysis results of an experiment."""
+
+    params = [False, True]
+    param_names = ["bulk_endpoint"]
+
+    def setup(self, bulk_endpoint):
+        """Start a server accepting analysis results."""
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _UploadHandler)
+        self.server.daemon_threads = True
+        self.server.bulk_endpoint = bulk_endpoint
+        url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.service = IBMExperimentService(token=str(uuid.uuid4()), url=url)
+        experiment_id = str(uuid.uuid4())
+        self.results = [
+            {
+                "experiment_id": experiment_id,
+                "result_type": "T1",
+                "result_data": {"value": 1e-4, "stderr": 1e-6},
+                "device_components": [f"Q{qubit}"],
+            }
+            for qubit in range(NUM_RESULTS)
+        ]
+
+    def teardown(self, _):
+        """Stop the server."""
+        self.service.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def time_serial(self, _):
+        """Upload the results one after the other."""
+        for result in self.results:
+            self.service.create_analysis_result(**result)
+
+    def time_concurrent(self, _):
+        """Upload the results concurrently, in batches if possible."""
+        self.service.create_analysis_results(self.results)
+
+    def time_write_behind(self, _):
+        """Queue the results with the ``write_behind`` option, and flush them."""
+        self.service.set_option(write_behind=True)
+        try:
+            for result in self.results:
+                self.service.create_analysis_result(**result)
+            self.service.flush()
+        finally:
+            self.service.set_option(write_behind=False)
+
+    def track_throughput(self, _):
+        """Return the number of results uploaded per second."""
+        start = time.perf_counter()
+        self.service.create_analysis_results(self.results)
+        return NUM_RESULTS / (time.perf_counter() - start)
+
+    track_throughput.unit = "results/s"
@@ -0,0 +1,26 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+"""Package import benchmarks, each run in a new interpreter."""
+
+
+class ImportTime:
+    """Import the package, as short-lived workers do on startup."""
+
+    def timeraw_import(self):
+        """Import the package and its dependencies."""
+        return "import qiskit_ibm_experiment"
+
+    def timeraw_import_after_qiskit(self):
+        """Import the package in a process that already imported Qiskit."""
+        return "import qiskit_ibm_experiment", "import qiskit"
@@ -0,0 +1,77 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+"""Service construction benchmarks."""
+
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from qiskit_ibm_experiment import IBMExperimentService
+
+# Simulated round trip time of the login request.
+LOGIN_LATENCY = 0.05
+
+
+class _LoginHandler(BaseHTTPRequestHandler):
+    """Handler answering login requests after a delay."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Return an access token."""
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(LOGIN_LATENCY)
+        body = json.dumps({"id": "access-token"}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Do not log the requests."""
+
+
+class ServiceConstruction:
+    """Construct a service, as short-lived workers do."""
+
+    def setup(self):
+        """Start a server answering login requests."""
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _LoginHandler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def teardown(self):
+        """Stop the server."""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _construct(self, **kwargs):
+        """Construct a service with a new API token, which is not cached."""
+        IBMExperimentService(token=str(uuid.uuid4()), url=self.url, **kwargs).close()
+
+    def time_eager(self):
+        """Construct a service authenticating in the constructor."""
+        self._construct()
+
+    def time_lazy(self):
+        """Construct a service authenticating on its first request."""
+        self._construct(lazy=True)
+
+    def time_local(self):
+        """Construct a local service, for reference."""
+        IBMExperimentService(local=True)
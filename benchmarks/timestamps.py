@@ -0,0 +1,64 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+"""Timestamp conversion benchmarks."""
+
+from datetime import timezone
+
+import dateutil.parser
+import dateutil.tz
+
+from qiskit_ibm_experiment.service.utils import (
+    str_to_utc,
+    utc_to_local,
+    utc_to_local_many,
+)
+
+
+def _legacy_utc_to_local(utc_dt):
+    """Timestamp conversion before the ISO 8601 fast path, for reference."""
+    utc_dt = dateutil.parser.parse(utc_dt)
+    return utc_dt.replace(tzinfo=timezone.utc).astimezone(dateutil.tz.tzlocal())
+
+
+class TimestampConversion:
+    """Convert a page worth of server timestamps."""
+
+    params = [100, 10000]
+    param_names = ["num_timestamps"]
+
+    def setup(self, num_timestamps):
+        """Generate server timestamps."""
+        self.timestamps = [
+            f"2022-01-{idx % 28 + 1:02d}T10:{idx % 60:02d}:00.{idx % 1000000:06d}Z"
+            for idx in range(num_timestamps)
+        ]
+
+    def time_legacy_utc_to_local(self, _):
+        """Convert timestamps with dateutil, as done previously."""
+        for timestamp in self.timestamps:
+            _legacy_utc_to_local(timestamp)
+
+    def time_utc_to_local(self, _):
+        """Convert timestamps one by one."""
+        for timestamp in self.timestamps:
+            utc_to_local(timestamp)
+
+    def time_utc_to_local_many(self, _):
+        """Convert all the timestamps at once."""
+        utc_to_local_many(self.timestamps)
+
+    def time_str_to_utc(self, _):
+        """Convert timestamps to UTC datetimes."""
+        for timestamp in self.timestamps:
+            str_to_utc(timestamp)
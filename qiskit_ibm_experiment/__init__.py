@@ -53,20 +53,29 @@ Exceptions
     IBMExperimentError
     IBMExperimentEntryExists
     IBMExperimentEntryNotFound
+    IBMExperimentCircuitOpen
+    IBMExperimentQueueFull
 """
 
 import logging
 
-from .service import IBMExperimentService
+from .service import IBMExperimentService, AsyncIBMExperimentService
 
 from .exceptions import *
-from .service.utils import setup_logger
-from .version import __version__
 
 
-# Setup the logger for the IBM Quantum Provider package.
+# The logger of the package is set up when the first service is created.
 logger = logging.getLogger(__name__)
-setup_logger(logger)
+
+
+def __getattr__(name):
+    """Return ``__version__``, which is computed on first use."""
+    if name == "__version__":
+        from .version import get_version_info  # pylint: disable=import-outside-toplevel
+
+        return get_version_info()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Constants used by the IBM Quantum logger.
 QISKIT_IBM_EXPERIMENT_LOGGER_NAME = "qiskit_ibm_experiment"
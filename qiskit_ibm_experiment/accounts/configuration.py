@@ -17,8 +17,6 @@ from dataclasses import dataclass
 from typing import Optional, Dict, Any
 from urllib.parse import urlparse
 
-from requests_ntlm import HttpNtlmAuth
-
 
 @dataclass
 class ProxyConfiguration:
@@ -79,6 +77,10 @@ class ProxyConfiguration:
             request_kwargs["proxies"] = self.urls
 
         if self.username_ntlm and self.password_ntlm:
+            # Imported here since it is slow to import and rarely used.
+            # pylint: disable=import-outside-toplevel
+            from requests_ntlm import HttpNtlmAuth
+
             request_kwargs["auth"] = HttpNtlmAuth(
                 self.username_ntlm, self.password_ntlm
             )
@@ -22,6 +22,9 @@ from .storage import save_config, read_config, delete_config
 _DEFAULT_ACCOUNT_CONFIG_JSON_FILE = os.path.join(
     os.path.expanduser("~"), ".qiskit", "qiskit-ibm.json"
 )
+DEFAULT_TOKEN_CACHE_DIR = os.path.join(
+    os.path.dirname(_DEFAULT_ACCOUNT_CONFIG_JSON_FILE), "qiskit-ibm-experiment-tokens"
+)
 _DEFAULT_ACCOUNT_NAME = "default"
 _DEFAULT_ACCOUNT_TYPE: str = "legacy"
 _ACCOUNT_TYPES = ["legacy"]
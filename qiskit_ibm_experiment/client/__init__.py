@@ -26,6 +26,8 @@ Classes
     :toctree: ../stubs/
 
     ExperimentClient
+    AsyncExperimentClient
 """
 
 from .experiment import ExperimentClient
+from .async_experiment import AsyncExperimentClient
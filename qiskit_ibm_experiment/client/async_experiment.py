@@ -0,0 +1,469 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Asynchronous client for accessing IBM Quantum experiment services."""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from .async_session import AsyncRetrySession
+from .experiment_rest_adapter import (
+    ExperimentRestAdapter,
+    experiments_params,
+    analysis_results_params,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncExperimentRestAdapter:
+    """Asynchronous REST adapter for experiment result DB.
+
+    The endpoints and their parameters are the same as the ones of
+    :class:`~qiskit_ibm_experiment.client.experiment_rest_adapter.ExperimentRestAdapter`.
+    """
+
+    URL_MAP = ExperimentRestAdapter.URL_MAP
+
+    _HEADER_JSON_CONTENT = {"Content-Type": "application/json"}
+
+    def __init__(self, session: AsyncRetrySession, prefix_url: str = "") -> None:
+        """AsyncExperimentRestAdapter constructor.
+
+        Args:
+            session: Session to be used in the adapter.
+            prefix_url: String to be prepend to all URLs.
+        """
+        self.session = session
+        self.prefix_url = prefix_url
+
+    def get_url(self, identifier: str) -> str:
+        """Return the resolved URL for the specified identifier.
+
+        Args:
+            identifier: Internal identifier of the endpoint.
+
+        Returns:
+            The resolved URL of the endpoint (relative to the session base URL).
+        """
+        return self.prefix_url + self.URL_MAP[identifier]
+
+    async def devices(self) -> Dict:
+        """Return the device list."""
+        return (await self.session.get(self.get_url("devices"))).json()
+
+    async def experiments(self, **kwargs: Any) -> str:
+        """Return experiment data.
+
+        Args:
+            **kwargs: Filters, as accepted by :meth:`ExperimentRestAdapter.experiments`.
+
+        Returns:
+            Response text.
+        """
+        url = self.get_url("experiments")
+        return (await self.session.get(url, params=experiments_params(**kwargs))).text
+
+    async def experiment(self, experiment_id: str) -> str:
+        """Return a specific experiment.
+
+        Args:
+            experiment_id: Experiment uuid.
+
+        Returns:
+            Response text.
+        """
+        url = self.get_url("experiment").format(uuid=experiment_id)
+        return (await self.session.get(url)).text
+
+    async def experiment_upload(self, experiment: str) -> Dict:
+        """Upload an experiment.
+
+        Args:
+            experiment: The experiment data to upload.
+
+        Returns:
+            JSON response.
+        """
+        response = await self.session.post(
+            self.get_url("experiments"),
+            data=experiment,
+            headers=self._HEADER_JSON_CONTENT,
+        )
+        return response.json()
+
+    async def experiment_update(self, experiment_id: str, new_data: str) -> Dict:
+        """Update an experiment.
+
+        Args:
+            experiment_id: Experiment UUID.
+            new_data: New experiment data.
+
+        Returns:
+            JSON response.
+        """
+        url = self.get_url("experiment").format(uuid=experiment_id)
+        response = await self.session.put(
+            url, data=new_data, headers=self._HEADER_JSON_CONTENT
+        )
+        return response.json()
+
+    async def experiment_delete(self, experiment_id: str) -> Dict:
+        """Delete an experiment.
+
+        Args:
+            experiment_id: Experiment UUID.
+
+        Returns:
+            JSON response.
+        """
+        url = self.get_url("experiment").format(uuid=experiment_id)
+        return (await self.session.delete(url)).json()
+
+    async def analysis_results(self, **kwargs: Any) -> str:
+        """Return analysis results.
+
+        Args:
+            **kwargs: Filters, as accepted by
+                :meth:`ExperimentRestAdapter.analysis_results`.
+
+        Returns:
+            Response text.
+        """
+        url = self.get_url("analysis_results")
+        params = analysis_results_params(**kwargs)
+        return (await self.session.get(url, params=params)).text
+
+    async def analysis_result(self, result_id: str) -> str:
+        """Return a specific analysis result.
+
+        Args:
+            result_id: Analysis result UUID.
+
+        Returns:
+            Response text.
+        """
+        url = self.get_url("analysis_result").format(uuid=result_id)
+        return (await self.session.get(url)).text
+
+    async def analysis_result_create(self, result: str) -> Dict:
+        """Upload an analysis result.
+
+        Args:
+            result: The analysis result to upload.
+
+        Returns:
+            JSON response.
+        """
+        response = await self.session.post(
+            self.get_url("analysis_results"),
+            data=result,
+            headers=self._HEADER_JSON_CONTENT,
+        )
+        return response.json()
+
+    async def analysis_result_update(self, result_id: str, new_data: str) -> Dict:
+        """Update an analysis result.
+
+        Args:
+            result_id: Analysis result ID.
+            new_data: New analysis result data.
+
+        Returns:
+            JSON response.
+        """
+        url = self.get_url("analysis_result").format(uuid=result_id)
+        response = await self.session.put(
+            url, data=new_data, headers=self._HEADER_JSON_CONTENT
+        )
+        return response.json()
+
+    async def analysis_result_delete(self, result_id: str) -> Dict:
+        """Delete an analysis result.
+
+        Args:
+            result_id: Analysis result ID.
+
+        Returns:
+            JSON response.
+        """
+        url = self.get_url("analysis_result").format(uuid=result_id)
+        return (await self.session.delete(url)).json()
+
+    async def get_plot(self, experiment_id: str, plot_name: str) -> bytes:
+        """Retrieve the specific experiment plot.
+
+        Args:
+            experiment_id: The experiment the plot belongs to.
+            plot_name: Name of the plot to be retrieved.
+
+        Returns:
+            Plot content.
+        """
+        url = self.get_url("plot").format(uuid=experiment_id, name=plot_name)
+        return (await self.session.get(url)).content
+
+    async def delete_plot(self, experiment_id: str, plot_name: str) -> None:
+        """Delete this experiment plot.
+
+        Args:
+            experiment_id: The experiment the plot belongs to.
+            plot_name: Name of the plot to be deleted.
+        """
+        url = self.get_url("plot").format(uuid=experiment_id, name=plot_name)
+        await self.session.delete(url)
+
+    async def device_components(self, backend_name: Optional[str] = None) -> Dict:
+        """Return a list of device components for the backend.
+
+        Args:
+            backend_name: Name of the backend.
+
+        Returns:
+            JSON response.
+        """
+        params = {"device_name": backend_name} if backend_name else {}
+        url = self.get_url("device_components")
+        return (await self.session.get(url, params=params)).json()
+
+    async def files(self, experiment_id: str) -> Dict:
+        """Return the list of files of an experiment.
+
+        Args:
+            experiment_id: Experiment ID.
+
+        Returns:
+            JSON response.
+        """
+        url = self.get_url("files").format(uuid=experiment_id)
+        return (await self.session.get(url)).json()
+
+
+class AsyncExperimentClient:
+    """Asynchronous client for accessing IBM Quantum experiment services.
+
+    The methods of the client are coroutines with the same arguments and return
+    values as the ones of :class:`~qiskit_ibm_experiment.client.ExperimentClient`.
+    Any number of them can run concurrently, for example with ``asyncio.gather``;
+    the number of simultaneous connections is bounded by the ``pool_maxsize``
+    session parameter.
+    """
+
+    def __init__(
+        self, access_token: str, url: str, additional_params: Dict[str, Any]
+    ) -> None:
+        """AsyncExperimentClient constructor.
+
+        Args:
+            access_token: The session's access token
+            url: The session's base url
+            additional_params: additional session parameters
+        """
+        self._session = AsyncRetrySession(url, access_token, **additional_params)
+        self.api = AsyncExperimentRestAdapter(self._session)
+
+    async def close(self) -> None:
+        """Close the connections of the client."""
+        await self._session.close()
+
+    async def devices(self) -> Dict:
+        """Return the device list from the experiment DB."""
+        return (await self.api.devices())["devices"]
+
+    async def experiments(
+        self,
+        limit: Optional[int],
+        marker: Optional[str],
+        backend_name: Optional[str] = None,
+        page_size: Optional[int] = None,
+        **filters: Any,
+    ) -> str:
+        """Retrieve experiments, with optional filtering.
+
+        Args:
+            limit: Number of experiments to retrieve.
+            marker: Marker used to indicate where to start the next query.
+            backend_name: Name of the backend.
+            page_size: Maximum number of experiments to retrieve in this request.
+            **filters: Other filters, as accepted by
+                :meth:`~qiskit_ibm_experiment.client.ExperimentClient.experiments`.
+
+        Returns:
+            A list of experiments and the marker, if applicable.
+        """
+        if page_size is not None:
+            limit = page_size if limit is None else min(limit, page_size)
+        return await self.api.experiments(
+            limit=limit, marker=marker, backend_name=backend_name, **filters
+        )
+
+    async def experiment_get(self, experiment_id: str) -> str:
+        """Get a specific experiment.
+
+        Args:
+            experiment_id: Experiment uuid.
+
+        Returns:
+            Experiment data.
+        """
+        return await self.api.experiment(experiment_id)
+
+    async def experiment_upload(self, data: str) -> Dict:
+        """Upload an experiment.
+
+        Args:
+            data: Experiment data.
+
+        Returns:
+            Experiment data.
+        """
+        return await self.api.experiment_upload(data)
+
+    async def experiment_update(self, experiment_id: str, new_data: str) -> Dict:
+        """Update an experiment.
+
+        Args:
+            experiment_id: Experiment UUID.
+            new_data: New experiment data.
+
+        Returns:
+            Experiment data.
+        """
+        return await self.api.experiment_update(experiment_id, new_data)
+
+    async def experiment_delete(self, experiment_id: str) -> Dict:
+        """Delete an experiment.
+
+        Args:
+            experiment_id: Experiment UUID.
+
+        Returns:
+            Experiment data.
+        """
+        return await self.api.experiment_delete(experiment_id)
+
+    async def experiment_plot_get(self, experiment_id: str, plot_name: str) -> bytes:
+        """Retrieve an experiment plot.
+
+        Args:
+            experiment_id: Experiment UUID.
+            plot_name: Name of the plot.
+
+        Returns:
+            Retrieved experiment plot.
+        """
+        return await self.api.get_plot(experiment_id, plot_name)
+
+    async def experiment_plot_delete(
+        self, experiment_id: str, plot_file_name: str
+    ) -> None:
+        """Delete an experiment plot.
+
+        Args:
+            experiment_id: Experiment UUID.
+            plot_file_name: Plot file name.
+        """
+        await self.api.delete_plot(experiment_id, plot_file_name)
+
+    async def experiment_files_get(self, experiment_id: str) -> Dict:
+        """Retrieve the file list of an experiment.
+
+        Args:
+            experiment_id: Experiment UUID.
+
+        Returns:
+            The file list metadata.
+        """
+        return await self.api.files(experiment_id)
+
+    async def analysis_results(
+        self,
+        limit: Optional[int],
+        marker: Optional[str],
+        backend_name: Optional[str] = None,
+        page_size: Optional[int] = None,
+        **filters: Any,
+    ) -> str:
+        """Return a list of analysis results.
+
+        Args:
+            limit: Number of analysis results to retrieve.
+            marker: Marker used to indicate where to start the next query.
+            backend_name: Name of the backend.
+            page_size: Maximum number of analysis results to retrieve in this request.
+            **filters: Other filters, as accepted by
+                :meth:`~qiskit_ibm_experiment.client.ExperimentClient.analysis_results`.
+
+        Returns:
+            A list of analysis results and the marker, if applicable.
+        """
+        if page_size is not None:
+            limit = page_size if limit is None else min(limit, page_size)
+        return await self.api.analysis_results(
+            limit=limit, marker=marker, backend_name=backend_name, **filters
+        )
+
+    async def analysis_result_create(self, result: str) -> Dict:
+        """Upload an analysis result.
+
+        Args:
+            result: The analysis result to upload.
+
+        Returns:
+            Analysis result data.
+        """
+        return await self.api.analysis_result_create(result)
+
+    async def analysis_result_update(self, result_id: str, new_data: str) -> Dict:
+        """Update an analysis result.
+
+        Args:
+            result_id: ID of the analysis result to update.
+            new_data: New analysis result data.
+
+        Returns:
+            Analysis result data.
+        """
+        return await self.api.analysis_result_update(result_id, new_data)
+
+    async def analysis_result_delete(self, result_id: str) -> Dict:
+        """Delete an analysis result.
+
+        Args:
+            result_id: ID of the analysis result to delete.
+
+        Returns:
+            Analysis result data.
+        """
+        return await self.api.analysis_result_delete(result_id)
+
+    async def analysis_result_get(self, result_id: str) -> str:
+        """Retrieve an analysis result.
+
+        Args:
+            result_id: Analysis result ID.
+
+        Returns:
+            Analysis result data.
+        """
+        return await self.api.analysis_result(result_id)
+
+    async def device_components(self, backend_name: Optional[str] = None) -> List[Dict]:
+        """Retrieve device components.
+
+        Args:
+            backend_name: Name of the backend.
+
+        Returns:
+            A list of device components.
+        """
+        return (await self.api.device_components(backend_name))["device_components"]
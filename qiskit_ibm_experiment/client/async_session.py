@@ -0,0 +1,484 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Asynchronous session customized for IBM Quantum access."""
+
+import asyncio
+import json
+import logging
+import os
+import random
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from ..exceptions import RequestsApiError
+from .circuit_breaker import CircuitBreakers, is_failure
+from .compression import available_encodings, get_compressor
+from .session import (
+    CUSTOM_HEADER_ENV_VAR,
+    STATUS_FORCELIST,
+    RetryBudget,
+    client_application,
+)
+
+logger = logging.getLogger(__name__)
+
+_RETRY_AFTER_STATUS = (429, 503)
+# Methods whose requests can be sent again after they may have reached the server.
+_IDEMPOTENT_METHODS = frozenset(["DELETE", "GET", "HEAD", "OPTIONS", "PUT", "TRACE"])
+
+
+class AsyncResponse:
+    """Response of an asynchronous request, with its body already read."""
+
+    __slots__ = ("status_code", "headers", "content")
+
+    def __init__(self, status_code: int, headers: Dict[str, str], content: bytes):
+        """AsyncResponse constructor.
+
+        Args:
+            status_code: Response status code.
+            headers: Response headers.
+            content: Response body.
+        """
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self) -> str:
+        """Return the response body as text."""
+        return self.content.decode("utf-8")
+
+    def json(self) -> Any:
+        """Return the decoded JSON response body."""
+        return json.loads(self.content)
+
+
+class AsyncRetrySession:
+    """Asynchronous session with retry and handling of specific parameters.
+
+    This is the ``asyncio`` counterpart of :class:`RetrySession`, using ``aiohttp``.
+    It applies the same retry policy: requests, including ``POST`` requests, are
+    retried when the server responds with a status code in ``STATUS_FORCELIST``
+    and when the connection to the server cannot be established, honoring the
+    ``Retry-After`` header and the retry budget. Requests failing after the
+    connection was established, for instance with a timeout, are only retried
+    for idempotent methods, since a ``POST`` request may already have reached
+    the server. The underlying ``aiohttp`` session is created
+    on the first request, so that it belongs to the running event loop.
+
+    If :attr:`token_refresher` is set, a request whose access token the server
+    rejects is sent again, once, with the access token it returns.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        access_token: Optional[str],
+        retries_total: int = 8,
+        retries_connect: int = 5,
+        backoff_factor: float = 0.5,
+        verify: bool = True,
+        proxies: Optional[Dict[str, str]] = None,
+        timeout: Tuple[float, Union[float, None]] = (10.0, None),
+        pool_maxsize: int = 100,
+        request_compression: Optional[str] = None,
+        compress_min_size: int = 1024,
+        backoff_max: float = 120.0,
+        backoff_jitter: bool = True,
+        retry_after_max: float = 300.0,
+        retry_budget_ratio: Optional[float] = 0.2,
+        retry_budget_min_rate: float = 1.0,
+        circuit_breaker_threshold: int = 5,
+        circuit_breaker_timeout: float = 30.0,
+        **kwargs: Any,
+    ) -> None:
+        """AsyncRetrySession constructor.
+
+        Args:
+            base_url: Base URL for the session's requests.
+            access_token: Access token.
+            retries_total: Number of total retries for the requests.
+            retries_connect: Number of connect retries for the requests.
+            backoff_factor: Backoff factor between retry attempts.
+            verify: Whether to enable SSL verification.
+            proxies: Proxy URLs mapped by protocol.
+            timeout: Timeout for the requests, in the form of (connection_timeout,
+                total_timeout).
+            pool_maxsize: Maximum number of simultaneous connections. Requests
+                beyond this number wait for a free connection.
+            request_compression: Content coding used to compress the bodies of
+                the requests to the API, or ``None`` to not compress them.
+            compress_min_size: Minimum size of the request bodies to compress,
+                in bytes.
+            backoff_max: Maximum backoff between retry attempts, in seconds.
+            backoff_jitter: Whether to wait a random time between zero and the
+                backoff before retrying, instead of the backoff itself.
+            retry_after_max: Maximum time to wait before retrying when the server
+                responds with a ``Retry-After`` header, in seconds.
+            retry_budget_ratio: Maximum number of retries per request of the
+                :class:`RetryBudget` of the session, or ``None`` to not use one.
+            retry_budget_min_rate: Number of retries per second allowed by the
+                budget regardless of the number of requests.
+            circuit_breaker_threshold: Number of consecutive failures opening the
+                circuit breaker of an endpoint family, or ``0`` to not use
+                circuit breakers.
+            circuit_breaker_timeout: Number of seconds an open circuit breaker
+                fails requests before letting one through.
+            **kwargs: Options of :class:`RetrySession` that do not apply to
+                asynchronous sessions, which are ignored.
+
+        Raises:
+            ImportError: If ``aiohttp`` is not installed.
+            ValueError: If `request_compression` is not an available coding.
+        """
+        # pylint: disable=unused-argument
+        try:
+            import aiohttp  # pylint: disable=import-outside-toplevel,unused-import
+        except ImportError as ex:
+            raise ImportError(
+                "The asynchronous experiment service requires aiohttp. You can "
+                "install it with 'pip install qiskit-ibm-experiment[async]'."
+            ) from ex
+        if request_compression is not None and not get_compressor(request_compression):
+            raise ValueError(
+                f"{request_compression} is not an available request compression. "
+                f"Available compressions are {available_encodings()}."
+            )
+        self.base_url = base_url
+        self.access_token = access_token
+        self.request_compression = request_compression
+        self.compress_min_size = compress_min_size
+        self.retries_total = retries_total
+        self.retries_connect = retries_connect
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.backoff_jitter = backoff_jitter
+        self.retry_after_max = retry_after_max
+        self.retry_budget = None  # type: Optional[RetryBudget]
+        if retry_budget_ratio is not None:
+            self.retry_budget = RetryBudget(retry_budget_ratio, retry_budget_min_rate)
+        self.circuit_breakers = None  # type: Optional[CircuitBreakers]
+        if circuit_breaker_threshold:
+            self.circuit_breakers = CircuitBreakers(
+                circuit_breaker_threshold, circuit_breaker_timeout
+            )
+        self.verify = verify
+        self.proxies = proxies or {}
+        self._timeout = timeout
+        self._pool_maxsize = pool_maxsize
+        self._session = None  # type: Any
+        # Coroutine function called with a rejected access token, returning a
+        # new one.
+        self.token_refresher = None  # type: Optional[Callable[[str], Awaitable[str]]]
+
+        client_app_header = client_application()
+        custom_header = os.getenv(CUSTOM_HEADER_ENV_VAR)
+        if custom_header:
+            client_app_header += "/" + custom_header
+        self.headers = {"X-Qx-Client-Application": client_app_header}
+
+    def _get_session(self) -> Any:
+        """Return the ``aiohttp`` session, creating it if needed."""
+        # pylint: disable=import-outside-toplevel
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            connect_timeout, total_timeout = self._timeout
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._pool_maxsize, ssl=None if self.verify else False
+                ),
+                timeout=aiohttp.ClientTimeout(
+                    total=total_timeout, sock_connect=connect_timeout
+                ),
+            )
+        return self._session
+
+    def _backoff(self, retry: int, retry_after: Optional[str] = None) -> float:
+        """Return the time to wait before a retry, like :class:`PostForcelistRetry`.
+
+        Args:
+            retry: Number of the retry, starting at 1.
+            retry_after: Value of the ``Retry-After`` response header, if any.
+
+        Returns:
+            The time to wait, in seconds.
+        """
+        if retry_after is not None:
+            try:
+                return min(max(float(retry_after), 0), self.retry_after_max)
+            except ValueError:
+                pass  # HTTP dates are not used by the API.
+        backoff = min(self.backoff_max, self.backoff_factor * (2 ** (retry - 1)))
+        if self.backoff_jitter:
+            return random.uniform(0, backoff)
+        return backoff if retry > 1 else 0
+
+    def _can_retry(self) -> bool:
+        """Return whether the retry budget allows a retry."""
+        return self.retry_budget is None or self.retry_budget.try_retry()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        bare: bool = False,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> AsyncResponse:
+        """Send a request, retrying it if needed.
+
+        Args:
+            method: Method for the new request (e.g. ``POST``).
+            url: URL for the new request.
+            bare: If ``True``, do not send IBM Quantum specific information
+                (such as access token) in the request or modify the input `url`.
+            params: Query parameters. Values that are lists are sent as repeated
+                parameters.
+            headers: Additional request headers.
+            **kwargs: Additional arguments for ``aiohttp.ClientSession.request``.
+
+        Returns:
+            The response, with its body read.
+
+        Raises:
+            RequestsApiError: If the request failed.
+        """
+        request_headers = dict(self.headers)
+        if bare:
+            final_url = url
+        else:
+            final_url = self.base_url + url
+            if self.access_token:
+                request_headers["X-Access-Token"] = self.access_token
+        request_headers.update(headers or {})
+        data = kwargs.get("data")
+        if (
+            self.request_compression
+            and not bare
+            and isinstance(data, (str, bytes))
+            and len(data) >= self.compress_min_size
+        ):
+            body = data.encode("utf-8") if isinstance(data, str) else data
+            kwargs["data"] = get_compressor(self.request_compression)(body)
+            request_headers["Content-Encoding"] = self.request_compression
+        query = [
+            (key, str(item))
+            for key, value in (params or {}).items()
+            if value is not None
+            for item in (value if isinstance(value, list) else [value])
+        ]
+        proxy = self.proxies.get(final_url.split(":", 1)[0])
+
+        token = self.access_token
+        try:
+            return await self._checked_send(
+                method, url, bare, final_url, query, request_headers, proxy, **kwargs
+            )
+        except RequestsApiError as ex:
+            if ex.status_code != 401 or bare or self.token_refresher is None:
+                raise
+        logger.debug("The access token was rejected, requesting a new one.")
+        self.access_token = await self.token_refresher(token)
+        request_headers["X-Access-Token"] = self.access_token
+        return await self._checked_send(
+            method, url, bare, final_url, query, request_headers, proxy, **kwargs
+        )
+
+    async def _checked_send(
+        self,
+        method: str,
+        url: str,
+        bare: bool,
+        final_url: str,
+        query: List[Tuple[str, str]],
+        request_headers: Dict[str, str],
+        proxy: Optional[str],
+        **kwargs: Any,
+    ) -> AsyncResponse:
+        """Send a request through the circuit breaker of its endpoint family.
+
+        Args:
+            method: Request method.
+            url: URL relative to the base URL.
+            bare: Whether the request is sent to an URL outside of the API.
+            final_url: Request URL.
+            query: Query parameters.
+            request_headers: Request headers.
+            proxy: Proxy URL, if any.
+            **kwargs: Additional arguments for ``aiohttp.ClientSession.request``.
+
+        Returns:
+            The response, with its body read.
+
+        Raises:
+            RequestsApiError: If the request failed.
+        """
+        breaker = None
+        if self.circuit_breakers is not None and not bare:
+            breaker = self.circuit_breakers.get(url)
+            if breaker is not None:
+                breaker.before_request()
+        try:
+            response = await self._send(
+                method, final_url, query, request_headers, proxy, **kwargs
+            )
+        except RequestsApiError as ex:
+            if breaker is not None:
+                if is_failure(ex.status_code):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        return response
+
+    async def _send(
+        self,
+        method: str,
+        final_url: str,
+        query: List[Tuple[str, str]],
+        request_headers: Dict[str, str],
+        proxy: Optional[str],
+        **kwargs: Any,
+    ) -> AsyncResponse:
+        """Send a request, retrying it if needed.
+
+        Args:
+            method: Request method.
+            final_url: Request URL.
+            query: Query parameters.
+            request_headers: Request headers.
+            proxy: Proxy URL, if any.
+            **kwargs: Additional arguments for ``aiohttp.ClientSession.request``.
+
+        Returns:
+            The response, with its body read.
+
+        Raises:
+            RequestsApiError: If the request failed.
+        """
+        # pylint: disable=import-outside-toplevel
+        import aiohttp
+
+        if self.retry_budget is not None:
+            self.retry_budget.record_request()
+        retries = connect_retries = 0
+        while True:
+            try:
+                async with self._get_session().request(
+                    method,
+                    final_url,
+                    params=query,
+                    headers=request_headers,
+                    proxy=proxy,
+                    **kwargs,
+                ) as response:
+                    content = await response.read()
+                    status = response.status
+                    if (
+                        status in STATUS_FORCELIST
+                        and retries < self.retries_total
+                        and self._can_retry()
+                    ):
+                        retries += 1
+                        logger.debug(
+                            "Retrying method=%s, url=%s, status=%s",
+                            method,
+                            final_url,
+                            status,
+                        )
+                        retry_after = (
+                            response.headers.get("Retry-After")
+                            if status in _RETRY_AFTER_STATUS
+                            else None
+                        )
+                        await asyncio.sleep(self._backoff(retries, retry_after))
+                        continue
+                    if status >= 400:
+                        raise RequestsApiError(
+                            _error_message(status, response.reason, final_url, content),
+                            status,
+                        )
+                    return AsyncResponse(status, dict(response.headers), content)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as ex:
+                # The request may have reached the server, unless the connection
+                # could not be established.
+                may_be_sent = not isinstance(ex, aiohttp.ClientConnectorError)
+                if (
+                    (may_be_sent and method.upper() not in _IDEMPOTENT_METHODS)
+                    or retries >= self.retries_total
+                    or connect_retries >= self.retries_connect
+                    or not self._can_retry()
+                ):
+                    raise RequestsApiError(str(ex) or repr(ex)) from ex
+                retries += 1
+                connect_retries += 1
+                await asyncio.sleep(self._backoff(retries))
+            except aiohttp.ClientError as ex:
+                raise RequestsApiError(str(ex)) from ex
+
+    async def get(self, url: str, **kwargs: Any) -> AsyncResponse:
+        """Send a ``GET`` request. See :meth:`request`."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> AsyncResponse:
+        """Send a ``POST`` request. See :meth:`request`."""
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> AsyncResponse:
+        """Send a ``PUT`` request. See :meth:`request`."""
+        return await self.request("PUT", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> AsyncResponse:
+        """Send a ``DELETE`` request. See :meth:`request`."""
+        return await self.request("DELETE", url, **kwargs)
+
+    async def close(self) -> None:
+        """Close the connections of the session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncRetrySession":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+
+def _error_message(status: int, reason: Optional[str], url: str, content: bytes) -> str:
+    """Return the message of a failed request, like :class:`RetrySession` does.
+
+    Args:
+        status: Response status code.
+        reason: Response reason.
+        url: Request URL.
+        content: Response body.
+
+    Returns:
+        The error message.
+    """
+    kind = "Client" if status < 500 else "Server"
+    message = f"{status} {kind} Error: {reason} for url: {url}"
+    try:
+        error_json = json.loads(content)["error"]
+        message += ". {}, Error code: {}.".format(
+            error_json["message"], error_json["code"]
+        )
+    except Exception:  # pylint: disable=broad-except
+        # the response did not contain the expected json.
+        message += f". {content.decode('utf-8', errors='replace')}"
+    return message
@@ -0,0 +1,215 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Circuit breakers failing requests fast while the server is unavailable."""
+
+import enum
+import logging
+import re
+import threading
+import time
+from typing import Dict, Optional
+
+from ..exceptions import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+# Endpoint families mapped to the patterns of their URLs, relative to the API URL.
+# Plots and files are checked first, since their URLs start with the experiment URL.
+_FAMILY_PATTERNS = [
+    ("plots", re.compile(r"^/experiments/[^/]+/plots(/|$)")),
+    ("files", re.compile(r"^/experiments/[^/]+/files(/|$)")),
+    ("experiments", re.compile(r"^/experiments(/|$)")),
+    ("analysis_results", re.compile(r"^/analysis_results(/|$)")),
+]
+
+
+class CircuitState(enum.Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    """Requests are sent."""
+    OPEN = "open"
+    """Requests fail immediately."""
+    HALF_OPEN = "half_open"
+    """A single request is sent to check whether the server recovered."""
+
+
+def endpoint_family(url: str) -> Optional[str]:
+    """Return the endpoint family of an API URL.
+
+    Args:
+        url: URL relative to the API URL, such as ``/experiments/{uuid}``.
+
+    Returns:
+        ``experiments``, ``analysis_results``, ``plots`` or ``files``, or ``None``
+        if the URL belongs to none of them.
+    """
+    for family, pattern in _FAMILY_PATTERNS:
+        if pattern.match(url):
+            return family
+    return None
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker of an endpoint family.
+
+    The breaker is closed while requests succeed. After `failure_threshold`
+    consecutive failures, meaning server errors, throttling and connection
+    errors that persisted through the retries, it opens and requests fail
+    immediately with :class:`~qiskit_ibm_experiment.exceptions.CircuitOpenError`.
+    After `recovery_timeout` seconds, it becomes half-open and lets one request
+    through: the breaker closes if it succeeds, and opens again otherwise.
+    """
+
+    def __init__(
+        self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0
+    ) -> None:
+        """CircuitBreaker constructor.
+
+        Args:
+            name: Name of the endpoint family.
+            failure_threshold: Number of consecutive failures opening the breaker.
+            recovery_timeout: Number of seconds the breaker stays open.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started = None  # type: Optional[float]
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the state of the breaker."""
+        with self._lock:
+            if (
+                self._state is CircuitState.OPEN
+                and time.monotonic() - self._opened_at >= self.recovery_timeout
+            ):
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    def before_request(self) -> None:
+        """Check that a request can be sent.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with its
+                trial request in progress.
+        """
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                return
+            now = time.monotonic()
+            remaining = self.recovery_timeout - (now - self._opened_at)
+            # A trial request whose outcome was never recorded is given up on
+            # after the recovery timeout.
+            if remaining <= 0 and (
+                self._probe_started is None
+                or now - self._probe_started >= self.recovery_timeout
+            ):
+                self._state = CircuitState.HALF_OPEN
+                self._probe_started = now
+                return
+        raise CircuitOpenError(
+            f"The {self.name} endpoints are unavailable after repeated failures. "
+            f"Requests fail without being sent for another "
+            f"{max(remaining, 0):.1f} seconds.",
+            self.name,
+        )
+
+    def record_success(self) -> None:
+        """Record a request the server handled, closing the breaker."""
+        with self._lock:
+            if self._state is not CircuitState.CLOSED:
+                logger.info("Closing the %s circuit breaker.", self.name)
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._probe_started = None
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the breaker if needed."""
+        with self._lock:
+            self._failures += 1
+            if (
+                self._state is CircuitState.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                if self._state is not CircuitState.OPEN:
+                    logger.warning(
+                        "Opening the %s circuit breaker after %s failures.",
+                        self.name,
+                        self._failures,
+                    )
+                self._state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
+            self._probe_started = None
+
+    def reset(self) -> None:
+        """Close the breaker."""
+        self.record_success()
+
+
+class CircuitBreakers:
+    """Circuit breakers of the endpoint families, shared by sessions."""
+
+    FAMILIES = ("experiments", "analysis_results", "plots", "files")
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """CircuitBreakers constructor.
+
+        Args:
+            failure_threshold: Number of consecutive failures opening a breaker.
+            recovery_timeout: Number of seconds a breaker stays open.
+        """
+        self._breakers = {
+            family: CircuitBreaker(family, failure_threshold, recovery_timeout)
+            for family in self.FAMILIES
+        }
+
+    def get(self, url: str) -> Optional[CircuitBreaker]:
+        """Return the breaker of an API URL.
+
+        Args:
+            url: URL relative to the API URL.
+
+        Returns:
+            The breaker of the endpoint family of the URL, if any.
+        """
+        family = endpoint_family(url)
+        return self._breakers[family] if family else None
+
+    def __getitem__(self, family: str) -> CircuitBreaker:
+        return self._breakers[family]
+
+    def states(self) -> Dict[str, CircuitState]:
+        """Return the states of the breakers, by endpoint family."""
+        return {family: breaker.state for family, breaker in self._breakers.items()}
+
+    def reset(self) -> None:
+        """Close all the breakers."""
+        for breaker in self._breakers.values():
+            breaker.reset()
+
+
+def is_failure(status_code: int) -> bool:
+    """Return whether a request status indicates the server is unavailable.
+
+    Args:
+        status_code: Response status code, or -1 if there was no response.
+
+    Returns:
+        ``True`` for connection errors, throttling and server errors.
+    """
+    return status_code == -1 or status_code == 429 or status_code >= 500
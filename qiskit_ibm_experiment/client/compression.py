@@ -0,0 +1,93 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Compression of request bodies."""
+
+import gzip
+import importlib
+from typing import Callable, Dict, List, Optional
+
+# Content codings mapped to the modules implementing them, by order of preference.
+_CODEC_MODULES = {
+    "zstd": ["zstandard"],
+    "br": ["brotli", "brotlicffi"],
+    "gzip": [],
+}
+
+
+def _compressor(encoding: str) -> Optional[Callable[[bytes], bytes]]:
+    """Return the function compressing data with an encoding, if available."""
+    if encoding == "gzip":
+        # A fixed modification time makes the output deterministic.
+        return lambda data: gzip.compress(data, compresslevel=6, mtime=0)
+    for module_name in _CODEC_MODULES.get(encoding, []):
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        if encoding == "zstd":
+            return module.ZstdCompressor().compress
+        return module.compress
+    return None
+
+
+_COMPRESSORS = {}  # type: Dict[str, Optional[Callable[[bytes], bytes]]]
+
+
+def available_encodings() -> List[str]:
+    """Return the content codings that request bodies can be compressed with.
+
+    Returns:
+        The available content codings, by order of preference. ``gzip`` is always
+        available, while ``zstd`` and ``br`` require the ``zstandard`` and
+        ``brotli`` packages.
+    """
+    return [encoding for encoding in _CODEC_MODULES if get_compressor(encoding)]
+
+
+def get_compressor(encoding: str) -> Optional[Callable[[bytes], bytes]]:
+    """Return the function compressing data with a content coding.
+
+    Args:
+        encoding: Content coding, such as ``gzip``.
+
+    Returns:
+        The compression function, or ``None`` if the coding is not available.
+    """
+    if encoding not in _COMPRESSORS:
+        _COMPRESSORS[encoding] = _compressor(encoding)
+    return _COMPRESSORS[encoding]
+
+
+def negotiate_encoding(accept_encoding: str, current: str) -> str:
+    """Return the preferred content coding accepted by the server.
+
+    Servers can list the content codings they accept for request bodies in the
+    ``Accept-Encoding`` header of their responses (RFC 7694).
+
+    Args:
+        accept_encoding: Value of the ``Accept-Encoding`` response header.
+        current: Content coding currently used.
+
+    Returns:
+        The preferred available content coding accepted by the server, or
+        `current` if there is none.
+    """
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().lower().partition(";")
+        if params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            accepted.add(coding.strip())
+    for encoding in available_encodings():
+        if encoding in accepted:
+            return encoding
+    return current
@@ -13,9 +13,11 @@
 """Client for accessing IBM Quantum experiment services."""
 
 import logging
-from typing import List, Dict, Optional, Union
-from qiskit_ibm_experiment.client.session import RetrySession
+from typing import List, Dict, Optional, Union, Iterator
+from qiskit_ibm_experiment.client.session import SessionPool, TransferStats
 from .experiment_rest_adapter import ExperimentRestAdapter
+from .circuit_breaker import CircuitState
+from .metrics import RequestMetrics
 
 logger = logging.getLogger(__name__)
 
@@ -26,14 +28,47 @@ class ExperimentClient:
     def __init__(self, access_token, url, additional_params) -> None:
         """ExperimentClient constructor.
 
+        The client can be used from multiple threads, each using its own session.
+
         Args:
             access_token: The session's access token
             url: The session's base url
             additional_params: additional session parameters
         """
-        self._session = RetrySession(url, access_token, **additional_params)
+        params = dict(additional_params)
+        if params.pop("collect_metrics", False):
+            params["metrics"] = RequestMetrics(ExperimentRestAdapter.URL_MAP.values())
+        self._session = SessionPool(url, access_token, **params)
         self.api = ExperimentRestAdapter(self._session)
 
+    def close(self) -> None:
+        """Close the sessions of the client."""
+        self._session.close()
+
+    def circuit_states(self) -> Dict[str, CircuitState]:
+        """Return the states of the circuit breakers, by endpoint family."""
+        breakers = self._session.circuit_breakers
+        return breakers.states() if breakers is not None else {}
+
+    def metrics(self) -> Optional[RequestMetrics]:
+        """Return the collector of the request metrics, if enabled."""
+        return self._session.metrics
+
+    def transfer_stats(self, reset: bool = False) -> TransferStats:
+        """Return the number of requests and bytes transferred by the client.
+
+        Args:
+            reset: Whether to reset the counts afterwards.
+
+        Returns:
+            The transfer counts of the sessions of all threads.
+        """
+        counter = self._session.transfer_counter
+        stats = counter.stats()
+        if reset:
+            counter.reset()
+        return stats
+
     def devices(self) -> Dict:
         """Return the device list from the experiment DB."""
         return self.api.devices()["devices"]
@@ -56,7 +91,10 @@ class ExperimentClient:
         mine_only: Optional[bool] = False,
         parent_id: Optional[str] = None,
         sort_by: Optional[str] = None,
-    ) -> str:
+        page_size: Optional[int] = None,
+        updated_at: Optional[List] = None,
+        stream: bool = False,
+    ) -> Union[str, Iterator[bytes]]:
         """Retrieve experiments, with optional filtering.
 
         Args:
@@ -76,10 +114,16 @@ class ExperimentClient:
             mine_only: Whether or not to only return experiments where I am the owner.
             parent_id: Filter by parent experiment ID.
             sort_by: Sorting order.
+            page_size: Maximum number of experiments to retrieve in this request.
+            updated_at: A list of timestamps used to filter by last update time.
+            stream: Whether to return the response body as it is downloaded.
 
         Returns:
-            A list of experiments and the marker, if applicable.
+            A list of experiments and the marker, if applicable. If `stream` is
+            ``True``, an iterator of the response body chunks.
         """
+        if page_size is not None:
+            limit = page_size if limit is None else min(limit, page_size)
         resp = self.api.experiments(
             limit=limit,
             marker=marker,
@@ -97,6 +141,8 @@ class ExperimentClient:
             mine_only=mine_only,
             parent_id=parent_id,
             sort_by=sort_by,
+            updated_at=updated_at,
+            stream=stream,
         )
         return resp
 
@@ -235,7 +281,10 @@ class ExperimentClient:
         tags: Optional[List[str]] = None,
         created_at: Optional[List] = None,
         sort_by: Optional[str] = None,
-    ) -> str:
+        page_size: Optional[int] = None,
+        updated_at: Optional[List] = None,
+        stream: bool = False,
+    ) -> Union[str, Iterator[bytes]]:
         """Return a list of analysis results.
 
         Args:
@@ -250,10 +299,16 @@ class ExperimentClient:
             tags: Filter by tags assigned to analysis results.
             created_at: A list of timestamps used to filter by creation time.
             sort_by: Indicates how the output should be sorted.
+            page_size: Maximum number of analysis results to retrieve in this request.
+            updated_at: A list of timestamps used to filter by last update time.
+            stream: Whether to return the response body as it is downloaded.
 
         Returns:
-            A list of analysis results and the marker, if applicable.
+            A list of analysis results and the marker, if applicable. If `stream`
+            is ``True``, an iterator of the response body chunks.
         """
+        if page_size is not None:
+            limit = page_size if limit is None else min(limit, page_size)
         resp = self.api.analysis_results(
             limit=limit,
             marker=marker,
@@ -266,6 +321,8 @@ class ExperimentClient:
             tags=tags,
             created_at=created_at,
             sort_by=sort_by,
+            updated_at=updated_at,
+            stream=stream,
         )
         return resp
 
@@ -280,6 +337,17 @@ class ExperimentClient:
         """
         return self.api.analysis_result_create(result)
 
+    def analysis_results_bulk_create(self, results: str) -> Dict:
+        """Upload analysis results with one request.
+
+        Args:
+            results: JSON list of the analysis results to upload.
+
+        Returns:
+            Created analysis results or errors, in the order of `results`.
+        """
+        return self.api.analysis_results_bulk_create(results)
+
     def analysis_result_update(self, result_id: str, new_data: str) -> Dict:
         """Update an analysis result.
 
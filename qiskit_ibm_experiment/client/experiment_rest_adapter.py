@@ -13,8 +13,10 @@
 """Experiment REST adapter."""
 
 import logging
-from typing import Dict, List, Any, Union, Optional
-from qiskit_ibm_experiment.client.session import RetrySession
+from typing import Dict, List, Any, Union, Optional, Iterator
+from requests import Response, RequestException
+from qiskit_ibm_experiment.client.session import RetrySession, SessionPool, _wire_size
+from ..exceptions import RequestsApiError
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +30,7 @@ class ExperimentRestAdapter:
         "experiment": "/experiments/{uuid}",
         "experiments": "/experiments",
         "analysis_results": "/analysis_results",
+        "analysis_results_bulk": "/analysis_results/bulk",
         "analysis_result": "/analysis_results/{uuid}",
         "plots": "/experiments/{uuid}/plots",
         "plot": "/experiments/{uuid}/plots/{name}",
@@ -37,9 +40,12 @@ class ExperimentRestAdapter:
     }
 
     _HEADER_JSON_CONTENT = {"Content-Type": "application/json"}
+    _STREAM_CHUNK_SIZE = 64 * 1024
     _DEFAULT_URL_BASE = "https://api.quantum-computing.ibm.com/resultsdb"
 
-    def __init__(self, session: RetrySession, prefix_url: str = "") -> None:
+    def __init__(
+        self, session: Union[RetrySession, SessionPool], prefix_url: str = ""
+    ) -> None:
         """ExperimentRestAdapter constructor.
 
         Args:
@@ -71,7 +77,7 @@ class ExperimentRestAdapter:
         url = self.get_url("experiment")
         url = url.format(uuid=experiment_id)
         # to enable custom JSON decoding request text, not json
-        return self.session.get(url).text
+        return self.session.get(url, cache=True).text
 
     def experiments(
         self,
@@ -91,7 +97,9 @@ class ExperimentRestAdapter:
         mine_only: Optional[bool] = False,
         parent_id: Optional[str] = None,
         sort_by: Optional[str] = None,
-    ) -> str:
+        updated_at: Optional[List] = None,
+        stream: bool = False,
+    ) -> Union[str, Iterator[bytes]]:
         """Return experiment data.
 
         Args:
@@ -111,46 +119,32 @@ class ExperimentRestAdapter:
             mine_only: Whether or not to only return experiments where I am the owner.
             parent_id: Filter by parent experiment ID.
             sort_by: Sorting order.
+            updated_at: A list of timestamps used to filter by last update time.
+            stream: Whether to return the response body as it is downloaded.
 
         Returns:
-            Response text.
+            Response text, or an iterator of response body chunks if `stream` is ``True``.
         """
-        url = self.get_url("experiments")
-        params = {}  # type: Dict[str, Any]
-        if backend_name:
-            params["device_name"] = backend_name
-        if experiment_type:
-            params["type"] = experiment_type
-        if start_time:
-            params["start_time"] = start_time
-        if device_components:
-            params["device_components"] = device_components
-        if tags:
-            params["tags"] = tags
-        if limit:
-            params["limit"] = limit
-        if marker:
-            params["marker"] = marker
-        if hub:
-            params["hub_id"] = hub
-        if group:
-            params["group_id"] = group
-        if project:
-            params["project_id"] = project
-        if parent_id:
-            params["parent_experiment_uuid"] = parent_id
-        if exclude_public:
-            params["visibility"] = "!public"
-        elif public_only:
-            params["visibility"] = "public"
-        if exclude_mine:
-            params["owner"] = "!me"
-        elif mine_only:
-            params["owner"] = "me"
-        if sort_by:
-            params["sort"] = sort_by
-
-        return self.session.get(url, params=params).text
+        params = experiments_params(
+            limit=limit,
+            marker=marker,
+            backend_name=backend_name,
+            experiment_type=experiment_type,
+            start_time=start_time,
+            device_components=device_components,
+            tags=tags,
+            hub=hub,
+            group=group,
+            project=project,
+            exclude_public=exclude_public,
+            public_only=public_only,
+            exclude_mine=exclude_mine,
+            mine_only=mine_only,
+            parent_id=parent_id,
+            sort_by=sort_by,
+            updated_at=updated_at,
+        )
+        return self._get_list(self.get_url("experiments"), params, stream)
 
     def analysis_results(
         self,
@@ -165,7 +159,9 @@ class ExperimentRestAdapter:
         tags: Optional[List[str]] = None,
         created_at: Optional[List] = None,
         sort_by: Optional[str] = None,
-    ) -> str:
+        updated_at: Optional[List] = None,
+        stream: bool = False,
+    ) -> Union[str, Iterator[bytes]]:
         """Return all analysis results.
 
         Args:
@@ -180,35 +176,77 @@ class ExperimentRestAdapter:
             tags: Filter by tags assigned to analysis results.
             created_at: A list of timestamps used to filter by creation time.
             sort_by: Indicates how the output should be sorted.
+            updated_at: A list of timestamps used to filter by last update time.
+            stream: Whether to return the response body as it is downloaded.
 
         Returns:
-            Server response.
+            Server response, or an iterator of response body chunks if `stream`
+            is ``True``.
         """
-        url = self.get_url("analysis_results")
-        params = {}  # type: Dict[str, Any]
-        if backend_name:
-            params["device_name"] = backend_name
-        if device_components:
-            params["device_components"] = device_components
-        if experiment_uuid:
-            params["experiment_uuid"] = experiment_uuid
-        if quality:
-            params["quality"] = quality
-        if result_type:
-            params["type"] = result_type
-        if limit:
-            params["limit"] = limit
-        if marker:
-            params["marker"] = marker
-        if verified is not None:
-            params["verified"] = "true" if verified else "false"
-        if tags:
-            params["tags"] = tags
-        if created_at:
-            params["created_at"] = created_at
-        if sort_by:
-            params["sort"] = sort_by
-        return self.session.get(url, params=params).text
+        params = analysis_results_params(
+            limit=limit,
+            marker=marker,
+            backend_name=backend_name,
+            device_components=device_components,
+            experiment_uuid=experiment_uuid,
+            result_type=result_type,
+            quality=quality,
+            verified=verified,
+            tags=tags,
+            created_at=created_at,
+            sort_by=sort_by,
+            updated_at=updated_at,
+        )
+        return self._get_list(self.get_url("analysis_results"), params, stream)
+
+    def _get_list(
+        self, url: str, params: Dict[str, Any], stream: bool
+    ) -> Union[str, Iterator[bytes]]:
+        """Send a list request, optionally streaming the response body.
+
+        Args:
+            url: Request URL.
+            params: Request parameters.
+            stream: Whether to return the response body as it is downloaded.
+
+        Returns:
+            Response text, or an iterator of response body chunks if `stream` is ``True``.
+        """
+        if not stream:
+            return self.session.get(url, params=params).text
+        return self._iter_content(
+            self.session.get(url, params=params, stream=True), url
+        )
+
+    def _iter_content(self, response: Response, url: str) -> Iterator[bytes]:
+        """Yield the body of a streamed response.
+
+        Args:
+            response: Streamed response.
+            url: URL of the request.
+
+        Yields:
+            Chunks of the response body.
+
+        Raises:
+            RequestsApiError: If the download of the response body failed.
+        """
+        body_size = 0
+        try:
+            for chunk in response.iter_content(self._STREAM_CHUNK_SIZE):
+                body_size += len(chunk)
+                yield chunk
+        except RequestException as ex:
+            raise RequestsApiError(f"Failed to read the response body: {ex}") from ex
+        finally:
+            received = _wire_size(response, body_size)
+            self.session.transfer_counter.add(
+                received=received, body_received=body_size
+            )
+            metrics = self.session.metrics
+            if metrics is not None:
+                metrics.add_bytes_received(metrics.endpoint(url), "GET", received)
+            response.close()
 
     def analysis_result(self, result_id: str) -> str:
         """Return an analysis result.
@@ -221,7 +259,7 @@ class ExperimentRestAdapter:
         """
         url = self.get_url("analysis_result")
         url = url.format(uuid=result_id)
-        return self.session.get(url).text
+        return self.session.get(url, cache=True).text
 
     def experiment_upload(self, experiment: str) -> Dict:
         """Upload an experiment.
@@ -281,6 +319,21 @@ class ExperimentRestAdapter:
             url, data=result, headers=self._HEADER_JSON_CONTENT
         ).json()
 
+    def analysis_results_bulk_create(self, results: str) -> Dict:
+        """Create analysis results with one request to the batch endpoint.
+
+        Args:
+            results: JSON list of the analysis results to upload.
+
+        Returns:
+            JSON response, whose ``analysis_results`` list holds the created
+            analysis result or an ``error`` object for each uploaded result.
+        """
+        url = self.get_url("analysis_results_bulk")
+        return self.session.post(
+            url, data=results, headers=self._HEADER_JSON_CONTENT
+        ).json()
+
     def analysis_result_update(self, result_id: str, new_data: str) -> Dict:
         """Update the analysis result.
 
@@ -386,7 +439,7 @@ class ExperimentRestAdapter:
         """
         url = self.get_url("plot")
         url = url.format(uuid=experiment_id, name=plot_name)
-        response = self.session.get(url)
+        response = self.session.get(url, cache=True)
         return response.content
 
     def delete_plot(self, experiment_id: str, plot_name: str) -> None:
@@ -459,3 +512,110 @@ class ExperimentRestAdapter:
         if result.status_code == 200:
             return result.json()
         return result
+
+
+def experiments_params(
+    limit: Optional[int],
+    marker: Optional[str],
+    backend_name: Optional[str] = None,
+    experiment_type: Optional[str] = None,
+    start_time: Optional[List] = None,
+    device_components: Optional[List[str]] = None,
+    tags: Optional[List[str]] = None,
+    hub: Optional[str] = None,
+    group: Optional[str] = None,
+    project: Optional[str] = None,
+    exclude_public: Optional[bool] = False,
+    public_only: Optional[bool] = False,
+    exclude_mine: Optional[bool] = False,
+    mine_only: Optional[bool] = False,
+    parent_id: Optional[str] = None,
+    sort_by: Optional[str] = None,
+    updated_at: Optional[List] = None,
+) -> Dict[str, Any]:
+    """Return the query parameters of an experiments request.
+
+    See :meth:`ExperimentRestAdapter.experiments` for the arguments.
+    """
+    params = {}  # type: Dict[str, Any]
+    if backend_name:
+        params["device_name"] = backend_name
+    if experiment_type:
+        params["type"] = experiment_type
+    if start_time:
+        params["start_time"] = start_time
+    if updated_at:
+        params["updated_at"] = updated_at
+    if device_components:
+        params["device_components"] = device_components
+    if tags:
+        params["tags"] = tags
+    if limit:
+        params["limit"] = limit
+    if marker:
+        params["marker"] = marker
+    if hub:
+        params["hub_id"] = hub
+    if group:
+        params["group_id"] = group
+    if project:
+        params["project_id"] = project
+    if parent_id:
+        params["parent_experiment_uuid"] = parent_id
+    if exclude_public:
+        params["visibility"] = "!public"
+    elif public_only:
+        params["visibility"] = "public"
+    if exclude_mine:
+        params["owner"] = "!me"
+    elif mine_only:
+        params["owner"] = "me"
+    if sort_by:
+        params["sort"] = sort_by
+    return params
+
+
+def analysis_results_params(
+    limit: Optional[int],
+    marker: Optional[str],
+    backend_name: Optional[str] = None,
+    device_components: Optional[Union[str, List[str]]] = None,
+    experiment_uuid: Optional[str] = None,
+    result_type: Optional[str] = None,
+    quality: Optional[List[str]] = None,
+    verified: Optional[bool] = None,
+    tags: Optional[List[str]] = None,
+    created_at: Optional[List] = None,
+    sort_by: Optional[str] = None,
+    updated_at: Optional[List] = None,
+) -> Dict[str, Any]:
+    """Return the query parameters of an analysis results request.
+
+    See :meth:`ExperimentRestAdapter.analysis_results` for the arguments.
+    """
+    params = {}  # type: Dict[str, Any]
+    if backend_name:
+        params["device_name"] = backend_name
+    if device_components:
+        params["device_components"] = device_components
+    if experiment_uuid:
+        params["experiment_uuid"] = experiment_uuid
+    if quality:
+        params["quality"] = quality
+    if result_type:
+        params["type"] = result_type
+    if limit:
+        params["limit"] = limit
+    if marker:
+        params["marker"] = marker
+    if verified is not None:
+        params["verified"] = "true" if verified else "false"
+    if tags:
+        params["tags"] = tags
+    if created_at:
+        params["created_at"] = created_at
+    if updated_at:
+        params["updated_at"] = updated_at
+    if sort_by:
+        params["sort"] = sort_by
+    return params
@@ -0,0 +1,274 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Cache of HTTP responses revalidated with conditional requests."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CachedResponse = namedtuple(
+    "CachedResponse", ["etag", "last_modified", "content_type", "content"]
+)
+"""Body of a response and the validators used to revalidate it."""
+
+HttpCacheInfo = namedtuple(
+    "HttpCacheInfo",
+    ["hits", "misses", "memory_size", "max_memory_size", "disk_size", "max_disk_size"],
+)
+"""Statistics of an :class:`HttpCache`. Sizes are in bytes."""
+
+
+class HttpCache:
+    """Bounded cache of response bodies and their ``ETag`` and ``Last-Modified``.
+
+    Cached responses are not served as is: the request is sent with the
+    ``If-None-Match`` and ``If-Modified-Since`` headers, and the cached body is
+    used if the server responds with ``304 Not Modified``. The cache therefore
+    saves the download of unchanged bodies, never returning stale data.
+
+    Entries are kept in memory, up to ``max_memory_size`` bytes, and optionally
+    on disk, up to ``max_disk_size`` bytes. The least recently used entries are
+    evicted first.
+    """
+
+    def __init__(
+        self,
+        max_memory_size: int = 16 * 1024 * 1024,
+        directory: Optional[str] = None,
+        max_disk_size: int = 256 * 1024 * 1024,
+    ) -> None:
+        """HttpCache constructor.
+
+        Args:
+            max_memory_size: Maximum size of the bodies kept in memory, in bytes.
+            directory: Directory the entries are also stored in, so that they
+                are kept across processes. ``None`` disables the disk cache.
+            max_disk_size: Maximum size of the files in `directory`, in bytes.
+        """
+        self.max_memory_size = max_memory_size
+        self.directory = directory
+        self.max_disk_size = max_disk_size if directory else 0
+        self._memory = OrderedDict()  # type: OrderedDict
+        self._memory_size = 0
+        self._disk = OrderedDict()  # type: OrderedDict
+        self._disk_size = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._load_disk_index()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached response for a URL.
+
+        Args:
+            key: Request URL, including the query string.
+
+        Returns:
+            The cached response, or ``None`` if the URL is not cached.
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+            if key not in self._disk:
+                return None
+            self._disk.move_to_end(key)
+        entry = self._read_file(key)
+        if entry is not None:
+            with self._lock:
+                self._store_memory(key, entry)
+        return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        """Store a response.
+
+        Args:
+            key: Request URL, including the query string.
+            entry: The response body and validators.
+        """
+        with self._lock:
+            self._store_memory(key, entry)
+        if self.max_disk_size and len(entry.content) <= self.max_disk_size:
+            self._write_file(key, entry)
+
+    def invalidate(self, key: str) -> None:
+        """Remove the response of a URL.
+
+        Args:
+            key: Request URL, including the query string.
+        """
+        with self._lock:
+            entry = self._memory.pop(key, None)
+            if entry is not None:
+                self._memory_size -= len(entry.content)
+            on_disk = key in self._disk
+        if on_disk:
+            self._remove_file(key)
+
+    def record(self, hit: bool) -> None:
+        """Count a revalidation.
+
+        Args:
+            hit: Whether the server responded that the cached body is current.
+        """
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def clear(self) -> None:
+        """Remove all the entries, including the ones on disk."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+            keys = list(self._disk)
+        for key in keys:
+            self._remove_file(key)
+
+    def info(self) -> HttpCacheInfo:
+        """Return the cache statistics."""
+        with self._lock:
+            return HttpCacheInfo(
+                self._hits,
+                self._misses,
+                self._memory_size,
+                self.max_memory_size,
+                self._disk_size,
+                self.max_disk_size,
+            )
+
+    def _store_memory(self, key: str, entry: CachedResponse) -> None:
+        """Store an entry in memory, evicting entries if needed. Requires the lock."""
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_size -= len(previous.content)
+        if len(entry.content) > self.max_memory_size:
+            return
+        self._memory[key] = entry
+        self._memory_size += len(entry.content)
+        while self._memory_size > self.max_memory_size:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= len(evicted.content)
+
+    def _path(self, key: str) -> str:
+        """Return the path of the file of an entry."""
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + ".cache")
+
+    def _load_disk_index(self) -> None:
+        """Index the entries already on disk, oldest first."""
+        files = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".cache"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path, "rb") as file:
+                    key = json.loads(file.readline())["key"]
+                stat = os.stat(path)
+            except (OSError, ValueError, KeyError):
+                continue
+            files.append((stat.st_mtime, key, stat.st_size))
+        for _, key, size in sorted(files):
+            self._disk[key] = size
+            self._disk_size += size
+
+    def _read_file(self, key: str) -> Optional[CachedResponse]:
+        """Read an entry from disk."""
+        try:
+            with open(self._path(key), "rb") as file:
+                header = json.loads(file.readline())
+                content = file.read()
+        except (OSError, ValueError) as ex:
+            logger.debug("Unable to read the cached response of %s: %s", key, ex)
+            with self._lock:
+                self._disk_size -= self._disk.pop(key, 0)
+            return None
+        if header.get("key") != key:
+            return None
+        return CachedResponse(
+            header["etag"], header["last_modified"], header["content_type"], content
+        )
+
+    def _write_file(self, key: str, entry: CachedResponse) -> None:
+        """Write an entry to disk, evicting entries if needed."""
+        header = json.dumps(
+            {
+                "key": key,
+                "etag": entry.etag,
+                "last_modified": entry.last_modified,
+                "content_type": entry.content_type,
+            }
+        ).encode("utf-8")
+        try:
+            # Write to a temporary file first, so that readers never see partial files.
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as file:
+                file.write(header + b"\n")
+                file.write(entry.content)
+            size = os.path.getsize(temp_path)
+            os.replace(temp_path, self._path(key))
+        except OSError as ex:
+            logger.debug("Unable to cache the response of %s: %s", key, ex)
+            return
+        evicted = []  # type: list
+        with self._lock:
+            self._disk_size += size - self._disk.pop(key, 0)
+            self._disk[key] = size
+            while self._disk_size > self.max_disk_size and len(self._disk) > 1:
+                old_key, old_size = self._disk.popitem(last=False)
+                self._disk_size -= old_size
+                evicted.append(old_key)
+        for old_key in evicted:
+            self._unlink(old_key)
+
+    def _remove_file(self, key: str) -> None:
+        """Remove an entry from disk."""
+        with self._lock:
+            self._disk_size -= self._disk.pop(key, 0)
+        self._unlink(key)
+
+    def _unlink(self, key: str) -> None:
+        """Delete the file of an entry, if it exists."""
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+
+def conditional_headers(entry: CachedResponse) -> Dict[str, str]:
+    """Return the headers revalidating a cached response.
+
+    Args:
+        entry: Cached response.
+
+    Returns:
+        The ``If-None-Match`` and ``If-Modified-Since`` headers.
+    """
+    headers = {}
+    if entry.etag:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+    return headers
@@ -0,0 +1,237 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Metrics of the requests sent to the API."""
+
+import re
+import threading
+from collections import namedtuple
+from typing import Dict, Iterable, List, Optional, Tuple
+
+EndpointMetrics = namedtuple(
+    "EndpointMetrics",
+    [
+        "requests",
+        "errors",
+        "retries",
+        "bytes_sent",
+        "bytes_received",
+        "latency_sum",
+        "latency_buckets",
+    ],
+)
+"""Metrics of the requests to an endpoint.
+
+``latency_buckets`` is a tuple of ``(upper_bound, count)`` pairs, where ``count``
+is the number of requests that took at most ``upper_bound`` seconds.
+"""
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Default upper bounds of the latency histogram buckets, in seconds."""
+
+EXTERNAL_ENDPOINT = "external"
+"""Endpoint label of the requests to other hosts, such as the object storage."""
+
+OTHER_ENDPOINT = "other"
+"""Endpoint label of the API requests matching no known endpoint."""
+
+_METRIC_PREFIX = "qiskit_ibm_experiment"
+
+
+class RequestMetrics:
+    """Thread-safe collector of request metrics, labeled by endpoint and method.
+
+    The endpoint label of a request is the template of its URL, such as
+    ``/experiments/{uuid}``, so that the requests to different entries are
+    aggregated.
+    """
+
+    def __init__(
+        self, templates: Iterable[str], buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> None:
+        """RequestMetrics constructor.
+
+        Args:
+            templates: URL templates of the API endpoints, relative to the API
+                URL, with their parameters in braces.
+            buckets: Upper bounds of the latency histogram buckets, in seconds.
+        """
+        # Longer templates are matched first, so that the most specific one wins.
+        self._patterns = [
+            (template, _template_pattern(template))
+            for template in sorted(set(templates), key=len, reverse=True)
+        ]
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._series = {}  # type: Dict[Tuple[str, str], List]
+
+    def endpoint(self, url: Optional[str]) -> str:
+        """Return the endpoint label of a URL.
+
+        Args:
+            url: URL relative to the API URL, or ``None`` for other hosts.
+
+        Returns:
+            The URL template of the endpoint.
+        """
+        if url is None:
+            return EXTERNAL_ENDPOINT
+        path = url.split("?", 1)[0]
+        for template, pattern in self._patterns:
+            if pattern.fullmatch(path):
+                return template
+        return OTHER_ENDPOINT
+
+    def record(
+        self,
+        endpoint: str,
+        method: str,
+        latency: float,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+        retries: int = 0,
+        error: bool = False,
+    ) -> None:
+        """Record a request.
+
+        Args:
+            endpoint: Endpoint label, as returned by :meth:`endpoint`.
+            method: Request method.
+            latency: Duration of the request, including its retries, in seconds.
+            bytes_sent: Number of request body bytes sent.
+            bytes_received: Number of response body bytes received.
+            retries: Number of retries of the request.
+            error: Whether the request failed.
+        """
+        bucket = len(self.buckets)
+        for index, upper_bound in enumerate(self.buckets):
+            if latency <= upper_bound:
+                bucket = index
+                break
+        with self._lock:
+            series = self._series_for(endpoint, method)
+            series[0] += 1
+            series[1] += error
+            series[2] += retries
+            series[3] += bytes_sent
+            series[4] += bytes_received
+            series[5] += latency
+            series[6][bucket] += 1
+
+    def add_bytes_received(self, endpoint: str, method: str, count: int) -> None:
+        """Count response bytes read after the request was recorded.
+
+        Args:
+            endpoint: Endpoint label.
+            method: Request method.
+            count: Number of bytes.
+        """
+        with self._lock:
+            self._series_for(endpoint, method)[4] += count
+
+    def _series_for(self, endpoint: str, method: str) -> List:
+        """Return the counters of an endpoint, creating them if needed."""
+        key = (endpoint, method.upper())
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = [
+                0,
+                0,
+                0,
+                0,
+                0,
+                0.0,
+                [0] * (len(self.buckets) + 1),
+            ]
+        return series
+
+    def snapshot(self) -> Dict[Tuple[str, str], EndpointMetrics]:
+        """Return the metrics collected so far.
+
+        Returns:
+            The metrics of each ``(endpoint, method)`` pair.
+        """
+        with self._lock:
+            items = [
+                (key, series[:6] + [list(series[6])])
+                for key, series in self._series.items()
+            ]
+        result = {}
+        for key, series in items:
+            cumulative = 0
+            buckets = []
+            for upper_bound, count in zip(self.buckets + (float("inf"),), series[6]):
+                cumulative += count
+                buckets.append((upper_bound, cumulative))
+            result[key] = EndpointMetrics(*series[:6], tuple(buckets))
+        return result
+
+    def reset(self) -> None:
+        """Discard the metrics collected so far."""
+        with self._lock:
+            self._series.clear()
+
+    def to_prometheus(self) -> str:
+        """Return the metrics in the Prometheus text exposition format.
+
+        Returns:
+            The metrics, one sample per line.
+        """
+        snapshot = sorted(self.snapshot().items())
+        counters = [
+            ("requests_total", "requests", "Number of requests."),
+            ("request_errors_total", "errors", "Number of failed requests."),
+            ("request_retries_total", "retries", "Number of request retries."),
+            ("request_bytes_sent_total", "bytes_sent", "Request body bytes sent."),
+            (
+                "response_bytes_received_total",
+                "bytes_received",
+                "Response body bytes received.",
+            ),
+        ]
+        lines = []
+        for name, field, help_text in counters:
+            lines.append(f"# HELP {_METRIC_PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {_METRIC_PREFIX}_{name} counter")
+            for (endpoint, method), metrics in snapshot:
+                labels = _labels(endpoint, method)
+                lines.append(
+                    f"{_METRIC_PREFIX}_{name}{{{labels}}} {getattr(metrics, field)}"
+                )
+        name = f"{_METRIC_PREFIX}_request_duration_seconds"
+        lines.append(f"# HELP {name} Duration of the requests, including retries.")
+        lines.append(f"# TYPE {name} histogram")
+        for (endpoint, method), metrics in snapshot:
+            labels = _labels(endpoint, method)
+            for upper_bound, count in metrics.latency_buckets:
+                bound = "+Inf" if upper_bound == float("inf") else repr(upper_bound)
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f"{name}_sum{{{labels}}} {metrics.latency_sum!r}")
+            lines.append(f"{name}_count{{{labels}}} {metrics.requests}")
+        return "\n".join(lines) + "\n"
+
+
+def _template_pattern(template: str) -> "re.Pattern":
+    """Return the regular expression matching the URLs of a template."""
+    pattern = ""
+    for literal, parameter in re.findall(r"([^{]*)(?:\{(\w+)\})?", template):
+        pattern += re.escape(literal)
+        if parameter:
+            # File paths can contain slashes, unlike the other parameters.
+            pattern += ".+" if parameter == "path" else "[^/]+"
+    return re.compile(pattern)
+
+
+def _labels(endpoint: str, method: str) -> str:
+    """Return the Prometheus labels of an endpoint."""
+    endpoint = endpoint.replace("\\", "\\\\").replace('"', '\\"')
+    return f'endpoint="{endpoint}",method="{method}"'
@@ -13,21 +13,40 @@
 """Session customized for IBM Quantum access."""
 
 import os
+import random
 import re
+import time
 import copy
+import functools
 import logging
-from typing import List, Dict, Optional, Any, Tuple, Union
-import pkg_resources
-
-from requests import Session, RequestException, Response
+import threading
+import weakref
+from collections import deque, namedtuple
+from itertools import takewhile
+from typing import List, Dict, Optional, Any, Tuple, Union, Callable, TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from requests import Session, RequestException, Response, PreparedRequest
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
 from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.exceptions import MaxRetryError, ResponseError
 from urllib3.util.retry import Retry
 
 from ..exceptions import RequestsApiError
-from ..version import __version__ as ibm_experiment_version
+from .compression import get_compressor, negotiate_encoding, available_encodings
+from .http_cache import HttpCache, CachedResponse, conditional_headers
+from .circuit_breaker import CircuitBreakers, is_failure
+from .metrics import RequestMetrics
+from .tracing import get_tracer
+
+if TYPE_CHECKING:
+    from .token_manager import TokenManager
 
 STATUS_FORCELIST = (
+    429,  # Too Many Requests
     500,  # General server error
     502,  # Bad Gateway
     503,  # Service Unavailable
@@ -46,25 +65,163 @@ logger.setLevel("INFO")
 RE_DEVICES_ENDPOINT = re.compile(r"^(.*/devices/)([^/}]{2,})(.*)$", re.IGNORECASE)
 
 
-def _get_client_header() -> str:
-    """Return the client version."""
+def _distribution_version(name: str) -> str:
+    """Return the version of an installed distribution."""
+    # pylint: disable=import-outside-toplevel
     try:
-        client_header = "qiskit/" + pkg_resources.get_distribution("qiskit").version
+        from importlib.metadata import version
+    except ImportError:  # Python 3.7
+        import pkg_resources
+
+        return pkg_resources.get_distribution(name).version
+    return version(name)
+
+
+@functools.lru_cache(maxsize=None)
+def client_application() -> str:
+    """Return the client version, sent in the ``X-Qx-Client-Application`` header.
+
+    The installed versions are looked up on the first call, rather than on import.
+    """
+    try:
+        client_header = "qiskit/" + _distribution_version("qiskit")
         return client_header
     except Exception:  # pylint: disable=broad-except
         pass
 
+    from ..version import __version__ as ibm_experiment_version
+
     qiskit_pkgs = ["qiskit-terra", "qiskit-aer", "qiskit-ignis", "qiskit-aqua"]
     pkg_versions = {"qiskit-ibm-experiment": ibm_experiment_version}
     for pkg_name in qiskit_pkgs:
         try:
-            pkg_versions[pkg_name] = pkg_resources.get_distribution(pkg_name).version
+            pkg_versions[pkg_name] = _distribution_version(pkg_name)
         except Exception:  # pylint: disable=broad-except
             pass
     return ",".join(pkg_versions.keys()) + "/" + ",".join(pkg_versions.values())
 
 
-CLIENT_APPLICATION = _get_client_header()
+def __getattr__(name: str) -> Any:
+    """Return the module attributes computed on first use."""
+    if name == "CLIENT_APPLICATION":
+        return client_application()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+TransferStats = namedtuple(
+    "TransferStats",
+    [
+        "requests",
+        "bytes_sent",
+        "body_bytes_sent",
+        "bytes_received",
+        "body_bytes_received",
+    ],
+)
+"""Number of requests and of body bytes transferred by a session.
+
+``bytes_sent`` and ``bytes_received`` count the request and response bodies as
+transferred, possibly compressed, while ``body_bytes_sent`` and
+``body_bytes_received`` count them uncompressed.
+"""
+
+
+class TransferCounter:
+    """Thread-safe counter of the bytes transferred by sessions."""
+
+    def __init__(self) -> None:
+        """TransferCounter constructor."""
+        self._lock = threading.Lock()
+        self._counts = [0] * len(TransferStats._fields)
+
+    def add(
+        self,
+        requests: int = 0,
+        sent: int = 0,
+        body_sent: int = 0,
+        received: int = 0,
+        body_received: int = 0,
+    ) -> None:
+        """Add to the counts.
+
+        Args:
+            requests: Number of requests.
+            sent: Number of request body bytes, as transferred.
+            body_sent: Number of request body bytes, before compression.
+            received: Number of response body bytes, as transferred.
+            body_received: Number of response body bytes, after decompression.
+        """
+        with self._lock:
+            for index, value in enumerate(
+                (requests, sent, body_sent, received, body_received)
+            ):
+                self._counts[index] += value
+
+    def stats(self) -> TransferStats:
+        """Return the current counts."""
+        with self._lock:
+            return TransferStats(*self._counts)
+
+    def reset(self) -> None:
+        """Reset the counts to zero."""
+        with self._lock:
+            self._counts = [0] * len(TransferStats._fields)
+
+
+class RetryBudget:
+    """Thread-safe limit on the number of retries, shared by sessions.
+
+    When the server is overloaded, clients retrying every failed request
+    multiply its load. The budget allows, over a sliding window, a number of
+    retries proportional to the number of requests, plus a minimum rate of
+    retries so that clients sending few requests can still retry them. Requests
+    whose retry is refused by the budget fail immediately.
+    """
+
+    WINDOW = 10.0
+    """Duration of the sliding window, in seconds."""
+
+    def __init__(self, ratio: float = 0.2, min_rate: float = 1.0) -> None:
+        """RetryBudget constructor.
+
+        Args:
+            ratio: Maximum number of retries per request.
+            min_rate: Number of retries per second allowed regardless of the
+                number of requests.
+        """
+        self.ratio = ratio
+        self.min_rate = min_rate
+        self._requests = deque()  # type: deque
+        self._retries = deque()  # type: deque
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float) -> None:
+        """Forget the events older than the window. Requires the lock."""
+        for events in (self._requests, self._retries):
+            while events and events[0] < now - self.WINDOW:
+                events.popleft()
+
+    def record_request(self) -> None:
+        """Record a request, adding to the budget."""
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            self._requests.append(now)
+
+    def try_retry(self) -> bool:
+        """Withdraw a retry from the budget.
+
+        Returns:
+            Whether the retry is allowed.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            allowed = self.min_rate * self.WINDOW + self.ratio * len(self._requests)
+            if len(self._retries) >= allowed:
+                return False
+            self._retries.append(now)
+            return True
 
 
 class PostForcelistRetry(Retry):
@@ -74,8 +231,79 @@ class PostForcelistRetry(Retry):
     returned is on the ``STATUS_FORCELIST``. While ``POST``
     requests are recommended not to be retried due to not being idempotent,
     the IBM Quantum API guarantees that retrying on specific 5xx errors is safe.
+
+    The ``Retry-After`` header of ``429`` and ``503`` responses is honored, up to
+    `max_retry_after` seconds. Otherwise, the time waited before a retry is
+    drawn at random between zero and the exponential backoff ("full jitter"),
+    so that clients failing at the same time do not retry at the same time.
+    Retries are also refused when the shared `budget` is exhausted.
     """
 
+    def __init__(  # type: ignore[no-untyped-def]
+        self,
+        *args,
+        full_jitter: bool = True,
+        max_backoff: float = 120.0,
+        max_retry_after: float = 300.0,
+        budget: Optional[RetryBudget] = None,
+        on_retry: Optional[Callable[[], None]] = None,
+        **kwargs,
+    ) -> None:
+        """PostForcelistRetry constructor.
+
+        Args:
+            *args: Positional arguments of ``urllib3.Retry``.
+            full_jitter: Whether to wait a random time up to the backoff.
+            max_backoff: Maximum backoff, in seconds.
+            max_retry_after: Maximum time to wait for the ``Retry-After``
+                header, in seconds.
+            budget: Retry budget, or ``None`` to not limit retries.
+            on_retry: Function called before each retry.
+            **kwargs: Keyword arguments of ``urllib3.Retry``.
+        """
+        super().__init__(*args, **kwargs)
+        self.full_jitter = full_jitter
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.budget = budget
+        self.on_retry = on_retry
+
+    def new(self, **kw: Any) -> "PostForcelistRetry":
+        """Return a copy of the retry, keeping its custom parameters."""
+        kw.setdefault("full_jitter", self.full_jitter)
+        kw.setdefault("max_backoff", self.max_backoff)
+        kw.setdefault("max_retry_after", self.max_retry_after)
+        kw.setdefault("budget", self.budget)
+        kw.setdefault("on_retry", self.on_retry)
+        return super().new(**kw)  # type: ignore[return-value]
+
+    def get_backoff_time(self) -> float:
+        """Return the time to wait before the next retry, in seconds."""
+        consecutive_errors = len(
+            list(
+                takewhile(
+                    lambda item: item.redirect_location is None,
+                    reversed(self.history),
+                )
+            )
+        )
+        if consecutive_errors < 1:
+            return 0
+        backoff = min(
+            self.max_backoff, self.backoff_factor * (2 ** (consecutive_errors - 1))
+        )
+        if self.full_jitter:
+            return random.uniform(0, backoff)
+        # Like ``urllib3``, do not wait before the first retry.
+        return backoff if consecutive_errors > 1 else 0
+
+    def get_retry_after(self, response: Any) -> Optional[float]:
+        """Return the time to wait from the ``Retry-After`` header, if any."""
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.max_retry_after)
+
     def increment(  # type: ignore[no-untyped-def]
         self,
         method=None,
@@ -101,7 +329,7 @@ class PostForcelistRetry(Retry):
                 data,
                 headers,
             )
-        return super().increment(
+        new_retry = super().increment(
             method=method,
             url=url,
             response=response,
@@ -109,6 +337,18 @@ class PostForcelistRetry(Retry):
             _pool=_pool,
             _stacktrace=_stacktrace,
         )
+        if self.budget is not None and not self.budget.try_retry():
+            logger.debug("Retry budget exhausted for method=%s, url=%s", method, url)
+            if error is None:
+                error = ResponseError(
+                    ResponseError.SPECIFIC_ERROR.format(status_code=response.status)
+                    if response is not None and response.status
+                    else ResponseError.GENERIC_ERROR
+                )
+            raise MaxRetryError(_pool, url, error) from error
+        if self.on_retry is not None:
+            self.on_retry()
+        return new_retry
 
     def is_retry(
         self, method: str, status_code: int, has_retry_after: bool = False
@@ -147,6 +387,21 @@ class RetrySession(Session):
         proxies: Optional[Dict[str, str]] = None,
         auth: Optional[AuthBase] = None,
         timeout: Tuple[float, Union[float, None]] = (10.0, None),
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        host_pool_maxsize: Optional[Dict[str, int]] = None,
+        request_compression: Optional[str] = None,
+        compress_min_size: int = 1024,
+        transfer_counter: Optional[TransferCounter] = None,
+        http_cache: Optional[HttpCache] = None,
+        backoff_max: float = 120.0,
+        backoff_jitter: bool = True,
+        retry_after_max: float = 300.0,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        metrics: Optional[RequestMetrics] = None,
+        token_manager: Optional["TokenManager"] = None,
     ) -> None:
         """RetrySession constructor.
 
@@ -161,12 +416,78 @@ class RetrySession(Session):
             auth: Authentication handler.
             timeout: Timeout for the requests, in the form of (connection_timeout,
                 total_timeout).
+            pool_connections: Number of hosts the connection pools are kept for.
+            pool_maxsize: Maximum number of connections kept open to each host.
+                Should be at least the number of threads using the session.
+            pool_block: Whether a request should wait for a free connection when
+                `pool_maxsize` connections to the host are in use, instead of
+                opening a connection that is discarded after the request.
+            host_pool_maxsize: Maximum number of connections kept open to specific
+                hosts, overriding `pool_maxsize`. Hosts are given as URL prefixes,
+                such as ``https://s3.us-east.cloud-object-storage.appdomain.cloud``,
+                or as host names.
+            request_compression: Content coding used to compress the bodies of
+                the requests to the API, either ``gzip``, ``br`` or ``zstd``, or
+                ``None`` to not compress them. If the server lists a preferred
+                available coding in the ``Accept-Encoding`` header of its
+                responses, that coding is used instead. Compression is disabled
+                if the server rejects compressed requests.
+            compress_min_size: Minimum size of the request bodies to compress,
+                in bytes.
+            transfer_counter: Counter of the transferred bytes. A new counter is
+                used if ``None``.
+            http_cache: Cache of the responses to ``GET`` requests of single
+                entries, revalidated with conditional requests. ``None`` disables
+                the cache.
+            backoff_max: Maximum backoff between retry attempts, in seconds.
+            backoff_jitter: Whether to wait a random time between zero and the
+                backoff before retrying, instead of the backoff itself.
+            retry_after_max: Maximum time to wait before retrying when the server
+                responds with a ``Retry-After`` header, in seconds.
+            retry_budget: Limit on the number of retries, which can be shared by
+                several sessions. ``None`` does not limit retries beyond
+                `retries_total`.
+            circuit_breakers: Circuit breakers of the API endpoint families,
+                which can be shared by several sessions. ``None`` disables them.
+            metrics: Collector of the request metrics, which can be shared by
+                several sessions. ``None`` disables the metrics.
+            token_manager: Manager of the access token, which is then refreshed
+                before it expires, and once when the server rejects it.
+                ``None`` uses `access_token` as is.
+
+        Raises:
+            ValueError: If `request_compression` is not an available coding.
         """
         super().__init__()
 
         self.base_url = base_url
         self.access_token = access_token
-        self._initialize_retry(retries_total, retries_connect, backoff_factor)
+        if request_compression is not None and not get_compressor(request_compression):
+            raise ValueError(
+                f"{request_compression} is not an available request compression. "
+                f"Available compressions are {available_encodings()}."
+            )
+        self.request_compression = request_compression
+        self.compress_min_size = compress_min_size
+        self.transfer_counter = transfer_counter or TransferCounter()
+        self.http_cache = http_cache
+        self.retry_budget = retry_budget
+        self.circuit_breakers = circuit_breakers
+        self.metrics = metrics
+        self.token_manager = token_manager
+        self._retries = 0
+        self._initialize_retry(
+            retries_total,
+            retries_connect,
+            backoff_factor,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            host_pool_maxsize=host_pool_maxsize or {},
+            backoff_max=backoff_max,
+            backoff_jitter=backoff_jitter,
+            retry_after_max=retry_after_max,
+        )
         self._initialize_session_parameters(verify, proxies or {}, auth)
         self._timeout = timeout
 
@@ -192,27 +513,78 @@ class RetrySession(Session):
             # ignore errors that may happen during cleanup
             pass
 
+    def _count_retry(self) -> None:
+        """Count a retry of the current request."""
+        self._retries += 1
+
     def _initialize_retry(
-        self, retries_total: int, retries_connect: int, backoff_factor: float
+        self,
+        retries_total: int,
+        retries_connect: int,
+        backoff_factor: float,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        host_pool_maxsize: Optional[Dict[str, int]] = None,
+        backoff_max: float = 120.0,
+        backoff_jitter: bool = True,
+        retry_after_max: float = 300.0,
     ) -> None:
-        """Set the session retry policy.
+        """Set the session retry policy and connection pools.
+
+        The hosts of the API and of other URLs, such as the object storage URLs
+        used to upload files, use separate connection pools, so that requests to
+        one do not discard the connections to the other.
 
         Args:
             retries_total: Number of total retries for the requests.
             retries_connect: Number of connect retries for the requests.
             backoff_factor: Backoff factor between retry attempts.
+            pool_connections: Number of hosts the connection pools are kept for.
+            pool_maxsize: Maximum number of connections kept open to each host.
+            pool_block: Whether to wait for a free connection when the pool is full.
+            host_pool_maxsize: Maximum number of connections kept open to specific
+                hosts, overriding `pool_maxsize`.
+            backoff_max: Maximum backoff between retry attempts.
+            backoff_jitter: Whether to wait a random time up to the backoff.
+            retry_after_max: Maximum time to wait for the ``Retry-After`` header.
         """
         retry = PostForcelistRetry(
             total=retries_total,
             connect=retries_connect,
             backoff_factor=backoff_factor,
             status_forcelist=STATUS_FORCELIST,
+            full_jitter=backoff_jitter,
+            max_backoff=backoff_max,
+            max_retry_after=retry_after_max,
+            budget=self.retry_budget,
+            on_retry=self._count_retry if self.metrics is not None else None,
         )
 
-        retry_adapter = HTTPAdapter(max_retries=retry)
+        def _adapter(maxsize: int) -> HTTPAdapter:
+            return HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=maxsize,
+                max_retries=retry,
+                pool_block=pool_block,
+            )
+
+        retry_adapter = _adapter(pool_maxsize)
         self.mount("http://", retry_adapter)
         self.mount("https://", retry_adapter)
 
+        host_pool_maxsize = {
+            _host_prefix(host) or host: maxsize
+            for host, maxsize in (host_pool_maxsize or {}).items()
+        }
+        api_host = _host_prefix(self.base_url)
+        if api_host:
+            self.mount(
+                api_host, _adapter(host_pool_maxsize.pop(api_host, pool_maxsize))
+            )
+        for host, maxsize in host_pool_maxsize.items():
+            self.mount(host, _adapter(maxsize))
+
     def _initialize_session_parameters(
         self, verify: bool, proxies: Dict[str, str], auth: Optional[AuthBase] = None
     ) -> None:
@@ -223,21 +595,32 @@ class RetrySession(Session):
             proxies: Proxy URLs mapped by protocol.
             auth: Authentication handler.
         """
-        client_app_header = CLIENT_APPLICATION
+        client_app_header = client_application()
 
         # Append custom header to the end if specified
         custom_header = os.getenv(CUSTOM_HEADER_ENV_VAR)
         if custom_header:
             client_app_header += "/" + custom_header
 
-        self.headers.update({"X-Qx-Client-Application": client_app_header})
+        self.headers.update(
+            {
+                "X-Qx-Client-Application": client_app_header,
+                # Responses are decompressed as they are read.
+                "Accept-Encoding": ACCEPT_ENCODING,
+            }
+        )
 
         self.auth = auth
         self.proxies = proxies or {}
         self.verify = verify
 
     def request(  # type: ignore[override]
-        self, method: str, url: str, bare: bool = False, **kwargs: Any
+        self,
+        method: str,
+        url: str,
+        bare: bool = False,
+        cache: bool = False,
+        **kwargs: Any,
     ) -> Response:
         """Construct, prepare, and send a ``Request``.
 
@@ -249,15 +632,72 @@ class RetrySession(Session):
             url: URL for the new request.
             bare: If ``True``, do not send IBM Quantum specific information
                 (such as access token) in the request or modify the input `url`.
+            cache: Whether the response to a ``GET`` request can be cached and
+                revalidated with conditional requests, if the session has an
+                :class:`HttpCache`. Only used for requests of single entries.
             **kwargs: Additional arguments for the request.
 
         Returns:
             Response object.
 
         Raises:
+            CircuitOpenError: If the circuit breaker of the endpoint is open.
             RequestsApiError: If the request failed.
         """
         # pylint: disable=arguments-differ
+        tracer = get_tracer()
+        if tracer is None:
+            return self._authorized_request(method, url, bare, cache, **kwargs)
+        with tracer.start_span(
+            f"HTTP {method.upper()}",
+            {"http.method": method.upper(), "http.url": url},
+        ) as span:
+            if not bare:
+                headers = dict(kwargs.pop("headers", None) or {})
+                tracer.inject(headers)
+                kwargs["headers"] = headers
+            try:
+                response = self._authorized_request(method, url, bare, cache, **kwargs)
+            except RequestsApiError as ex:
+                span.set_attribute("http.status_code", ex.status_code)
+                raise
+            span.set_attribute("http.status_code", response.status_code)
+            if "uber-trace-id" in response.headers:
+                span.set_attribute("server.trace_id", response.headers["uber-trace-id"])
+            return response
+
+    def _authorized_request(
+        self, method: str, url: str, bare: bool, cache: bool, **kwargs: Any
+    ) -> Response:
+        """Send a request with a current access token.
+
+        If the server rejects the token, a new one is requested from the token
+        manager and the request is sent again, once.
+        """
+        manager = self.token_manager
+        if manager is None or bare:
+            return self._request(method, url, bare, cache, **kwargs)
+        token = manager.token()
+        if token != self.access_token:
+            self.access_token = token
+        try:
+            return self._request(method, url, bare, cache, **kwargs)
+        except RequestsApiError as ex:
+            if ex.status_code != 401:
+                raise
+            logger.debug("The access token was rejected, requesting a new one.")
+            self.access_token = manager.refresh(stale=token)
+        return self._request(method, url, bare, cache, **kwargs)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        bare: bool = False,
+        cache: bool = False,
+        **kwargs: Any,
+    ) -> Response:
+        """Send a request, as described in :meth:`request`."""
         if bare:
             final_url = url
             # Explicitly pass `None` as the `access_token` param, disabling it.
@@ -274,9 +714,64 @@ class RetrySession(Session):
         headers = self.headers.copy()
         headers.update(kwargs.pop("headers", {}))
 
+        breaker = None
+        if self.circuit_breakers is not None and not bare:
+            breaker = self.circuit_breakers.get(url)
+            if breaker is not None:
+                breaker.before_request()
+
+        if self.retry_budget is not None:
+            self.retry_budget.record_request()
+        if self.metrics is not None:
+            start = time.perf_counter()
+            self._retries = 0
+
+        cache_key = cached = None
+        if self.http_cache is not None and not bare and not kwargs.get("stream"):
+            if method.upper() != "GET":
+                # The entry is modified, so its cached responses are outdated.
+                self.http_cache.invalidate(_cache_key(final_url, kwargs.get("params")))
+            elif cache:
+                cache_key = _cache_key(final_url, kwargs.get("params"))
+                cached = self.http_cache.get(cache_key)
+                if cached is not None:
+                    headers.update(conditional_headers(cached))
+
+        data = kwargs.get("data")
+        body_size = len(data) if isinstance(data, (str, bytes)) else 0
+        encoding = self.request_compression
+        compress = (
+            encoding is not None
+            and not bare
+            and body_size >= self.compress_min_size
+            and "Content-Encoding" not in headers
+        )
+        sent = received = 0
         try:
             self._log_request_info(final_url, method, kwargs)
-            response = super().request(method, final_url, headers=headers, **kwargs)
+            if compress:
+                body = data.encode("utf-8") if isinstance(data, str) else data
+                body_size = len(body)
+                response = super().request(
+                    method,
+                    final_url,
+                    headers=dict(headers, **{"Content-Encoding": encoding}),
+                    **dict(kwargs, data=get_compressor(encoding)(body)),
+                )
+                if response.status_code == 415:
+                    # The server does not accept compressed requests.
+                    logger.debug("Disabling %s request compression.", encoding)
+                    self.request_compression = compress = None
+                    response = super().request(
+                        method, final_url, headers=headers, **kwargs
+                    )
+            else:
+                response = super().request(method, final_url, headers=headers, **kwargs)
+            sent, received = self._record_transfer(
+                response, body_size, compress, kwargs
+            )
+            if cache_key is not None:
+                response = self._revalidate(response, cache_key, cached)
             response.raise_for_status()
         except RequestException as ex:
             # Wrap the requests exceptions into a IBM Q custom one, for
@@ -298,10 +793,104 @@ class RetrySession(Session):
                     # the response did not contain the expected json.
                     message += f". {ex.response.text}"
 
+            if breaker is not None:
+                if is_failure(status_code):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+            if self.metrics is not None:
+                self.metrics.record(
+                    self.metrics.endpoint(None if bare else url),
+                    method,
+                    time.perf_counter() - start,
+                    sent,
+                    received,
+                    self._retries,
+                    error=True,
+                )
             raise RequestsApiError(message, status_code) from ex
 
+        if breaker is not None:
+            breaker.record_success()
+        if self.metrics is not None:
+            self.metrics.record(
+                self.metrics.endpoint(None if bare else url),
+                method,
+                time.perf_counter() - start,
+                sent,
+                received,
+                self._retries,
+            )
+        return response
+
+    def _revalidate(
+        self, response: Response, key: str, cached: Optional[CachedResponse]
+    ) -> Response:
+        """Serve the cached body of a response if it is current, and cache it.
+
+        Args:
+            response: Response to a ``GET`` request.
+            key: Cache key of the request.
+            cached: The cached response sent for revalidation, if any.
+
+        Returns:
+            The response, or the cached one if the server responded that it is
+            not modified.
+        """
+        if cached is not None:
+            not_modified = response.status_code == 304
+            self.http_cache.record(hit=not_modified)
+            if not_modified:
+                return _from_cache(response, cached)
+        if response.status_code == 200:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self.http_cache.put(
+                    key,
+                    CachedResponse(
+                        etag,
+                        last_modified,
+                        response.headers.get("Content-Type"),
+                        response.content,
+                    ),
+                )
+        elif cached is not None:
+            self.http_cache.invalidate(key)
         return response
 
+    def _record_transfer(
+        self,
+        response: Response,
+        body_size: int,
+        compressed: bool,
+        request_kwargs: Dict[str, Any],
+    ) -> Tuple[int, int]:
+        """Count the bytes of a request and its response.
+
+        Args:
+            response: The response.
+            body_size: Size of the request body before compression.
+            compressed: Whether the request body was compressed.
+            request_kwargs: Arguments of the request.
+
+        Returns:
+            The number of request and response body bytes transferred.
+        """
+        sent = len(response.request.body or b"") if compressed else body_size
+        if request_kwargs.get("stream"):
+            # The body of streamed responses is counted when it is read.
+            received = body_received = 0
+        else:
+            body_received = len(response.content)
+            received = _wire_size(response, body_received)
+        self.transfer_counter.add(1, sent, body_size, received, body_received)
+        if self.request_compression and "Accept-Encoding" in response.headers:
+            self.request_compression = negotiate_encoding(
+                response.headers["Accept-Encoding"], self.request_compression
+            )
+        return sent, received
+
     def _log_request_info(
         self, url: str, method: str, request_data: Dict[str, Any]
     ) -> None:
@@ -325,6 +914,8 @@ class RetrySession(Session):
         Raises:
             Exception: If there was an error logging the request information.
         """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         # Replace the device name in the URL with `...` if it matches, otherwise leave it as is.
         filtered_url = re.sub(RE_DEVICES_ENDPOINT, "\\1...\\3", url)
 
@@ -389,6 +980,254 @@ class RetrySession(Session):
         return state
 
 
+class SessionPool:
+    """Thread-safe pool of sessions sharing one access token.
+
+    ``requests`` sessions are not thread-safe, so each thread using the pool gets
+    its own :class:`RetrySession`, created on its first request with the same
+    parameters and access token. The pool provides the request methods of a
+    session, so it can be used in place of one.
+    """
+
+    def __init__(self, base_url: str, access_token: str, **session_params: Any):
+        """SessionPool constructor.
+
+        Args:
+            base_url: Base URL for the sessions' requests.
+            access_token: Access token shared by the sessions.
+            **session_params: Additional parameters of the sessions, as accepted
+                by :class:`RetrySession`, and the parameters of the
+                :class:`HttpCache` shared by the sessions: ``http_cache_size``,
+                its maximum size in memory in bytes, ``http_cache_dir``, the
+                directory it is stored in, and ``http_cache_disk_size``, its
+                maximum size on disk in bytes, and of the :class:`RetryBudget`
+                shared by the sessions: ``retry_budget_ratio``, ``None`` to not
+                use a budget, and ``retry_budget_min_rate``, and of the
+                :class:`CircuitBreakers` shared by the sessions:
+                ``circuit_breaker_threshold``, ``0`` to disable them, and
+                ``circuit_breaker_timeout``.
+        """
+        self.base_url = base_url
+        self._access_token = access_token
+        cache_size = session_params.pop("http_cache_size", 16 * 1024 * 1024)
+        cache_dir = session_params.pop("http_cache_dir", None)
+        cache_disk_size = session_params.pop("http_cache_disk_size", 256 * 1024 * 1024)
+        self.http_cache = None  # type: Optional[HttpCache]
+        if cache_size or cache_dir:
+            self.http_cache = HttpCache(cache_size, cache_dir, cache_disk_size)
+        budget_ratio = session_params.pop("retry_budget_ratio", 0.2)
+        budget_min_rate = session_params.pop("retry_budget_min_rate", 1.0)
+        self.retry_budget = None  # type: Optional[RetryBudget]
+        if budget_ratio is not None:
+            self.retry_budget = RetryBudget(budget_ratio, budget_min_rate)
+        breaker_threshold = session_params.pop("circuit_breaker_threshold", 5)
+        breaker_timeout = session_params.pop("circuit_breaker_timeout", 30.0)
+        self.circuit_breakers = None  # type: Optional[CircuitBreakers]
+        if breaker_threshold:
+            self.circuit_breakers = CircuitBreakers(breaker_threshold, breaker_timeout)
+        self.metrics = session_params.get("metrics")  # type: Optional[RequestMetrics]
+        self._session_params = session_params
+        self.transfer_counter = TransferCounter()
+        self._local = threading.local()
+        # Sessions by thread, so that the sessions of finished threads are dropped.
+        self._sessions = (
+            weakref.WeakKeyDictionary()
+        )  # type: weakref.WeakKeyDictionary[threading.Thread, RetrySession]
+        self._lock = threading.Lock()
+        _POOLS.add(self)
+
+    @property
+    def access_token(self) -> Optional[str]:
+        """Return the access token shared by the sessions."""
+        return self._access_token
+
+    @access_token.setter
+    def access_token(self, value: Optional[str]) -> None:
+        """Set the access token of all the sessions."""
+        with self._lock:
+            self._access_token = value
+            for session in self._sessions.values():
+                session.access_token = value
+
+    def session(self) -> RetrySession:
+        """Return the session of the current thread, creating it if needed."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            with self._lock:
+                session = RetrySession(
+                    self.base_url,
+                    self._access_token,
+                    transfer_counter=self.transfer_counter,
+                    http_cache=self.http_cache,
+                    retry_budget=self.retry_budget,
+                    circuit_breakers=self.circuit_breakers,
+                    **self._session_params,
+                )
+                self._sessions[threading.current_thread()] = session
+            self._local.session = session
+        return session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Response:
+        """Send a request using the session of the current thread.
+
+        Args:
+            method: Method for the new request (e.g. ``POST``).
+            url: URL for the new request.
+            **kwargs: Additional arguments for :meth:`RetrySession.request`.
+
+        Returns:
+            Response object.
+        """
+        return self.session().request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> Response:
+        """Send a ``GET`` request. See :meth:`request`."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> Response:
+        """Send a ``POST`` request. See :meth:`request`."""
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> Response:
+        """Send a ``PUT`` request. See :meth:`request`."""
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> Response:
+        """Send a ``DELETE`` request. See :meth:`request`."""
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        """Close the sessions of all the threads.
+
+        The pool can still be used afterwards, in which case new sessions are
+        created.
+        """
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            self._local = threading.local()
+        for session in sessions:
+            session.close()
+
+    def __enter__(self) -> "SessionPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _after_fork(self) -> None:
+        """Drop the sessions and locks of the parent process after a fork.
+
+        The connections of the parent sessions are shared with the parent, so
+        they are dropped without being closed, which would also close them in
+        the parent, and the child creates new sessions on its first requests.
+        """
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._sessions = weakref.WeakKeyDictionary()
+        for shared in (
+            self.http_cache,
+            self.retry_budget,
+            self.circuit_breakers,
+            self.metrics,
+            self.transfer_counter,
+        ):
+            if shared is not None and hasattr(shared, "_lock"):
+                shared._lock = threading.Lock()
+
+
+# Session pools of the process, whose sessions are dropped after a fork.
+_POOLS = weakref.WeakSet()  # type: weakref.WeakSet[SessionPool]
+
+
+def _after_fork_in_child() -> None:
+    """Reset the session pools inherited from the parent process."""
+    for pool in list(_POOLS):
+        pool._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def _cache_key(url: str, params: Any) -> str:
+    """Return the URL of a request, including its query string.
+
+    Args:
+        url: Request URL.
+        params: Query parameters.
+
+    Returns:
+        The full request URL.
+    """
+    request = PreparedRequest()
+    request.prepare_url(url, params)
+    return request.url
+
+
+def _from_cache(response: Response, cached: CachedResponse) -> Response:
+    """Return a response with a cached body.
+
+    Args:
+        response: ``304 Not Modified`` response.
+        cached: Cached response.
+
+    Returns:
+        A ``200 OK`` response with the cached body and the headers of `response`.
+    """
+    # pylint: disable=protected-access
+    result = Response()
+    result.status_code = 200
+    result.reason = "OK"
+    result.url = response.url
+    result.request = response.request
+    result.raw = response.raw
+    result.connection = getattr(response, "connection", None)
+    result.elapsed = response.elapsed
+    result.headers = CaseInsensitiveDict(response.headers)
+    result.headers.pop("Content-Encoding", None)
+    result.headers["Content-Length"] = str(len(cached.content))
+    if cached.content_type:
+        result.headers["Content-Type"] = cached.content_type
+    result.encoding = get_encoding_from_headers(result.headers)
+    result._content = cached.content
+    result._content_consumed = True
+    return result
+
+
+def _wire_size(response: Response, default: int) -> int:
+    """Return the number of response body bytes read from the connection.
+
+    Args:
+        response: A response whose body has been read.
+        default: Value returned if the size is not known.
+
+    Returns:
+        The size of the response body, before it was decompressed.
+    """
+    try:
+        return int(response.raw.tell())
+    except Exception:  # pylint: disable=broad-except
+        return default
+
+
+def _host_prefix(url: str) -> str:
+    """Return the ``scheme://host[:port]`` prefix of a URL or host name.
+
+    Args:
+        url: URL, or host name which is assumed to use HTTPS.
+
+    Returns:
+        The URL prefix, or an empty string if `url` has no host.
+    """
+    if "://" not in url:
+        url = "https://" + url
+    parts = urlsplit(url)
+    if not parts.netloc:
+        return ""
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
 def filter_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """Return the data with certain fields filtered.
 
@@ -0,0 +1,301 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Access tokens, cached and refreshed before they expire."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+from ..exceptions import RequestsApiError
+from .session import RetrySession
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOKEN_TTL = 3600.0
+"""Lifetime assumed for the access tokens the server returns without a ``ttl``."""
+
+# Access tokens of the process, by cache key, as ``(token, refresh_at, expires_at)``
+# tuples of wall-clock times, so that they can be shared with other processes.
+_TOKENS = {}  # type: Dict[str, Tuple[str, float, float]]
+_TOKENS_LOCK = threading.Lock()
+_LOGIN_LOCKS = {}  # type: Dict[str, threading.Lock]
+# Managers of the process, whose locks and connections are reset after a fork.
+_MANAGERS = weakref.WeakSet()  # type: weakref.WeakSet
+
+
+class TokenManager:
+    """Manager of the access token obtained by logging in with an API token.
+
+    The access tokens are cached in memory, and shared by the managers of the
+    process using the same authentication URL and API token, so that services
+    created one after the other log in only once. They can also be cached in a
+    directory, shared by processes: a file lock makes concurrent processes wait
+    for the one logging in and reuse its token.
+
+    A token is refreshed when it is used less than `refresh_margin` seconds
+    before its expiry, so that long-running jobs do not use expired tokens.
+    Tokens rejected by the server are refreshed with :meth:`refresh`.
+    """
+
+    def __init__(
+        self,
+        auth_url: str,
+        api_token: str,
+        proxies: Optional[Dict[str, str]] = None,
+        verify: bool = True,
+        cache_dir: Optional[str] = None,
+        refresh_margin: float = 300.0,
+    ) -> None:
+        """TokenManager constructor.
+
+        Args:
+            auth_url: URL of the login endpoint.
+            api_token: API token used to log in.
+            proxies: Proxy URLs mapped by protocol.
+            verify: Whether to enable SSL verification.
+            cache_dir: Directory the access tokens are cached in, to share them
+                with other processes. ``None`` only caches them in memory.
+            refresh_margin: Number of seconds before its expiry a token is
+                refreshed. At most half the lifetime of the token is used.
+        """
+        self.auth_url = auth_url
+        self.cache_dir = cache_dir
+        self.refresh_margin = refresh_margin
+        self._api_token = api_token
+        self._proxies = proxies
+        self._verify = verify
+        self._key = hashlib.sha256(f"{auth_url}\0{api_token}".encode()).hexdigest()
+        self._session = None  # type: Optional[RetrySession]
+        with _TOKENS_LOCK:
+            self._login_lock = _LOGIN_LOCKS.setdefault(self._key, threading.Lock())
+            _MANAGERS.add(self)
+
+    def token(self) -> str:
+        """Return a valid access token, logging in if needed.
+
+        Returns:
+            The access token.
+
+        Raises:
+            RequestsApiError: If the login failed.
+        """
+        entry = _TOKENS.get(self._key)
+        if entry is not None and time.time() < entry[1]:
+            return entry[0]
+        return self._update(stale=None)
+
+    def refresh(self, stale: Optional[str] = None) -> str:
+        """Return a new access token, replacing one rejected by the server.
+
+        Args:
+            stale: The rejected token. If another thread or process already
+                replaced it, its replacement is returned without logging in.
+
+        Returns:
+            The new access token.
+
+        Raises:
+            RequestsApiError: If the login failed.
+        """
+        return self._update(stale=stale, force=True)
+
+    def cached(self) -> Optional[Tuple[str, float, float]]:
+        """Return the access token cached in memory, without logging in.
+
+        Returns:
+            The access token with the times it should be refreshed at and it
+            expires at, or ``None`` if there is none.
+        """
+        return _TOKENS.get(self._key)
+
+    def seed(self, entry: Tuple[str, float, float]) -> None:
+        """Cache an access token obtained by another process.
+
+        The token is ignored if the cached one expires later.
+
+        Args:
+            entry: The access token with the times it should be refreshed at and
+                it expires at, as returned by :meth:`cached`.
+        """
+        with _TOKENS_LOCK:
+            current = _TOKENS.get(self._key)
+            if current is None or current[2] < entry[2]:
+                _TOKENS[self._key] = tuple(entry)
+
+    def clear(self) -> None:
+        """Discard the cached access token, in memory and on disk."""
+        with self._login_lock:
+            with _TOKENS_LOCK:
+                _TOKENS.pop(self._key, None)
+            if self.cache_dir is not None:
+                try:
+                    os.remove(self._path(".json"))
+                except OSError:
+                    pass
+
+    def close(self) -> None:
+        """Close the connection used to log in."""
+        with self._login_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _update(self, stale: Optional[str], force: bool = False) -> str:
+        """Return a current token, from the caches if possible."""
+        with self._login_lock:
+            entry = _TOKENS.get(self._key)
+            if _usable(entry, stale, force):
+                return entry[0]
+            if self.cache_dir is None:
+                entry = self._login(None if force else entry)
+            else:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                with _file_lock(self._path(".lock")):
+                    stored = self._read()
+                    if _usable(stored, stale, force):
+                        entry = stored
+                    else:
+                        entry = self._login(None if force else stored or entry)
+                        self._write(entry)
+            with _TOKENS_LOCK:
+                _TOKENS[self._key] = entry
+            return entry[0]
+
+    def _login(
+        self, current: Optional[Tuple[str, float, float]]
+    ) -> Tuple[str, float, float]:
+        """Log in, keeping the current token if it is still valid and login fails."""
+        if self._session is None:
+            self._session = RetrySession(
+                self.auth_url,
+                None,
+                verify=self._verify,
+                proxies=self._proxies,
+                retries_total=5,
+            )
+        logger.debug("Requesting an access token from %s.", self.auth_url)
+        try:
+            response = self._session.post(
+                self.auth_url,
+                bare=True,
+                json={"apiToken": self._api_token},
+                headers={"accept": "application/json"},
+            )
+            data = response.json()
+            token = data["id"]
+        except (RequestsApiError, KeyError, ValueError) as ex:
+            if current is not None and time.time() < current[2]:
+                logger.warning("Failed to refresh the access token: %s", ex)
+                # Try again in a minute, rather than on every request.
+                return current[0], min(time.time() + 60, current[2]), current[2]
+            if isinstance(ex, RequestsApiError):
+                raise
+            raise RequestsApiError(
+                f"Did not receive access token (request returned {response.text})"
+            ) from ex
+        ttl = float(data.get("ttl") or DEFAULT_TOKEN_TTL)
+        now = time.time()
+        return token, now + max(ttl - self.refresh_margin, ttl / 2), now + ttl
+
+    def _path(self, suffix: str) -> str:
+        """Return the path of a cache file."""
+        return os.path.join(self.cache_dir, self._key + suffix)
+
+    def _read(self) -> Optional[Tuple[str, float, float]]:
+        """Return the token cached on disk, if any."""
+        try:
+            with open(self._path(".json"), encoding="utf-8") as file:
+                data = json.load(file)
+            return data["token"], data["refresh_at"], data["expires_at"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write(self, entry: Tuple[str, float, float]) -> None:
+        """Cache a token on disk, readable by the user only."""
+        data = dict(zip(("token", "refresh_at", "expires_at"), entry))
+        handle, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as file:
+                json.dump(data, file)
+            os.replace(temp_path, self._path(".json"))
+        except OSError as ex:
+            logger.warning("Failed to cache the access token: %s", ex)
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+def _after_fork_in_child() -> None:
+    """Reset the locks and connections inherited from the parent process."""
+    global _TOKENS_LOCK  # pylint: disable=global-statement
+    _TOKENS_LOCK = threading.Lock()
+    _LOGIN_LOCKS.clear()
+    for manager in list(_MANAGERS):
+        manager._login_lock = _LOGIN_LOCKS.setdefault(manager._key, threading.Lock())
+        # The connection is shared with the parent, so it is dropped, not closed.
+        manager._session = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def _usable(
+    entry: Optional[Tuple[str, float, float]], stale: Optional[str], force: bool
+) -> bool:
+    """Return whether a cached token can be used."""
+    if entry is None:
+        return False
+    if force:
+        # The token replacing the rejected one can be used until it expires.
+        return stale is not None and entry[0] != stale and time.time() < entry[2]
+    return time.time() < entry[1]
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    """Hold an exclusive lock on a file, shared with other processes."""
+    with open(path, "a+b") as file:
+        if fcntl is not None:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        else:
+            file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after ten seconds.
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+            else:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
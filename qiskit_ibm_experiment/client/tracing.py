@@ -0,0 +1,285 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tracing of the service calls and of their requests.
+
+Tracing is disabled by default. Enable it by setting a tracer, either the
+:class:`RecordingTracer`, which keeps the finished spans in memory, or the
+:class:`OpenTelemetryTracer`, which sends them to the OpenTelemetry exporters
+configured by the application::
+
+    from qiskit_ibm_experiment.client.tracing import set_tracer, RecordingTracer
+
+    tracer = RecordingTracer()
+    set_tracer(tracer)
+    service.experiments(limit=None)
+    for span in tracer.spans:
+        print(span.name, span.duration)
+
+Each traced service method, such as
+:meth:`~qiskit_ibm_experiment.IBMExperimentService.experiments`, has a span, with
+child spans for the pages of paginated queries, the HTTP requests, and the
+decoding of the responses. The trace context is sent to the server in the
+``traceparent`` header of the requests.
+"""
+
+import contextvars
+import functools
+import secrets
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional
+
+_TRACER = None  # type: Optional[Tracer]
+
+_CURRENT_SPAN = contextvars.ContextVar(
+    "qiskit_ibm_experiment_span", default=None
+)  # type: contextvars.ContextVar[Optional[Span]]
+
+
+class Tracer:
+    """Interface of the tracers."""
+
+    def start_span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> ContextManager[Any]:
+        """Start a span, which is the current span until the context is exited.
+
+        The span must record the exception raised in the context, if any.
+
+        Args:
+            name: Name of the span.
+            attributes: Attributes of the span.
+
+        Returns:
+            A context manager returning the span, which has the
+            ``set_attribute(key, value)`` method.
+        """
+        raise NotImplementedError
+
+    def inject(self, headers: Dict[str, str]) -> None:
+        """Add the headers propagating the current trace context to a request.
+
+        Args:
+            headers: Request headers, modified in place.
+        """
+
+
+class Span:
+    """Span recorded by a :class:`RecordingTracer`."""
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "attributes",
+        "start_time",
+        "end_time",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        span_id: str,
+        parent_id: Optional[str],
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Span constructor.
+
+        Args:
+            name: Name of the span.
+            trace_id: Hexadecimal ID of the trace.
+            span_id: Hexadecimal ID of the span.
+            parent_id: ID of the parent span, if any.
+            attributes: Attributes of the span.
+        """
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.attributes = dict(attributes or {})
+        self.start_time = time.perf_counter()
+        self.end_time = None  # type: Optional[float]
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Return the duration of the span in seconds, if it ended."""
+        if self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute of the span.
+
+        Args:
+            key: Attribute name.
+            value: Attribute value.
+        """
+        self.attributes[key] = value
+
+    def record_exception(self, exception: BaseException) -> None:
+        """Record an exception raised during the span.
+
+        Args:
+            exception: The exception.
+        """
+        self.attributes["exception.type"] = type(exception).__name__
+        self.attributes["exception.message"] = str(exception)
+
+    def __repr__(self) -> str:
+        return (
+            f"<Span {self.name} trace_id={self.trace_id} span_id={self.span_id} "
+            f"parent_id={self.parent_id} duration={self.duration}>"
+        )
+
+
+class RecordingTracer(Tracer):
+    """Tracer keeping the most recent finished spans in memory.
+
+    The trace context is propagated with the W3C ``traceparent`` header.
+    """
+
+    def __init__(self, max_spans: int = 10000) -> None:
+        """RecordingTracer constructor.
+
+        Args:
+            max_spans: Maximum number of spans kept. Older spans are discarded.
+        """
+        self._spans = deque(maxlen=max_spans)  # type: deque
+        self._lock = threading.Lock()
+
+    @property
+    def spans(self) -> List[Span]:
+        """Return the finished spans, in the order they ended."""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        """Discard the finished spans."""
+        with self._lock:
+            self._spans.clear()
+
+    @contextmanager
+    def start_span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Span]:
+        parent = _CURRENT_SPAN.get()
+        span = Span(
+            name,
+            trace_id=parent.trace_id if parent else secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            attributes=attributes,
+        )
+        token = _CURRENT_SPAN.set(span)
+        try:
+            yield span
+        except BaseException as ex:
+            span.record_exception(ex)
+            raise
+        finally:
+            span.end_time = time.perf_counter()
+            _CURRENT_SPAN.reset(token)
+            with self._lock:
+                self._spans.append(span)
+
+    def inject(self, headers: Dict[str, str]) -> None:
+        span = _CURRENT_SPAN.get()
+        if span is not None:
+            headers["traceparent"] = f"00-{span.trace_id}-{span.span_id}-01"
+
+
+class OpenTelemetryTracer(Tracer):
+    """Tracer sending the spans to OpenTelemetry.
+
+    The spans are exported by the exporters of the tracer provider configured
+    by the application, and the trace context is propagated with the
+    propagators configured in OpenTelemetry.
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        """OpenTelemetryTracer constructor.
+
+        Args:
+            tracer: OpenTelemetry tracer. If ``None``, the tracer of the global
+                tracer provider is used.
+
+        Raises:
+            ImportError: If ``opentelemetry-api`` is not installed.
+        """
+        # pylint: disable=import-outside-toplevel
+        try:
+            from opentelemetry import propagate, trace
+        except ImportError as ex:
+            raise ImportError(
+                "OpenTelemetry tracing requires opentelemetry-api. You can install "
+                "it with 'pip install qiskit-ibm-experiment[tracing]'."
+            ) from ex
+        from ..version import __version__
+
+        self._tracer = tracer or trace.get_tracer("qiskit_ibm_experiment", __version__)
+        self._inject = propagate.inject
+
+    def start_span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> ContextManager[Any]:
+        return self._tracer.start_as_current_span(name, attributes=attributes)
+
+    def inject(self, headers: Dict[str, str]) -> None:
+        self._inject(headers)
+
+
+def set_tracer(tracer: Optional[Tracer]) -> Optional[Tracer]:
+    """Set the tracer used by the services.
+
+    Args:
+        tracer: The tracer, or ``None`` to disable tracing.
+
+    Returns:
+        The previous tracer.
+    """
+    global _TRACER  # pylint: disable=global-statement
+    previous, _TRACER = _TRACER, tracer
+    return previous
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Return the tracer used by the services, or ``None`` if tracing is disabled."""
+    return _TRACER
+
+
+def traced(name: str) -> Callable:
+    """Decorator tracing a function in a span, if tracing is enabled.
+
+    Args:
+        name: Name of the span.
+
+    Returns:
+        The decorator.
+    """
+
+    def _decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def _wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = _TRACER
+            if tracer is None:
+                return func(*args, **kwargs)
+            with tracer.start_span(name):
+                return func(*args, **kwargs)
+
+        return _wrapper
+
+    return _decorator
@@ -101,6 +101,14 @@ class IBMExperimentEntryExists(IBMExperimentError):
     """Errors raised when an experiment entry already exists."""
 
 
+class IBMExperimentCircuitOpen(IBMApiError):
+    """Errors raised when requests fail fast because the server is unavailable."""
+
+
+class IBMExperimentQueueFull(IBMExperimentError):
+    """Errors raised when a write cannot be queued because the queue is full."""
+
+
 class ApiError(IBMError):
     """Generic IBM Quantum API error."""
 
@@ -121,6 +129,20 @@ class RequestsApiError(ApiError):
         self.status_code = status_code
 
 
+class CircuitOpenError(RequestsApiError):
+    """Exception raised when a request is not sent because its circuit is open."""
+
+    def __init__(self, message: str, endpoint_family: str):
+        """CircuitOpenError constructor.
+
+        Args:
+            message: Exception message.
+            endpoint_family: Endpoint family of the open circuit breaker.
+        """
+        super().__init__(message)
+        self.endpoint_family = endpoint_family
+
+
 class WebsocketError(ApiError):
     """Exceptions related to websockets."""
 
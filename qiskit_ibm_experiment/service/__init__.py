@@ -41,10 +41,23 @@ Classes
     :toctree: ../stubs/
 
     IBMExperimentService
+    AsyncIBMExperimentService
     ResultQuality
     DeviceComponent
+    RaggedColumn
+    ExperimentRecord
+    AnalysisResultRecord
+    ServiceHandle
+    UploadResult
+    WriteFailure
 """
 
 from .ibm_experiment_service import IBMExperimentService
+from .async_ibm_experiment_service import AsyncIBMExperimentService
 from .constants import ResultQuality, ExperimentShareLevel
 from .device_component import DeviceComponent
+from .columns import RaggedColumn
+from .records import ExperimentRecord, AnalysisResultRecord
+from .handle import ServiceHandle
+from .uploads import UploadResult
+from .write_queue import WriteFailure
@@ -0,0 +1,705 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Asynchronous IBM Quantum experiment service."""
+
+import asyncio
+import copy
+import json
+import logging
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Type,
+    Union,
+)
+
+from .constants import ExperimentShareLevel, ResultQuality, DEFAULT_BASE_URL
+from .device_component import DeviceComponent
+from .ibm_experiment_service import IBMExperimentService
+from .pagination import AdaptivePageSize, page_size_for
+from .records import ExperimentRecord, AnalysisResultRecord
+from .utils import map_api_error, setup_package_logger
+from ..accounts import ProxyConfiguration
+from ..client.async_experiment import AsyncExperimentClient
+from ..client.async_session import AsyncRetrySession
+from ..exceptions import RequestsApiError, IBMApiError, IBMExperimentEntryNotFound
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncIBMExperimentService:
+    """Provides experiment related services to ``asyncio`` applications.
+
+    This is the asynchronous counterpart of
+    :class:`~qiskit_ibm_experiment.IBMExperimentService`: its methods are
+    coroutines with the same arguments, filters and errors. Many calls can be in
+    flight at the same time from a single event loop, for example::
+
+        async with AsyncIBMExperimentService() as service:
+            experiments = await asyncio.gather(
+                *(service.experiment(exp_id) for exp_id in experiment_ids)
+            )
+            async for result in service.iter_analysis_results(limit=None):
+                ...
+
+    The service authenticates on its first request, or when :meth:`connect` is
+    awaited. Uploading figures and files is only supported by the synchronous
+    service.
+    """
+
+    _default_options = {
+        "prompt_for_delete": True,
+        "page_size": None,
+        "utc_timestamps": False,
+    }
+
+    # Validation and conversion of the entries are shared with the synchronous
+    # service, and do not depend on how the requests are sent.
+    _discover_account = IBMExperimentService._discover_account
+    _experiments_query = IBMExperimentService._experiments_query
+    _analysis_results_query = IBMExperimentService._analysis_results_query
+    _quality_filter_to_api = IBMExperimentService._quality_filter_to_api
+    _filtering_to_api = IBMExperimentService._filtering_to_api
+    _experiment_data_to_api = IBMExperimentService._experiment_data_to_api
+    _analysis_result_to_api = IBMExperimentService._analysis_result_to_api
+    _confirm_delete = IBMExperimentService._confirm_delete
+    set_option = IBMExperimentService.set_option
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        url: Optional[str] = None,
+        name: Optional[str] = None,
+        proxies: Optional[dict] = None,
+        verify: Optional[bool] = None,
+        session_options: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """AsyncIBMExperimentService constructor.
+
+        The account is discovered and validated, but no request is sent.
+
+        Args:
+            token: the API token to use when establishing connection with the result DB
+            url: the url for the result DB API
+            name: Name of a saved account to use.
+            proxies: Proxy configuration.
+            verify: Whether to verify the server's TLS certificate.
+            session_options: Options of the HTTP session used to connect to the
+                result DB. ``pool_maxsize`` sets the maximum number of simultaneous
+                connections, ``100`` by default. The retry options of
+                :class:`~qiskit_ibm_experiment.IBMExperimentService` are also
+                supported.
+            **kwargs: Service options. Supported options are ``prompt_for_delete``,
+                ``page_size`` and ``utc_timestamps``, as documented in
+                :class:`~qiskit_ibm_experiment.IBMExperimentService`.
+        """
+        setup_package_logger()
+        if url is None:
+            url = DEFAULT_BASE_URL
+        self._account = self._discover_account(
+            token=token,
+            url=url,
+            name=name,
+            proxies=ProxyConfiguration(**proxies) if proxies else None,
+            verify=verify,
+        )
+        self._additional_params = {
+            "proxies": self._account.proxies.to_request_params()
+            if self._account.proxies is not None
+            else None,
+            "verify": self._account.verify,
+            **(session_options or {}),
+        }
+        self._api_client = None  # type: Optional[AsyncExperimentClient]
+        self._connect_lock = None  # type: Optional[asyncio.Lock]
+        self.options = copy.deepcopy(self._default_options)
+        self.set_option(**kwargs)
+
+    async def connect(self) -> None:
+        """Authenticate to the server, if not done yet.
+
+        Raises:
+            IBMApiError: If the authentication failed.
+        """
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._api_client is not None:
+                return
+            client = AsyncExperimentClient(
+                None,
+                self._account.url + IBMExperimentService._DEFAULT_EXPERIMENT_PREFIX,
+                self._additional_params,
+            )
+            try:
+                access_token = await self._login(client.api.session)
+            except RequestsApiError as ex:
+                await client.close()
+                raise IBMApiError(str(ex)) from None
+            client.api.session.access_token = access_token
+            client.api.session.token_refresher = self._refresh_access_token
+            self._api_client = client
+
+    async def _login(self, session: AsyncRetrySession) -> str:
+        """Log in with the API token, returning the access token.
+
+        Raises:
+            RequestsApiError: If no access token was received.
+        """
+        auth_url = (
+            self._account.url + IBMExperimentService._DEFAULT_AUTHENTICATION_PREFIX
+        )
+        try:
+            response = await session.post(
+                auth_url,
+                bare=True,
+                json={"apiToken": self._account.token},
+                headers={"accept": "application/json"},
+            )
+            return response.json()["id"]
+        except (RequestsApiError, KeyError, ValueError) as ex:
+            raise RequestsApiError(
+                f"Did not receive access token: {ex}",
+                getattr(ex, "status_code", -1),
+            ) from None
+
+    async def _refresh_access_token(self, stale: str) -> str:
+        """Return a new access token, replacing one the server rejected.
+
+        Requests rejected at the same time share the new access token.
+        """
+        session = self._api_client.api.session
+        async with self._connect_lock:
+            if session.access_token == stale:
+                session.access_token = await self._login(session)
+            return session.access_token
+
+    async def _client(self) -> AsyncExperimentClient:
+        """Return the client, authenticating first if needed."""
+        if self._api_client is None:
+            await self.connect()
+        return self._api_client
+
+    async def close(self) -> None:
+        """Close the connections of the service."""
+        if self._api_client is not None:
+            await self._api_client.close()
+            self._api_client = None
+
+    async def __aenter__(self) -> "AsyncIBMExperimentService":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def backends(self) -> List[Dict]:
+        """Return a list of backends that can be used for experiments.
+
+        Returns:
+            A list of backends.
+        """
+        return await (await self._client()).devices()
+
+    async def create_experiment(
+        self,
+        experiment_type: str,
+        backend_name: str,
+        provider: Any,
+        metadata: Optional[Dict] = None,
+        experiment_id: Optional[str] = None,
+        parent_id: Optional[str] = None,
+        job_ids: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        notes: Optional[str] = None,
+        share_level: Optional[Union[str, ExperimentShareLevel]] = None,
+        start_datetime: Optional[Union[str, datetime]] = None,
+        json_encoder: Type[json.JSONEncoder] = json.JSONEncoder,
+    ) -> str:
+        """Create a new experiment in the database.
+
+        See :meth:`IBMExperimentService.create_experiment` for the arguments.
+
+        Returns:
+            Experiment ID.
+
+        Raises:
+            IBMExperimentEntryExists: If the experiment already exits.
+            IBMApiError: If the request to the server failed.
+        """
+        data = {
+            "type": experiment_type,
+            "device_name": backend_name,
+            "hub_id": provider.credentials.hub,
+            "group_id": provider.credentials.group,
+            "project_id": provider.credentials.project,
+        }
+        data.update(
+            self._experiment_data_to_api(
+                metadata=metadata,
+                experiment_id=experiment_id,
+                parent_id=parent_id,
+                job_ids=job_ids,
+                tags=tags,
+                notes=notes,
+                share_level=share_level,
+                start_dt=start_datetime,
+            )
+        )
+        client = await self._client()
+        with map_api_error(f"Experiment {experiment_id} creation failed."):
+            response_data = await client.experiment_upload(
+                json.dumps(data, cls=json_encoder)
+            )
+        return response_data["uuid"]
+
+    async def update_experiment(
+        self,
+        experiment_id: str,
+        metadata: Optional[Dict] = None,
+        job_ids: Optional[List[str]] = None,
+        notes: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        share_level: Optional[Union[str, ExperimentShareLevel]] = None,
+        end_datetime: Optional[Union[str, datetime]] = None,
+        json_encoder: Type[json.JSONEncoder] = json.JSONEncoder,
+    ) -> None:
+        """Update an existing experiment.
+
+        See :meth:`IBMExperimentService.update_experiment` for the arguments.
+
+        Raises:
+            IBMExperimentEntryNotFound: If the experiment does not exist.
+            IBMApiError: If the request to the server failed.
+        """
+        data = self._experiment_data_to_api(
+            metadata=metadata,
+            job_ids=job_ids,
+            tags=tags,
+            notes=notes,
+            share_level=share_level,
+            end_dt=end_datetime,
+        )
+        if not data:
+            logger.warning("update_experiment() called with nothing to update.")
+            return
+        client = await self._client()
+        with map_api_error(f"Experiment {experiment_id} update failed."):
+            await client.experiment_update(
+                experiment_id, json.dumps(data, cls=json_encoder)
+            )
+
+    async def experiment(
+        self,
+        experiment_id: str,
+        json_decoder: Type[json.JSONDecoder] = json.JSONDecoder,
+    ) -> ExperimentRecord:
+        """Retrieve a previously stored experiment.
+
+        Args:
+            experiment_id: Experiment ID.
+            json_decoder: Custom JSON decoder to use to decode the retrieved experiment.
+
+        Returns:
+            Retrieved experiment data.
+
+        Raises:
+            IBMExperimentEntryNotFound: If the experiment does not exist.
+            IBMApiError: If the request to the server failed.
+        """
+        client = await self._client()
+        with map_api_error(f"Experiment {experiment_id} not found."):
+            raw_data = await client.experiment_get(experiment_id)
+        return self._api_to_experiment_data(json.loads(raw_data, cls=json_decoder))
+
+    async def experiments(
+        self,
+        limit: Optional[int] = 10,
+        json_decoder: Type[json.JSONDecoder] = json.JSONDecoder,
+        **filters: Any,
+    ) -> List[ExperimentRecord]:
+        """Retrieve all experiments, with optional filtering.
+
+        Args:
+            limit: Number of experiments to retrieve. ``None`` indicates no limit.
+            json_decoder: Custom JSON decoder to use to decode the retrieved experiments.
+            **filters: Filtering and sorting options, as accepted by
+                :meth:`IBMExperimentService.experiments`.
+
+        Returns:
+            A list of experiments.
+        """
+        return [
+            experiment
+            async for experiment in self.iter_experiments(
+                limit=limit, json_decoder=json_decoder, **filters
+            )
+        ]
+
+    def iter_experiments(
+        self,
+        limit: Optional[int] = None,
+        json_decoder: Type[json.JSONDecoder] = json.JSONDecoder,
+        **filters: Any,
+    ) -> AsyncIterator[ExperimentRecord]:
+        """Return an asynchronous iterator over the experiments, fetched page by page.
+
+        Args:
+            limit: Number of experiments to retrieve. ``None`` indicates no limit.
+            json_decoder: Custom JSON decoder to use to decode the retrieved experiments.
+            **filters: Filtering and sorting options, as accepted by
+                :meth:`IBMExperimentService.experiments`.
+
+        Returns:
+            An asynchronous iterator of experiments, for use with ``async for``.
+
+        Raises:
+            ValueError: If an invalid parameter value is specified.
+        """
+        query = self._experiments_query(limit=limit, **filters)
+        return self._paginate(
+            "experiments",
+            query.params,
+            self._api_to_experiment_data,
+            limit,
+            json_decoder,
+        )
+
+    async def delete_experiment(self, experiment_id: str) -> None:
+        """Delete an experiment.
+
+        Args:
+            experiment_id: Experiment ID.
+
+        Note:
+            This method prompts for confirmation and requires a response before
+            proceeding, unless the ``prompt_for_delete`` option is ``False``.
+
+        Raises:
+            IBMApiError: If the request to the server failed.
+        """
+        if not self._confirm_delete(
+            "Are you sure you want to delete the experiment? "
+            "Results and plots for the experiment will also be deleted. [y/N]: "
+        ):
+            return
+        client = await self._client()
+        try:
+            with map_api_error(f"Experiment {experiment_id} deletion failed."):
+                await client.experiment_delete(experiment_id)
+        except IBMExperimentEntryNotFound:
+            logger.warning("Experiment %s not found.", experiment_id)
+
+    async def create_analysis_result(
+        self,
+        experiment_id: str,
+        result_data: Dict,
+        result_type: str,
+        device_components: Optional[
+            Union[List[Union[str, DeviceComponent]], str, DeviceComponent]
+        ] = None,
+        tags: Optional[List[str]] = None,
+        quality: Union[ResultQuality, str] = ResultQuality.UNKNOWN,
+        verified: bool = False,
+        result_id: Optional[str] = None,
+        chisq: Optional[float] = None,
+        json_encoder: Type[json.JSONEncoder] = json.JSONEncoder,
+    ) -> str:
+        """Create a new analysis result in the database.
+
+        See :meth:`IBMExperimentService.create_analysis_result` for the arguments.
+
+        Returns:
+            Analysis result ID.
+
+        Raises:
+            IBMExperimentEntryExists: If the analysis result already exits.
+            IBMApiError: If the request to the server failed.
+        """
+        if device_components and not isinstance(device_components, list):
+            device_components = [device_components]
+        if isinstance(quality, str):
+            quality = ResultQuality(quality.upper())
+        request = self._analysis_result_to_api(
+            experiment_id=experiment_id,
+            device_components=[str(comp) for comp in device_components or []],
+            data=result_data,
+            result_type=result_type,
+            tags=tags,
+            quality=quality,
+            verified=verified,
+            result_id=result_id,
+            chisq=chisq,
+        )
+        client = await self._client()
+        with map_api_error(f"Analysis result {result_id} creation failed."):
+            response = await client.analysis_result_create(
+                json.dumps(request, cls=json_encoder)
+            )
+        return response["uuid"]
+
+    async def update_analysis_result(
+        self,
+        result_id: str,
+        result_data: Optional[Dict] = None,
+        tags: Optional[List[str]] = None,
+        quality: Union[ResultQuality, str] = None,
+        verified: bool = None,
+        chisq: Optional[float] = None,
+        json_encoder: Type[json.JSONEncoder] = json.JSONEncoder,
+    ) -> None:
+        """Update an existing analysis result.
+
+        See :meth:`IBMExperimentService.update_analysis_result` for the arguments.
+
+        Raises:
+            IBMExperimentEntryNotFound: If the analysis result does not exist.
+            IBMApiError: If the request to the server failed.
+        """
+        if isinstance(quality, str):
+            quality = ResultQuality(quality.upper())
+        request = self._analysis_result_to_api(
+            data=result_data, tags=tags, quality=quality, verified=verified, chisq=chisq
+        )
+        client = await self._client()
+        with map_api_error(f"Analysis result {result_id} update failed."):
+            await client.analysis_result_update(
+                result_id, json.dumps(request, cls=json_encoder)
+            )
+
+    async def analysis_result(
+        self, result_id: str, json_decoder: Type[json.JSONDecoder] = json.JSONDecoder
+    ) -> AnalysisResultRecord:
+        """Retrieve a previously stored analysis result.
+
+        Args:
+            result_id: Analysis result ID.
+            json_decoder: Custom JSON decoder to use to decode the retrieved analysis result.
+
+        Returns:
+            Retrieved analysis result.
+
+        Raises:
+            IBMExperimentEntryNotFound: If the analysis result does not exist.
+            IBMApiError: If the request to the server failed.
+        """
+        client = await self._client()
+        with map_api_error(f"Analysis result {result_id} not found."):
+            raw_data = await client.analysis_result_get(result_id)
+        return self._api_to_analysis_result(json.loads(raw_data, cls=json_decoder))
+
+    async def analysis_results(
+        self,
+        limit: Optional[int] = 10,
+        json_decoder: Type[json.JSONDecoder] = json.JSONDecoder,
+        **filters: Any,
+    ) -> List[AnalysisResultRecord]:
+        """Retrieve all analysis results, with optional filtering.
+
+        Args:
+            limit: Number of analysis results to retrieve. ``None`` indicates no limit.
+            json_decoder: Custom JSON decoder to use to decode the retrieved
+                analysis results.
+            **filters: Filtering and sorting options, as accepted by
+                :meth:`IBMExperimentService.analysis_results`.
+
+        Returns:
+            A list of analysis results.
+        """
+        return [
+            result
+            async for result in self.iter_analysis_results(
+                limit=limit, json_decoder=json_decoder, **filters
+            )
+        ]
+
+    def iter_analysis_results(
+        self,
+        limit: Optional[int] = None,
+        json_decoder: Type[json.JSONDecoder] = json.JSONDecoder,
+        **filters: Any,
+    ) -> AsyncIterator[AnalysisResultRecord]:
+        """Return an asynchronous iterator over the analysis results.
+
+        Args:
+            limit: Number of analysis results to retrieve. ``None`` indicates no limit.
+            json_decoder: Custom JSON decoder to use to decode the retrieved
+                analysis results.
+            **filters: Filtering and sorting options, as accepted by
+                :meth:`IBMExperimentService.analysis_results`.
+
+        Returns:
+            An asynchronous iterator of analysis results, for use with ``async for``.
+
+        Raises:
+            ValueError: If an invalid parameter value is specified.
+        """
+        query = self._analysis_results_query(limit=limit, **filters)
+        return self._paginate(
+            "analysis_results",
+            query.params,
+            self._api_to_analysis_result,
+            limit,
+            json_decoder,
+        )
+
+    async def delete_analysis_result(self, result_id: str) -> None:
+        """Delete an analysis result.
+
+        Args:
+            result_id: Analysis result ID.
+
+        Note:
+            This method prompts for confirmation and requires a response before
+            proceeding, unless the ``prompt_for_delete`` option is ``False``.
+
+        Raises:
+            IBMApiError: If the request to the server failed.
+        """
+        if not self._confirm_delete(
+            "Are you sure you want to delete the analysis result? [y/N]: "
+        ):
+            return
+        client = await self._client()
+        try:
+            with map_api_error(f"Analysis result {result_id} deletion failed."):
+                await client.analysis_result_delete(result_id)
+        except IBMExperimentEntryNotFound:
+            logger.warning("Analysis result %s not found.", result_id)
+
+    async def figure(self, experiment_id: str, figure_name: str) -> bytes:
+        """Retrieve an existing figure.
+
+        Args:
+            experiment_id: Experiment ID.
+            figure_name: Name of the figure.
+
+        Returns:
+            The content of the figure in bytes.
+
+        Raises:
+            IBMExperimentEntryNotFound: If the figure does not exist.
+            IBMApiError: If the request to the server failed.
+        """
+        client = await self._client()
+        with map_api_error(f"Figure {figure_name} not found."):
+            return await client.experiment_plot_get(experiment_id, figure_name)
+
+    async def device_components(
+        self, backend_name: Optional[str] = None
+    ) -> Union[Dict[str, List], List]:
+        """Return the device components.
+
+        Args:
+            backend_name: Name of the backend whose components are to be retrieved.
+
+        Returns:
+            A list of device components if `backend_name` is specified. Otherwise
+            a dictionary whose keys are backend names the values
+            are lists of device components for the backends.
+
+        Raises:
+            IBMApiError: If the request to the server failed.
+        """
+        client = await self._client()
+        with map_api_error(
+            f"Device components call for backend {backend_name} failed."
+        ):
+            raw_data = await client.device_components(backend_name)
+
+        components = defaultdict(list)
+        for data in raw_data:
+            components[data["device_name"]].append(data["type"])
+        if backend_name:
+            return components[backend_name]
+        return dict(components)
+
+    async def files(self, experiment_id: str) -> Dict:
+        """Retrieve the file list for an experiment.
+
+        Args:
+            experiment_id: Experiment ID.
+
+        Returns:
+            The file list metadata.
+
+        Raises:
+            IBMExperimentEntryNotFound: If the experiment does not exist.
+            IBMApiError: If the request to the server failed.
+        """
+        client = await self._client()
+        with map_api_error(f"Experiment {experiment_id} file list not received."):
+            return await client.experiment_files_get(experiment_id)
+
+    async def _paginate(
+        self,
+        kind: str,
+        query: Dict[str, Any],
+        converter: Callable[[Dict], Any],
+        limit: Optional[int],
+        json_decoder: Type[json.JSONDecoder],
+    ) -> AsyncIterator[Any]:
+        """Retrieve records page by page, yielding them as they are received.
+
+        Args:
+            kind: Either ``"experiments"`` or ``"analysis_results"``.
+            query: Filtering arguments passed to the client.
+            converter: Function converting API records.
+            limit: Number of records to retrieve. ``None`` indicates no limit.
+            json_decoder: Custom JSON decoder to use to decode the records.
+
+        Yields:
+            Converted records.
+        """
+        client = await self._client()
+        fetch = getattr(client, kind)  # type: Callable[..., Awaitable[str]]
+        page_size = page_size_for(self.options["page_size"])
+        marker = None
+        while limit is None or limit > 0:
+            size = (
+                page_size.size if isinstance(page_size, AdaptivePageSize) else page_size
+            )
+            start_time = time.monotonic()
+            with map_api_error("Request failed."):
+                response = await fetch(
+                    limit=limit, marker=marker, page_size=size, **query
+                )
+            latency = time.monotonic() - start_time
+            raw_data = json.loads(response, cls=json_decoder)
+            marker = raw_data.get("marker")
+            records = raw_data[kind]
+            if isinstance(page_size, AdaptivePageSize):
+                requested = size if limit is None else min(size, limit)
+                page_size.update(requested, len(records), latency, len(response))
+            if limit:
+                limit -= len(records)
+            for record in records:
+                yield converter(record)
+            if not marker:  # No more records to return.
+                break
+
+    def _api_to_experiment_data(self, raw_data: Dict) -> ExperimentRecord:
+        """Convert API response to experiment data."""
+        return ExperimentRecord(raw_data, utc=self.options["utc_timestamps"])
+
+    def _api_to_analysis_result(self, raw_data: Dict) -> AnalysisResultRecord:
+        """Convert API response to analysis result data."""
+        return AnalysisResultRecord(raw_data, self, utc=self.options["utc_timestamps"])
@@ -0,0 +1,103 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""In-process cache of experiment service query results."""
+
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from typing import Any, Hashable, Optional
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize", "ttl"])
+"""Statistics of a :class:`QueryCache`."""
+
+
+class QueryCache:
+    """Bounded LRU cache whose entries expire after a fixed time to live."""
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None) -> None:
+        """QueryCache constructor.
+
+        Args:
+            maxsize: Maximum number of entries in the cache.
+            ttl: Number of seconds an entry stays valid. ``None`` means entries
+                do not expire.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # type: OrderedDict
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for the key.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The cached value, or ``None`` if the key is not cached or has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value in the cache, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> CacheInfo:
+        """Return the cache statistics."""
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self.maxsize, len(self._entries), self.ttl
+            )
+
+
+def freeze(value: Any) -> Hashable:
+    """Convert a filter value into a hashable value usable in a cache key.
+
+    Args:
+        value: Value to convert.
+
+    Returns:
+        A hashable representation of the value.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(val)) for key, val in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(val) for val in value)
+    return value
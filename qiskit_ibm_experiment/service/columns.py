@@ -0,0 +1,188 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Columnar representation of experiment service query results."""
+
+from collections import namedtuple
+from datetime import timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .constants import RESULT_QUALITY_FROM_API
+
+_OBJECT = "object"
+_BOOL = "bool"
+_FLOAT = "float"
+_DATETIME = "datetime"
+_RAGGED = "ragged"
+_QUALITY = "quality"
+
+EXPERIMENT_COLUMNS = {
+    "experiment_id": ("uuid", _OBJECT),
+    "experiment_type": ("type", _OBJECT),
+    "backend": ("device_name", _OBJECT),
+    "parent_id": ("parent_experiment_uuid", _OBJECT),
+    "tags": ("tags", _RAGGED),
+    "job_ids": ("jobs", _RAGGED),
+    "share_level": ("visibility", _OBJECT),
+    "metadata": ("extra", _OBJECT),
+    "figure_names": ("plot_names", _RAGGED),
+    "notes": ("notes", _OBJECT),
+    "hub": ("hub_id", _OBJECT),
+    "group": ("group_id", _OBJECT),
+    "project": ("project_id", _OBJECT),
+    "owner": ("owner", _OBJECT),
+    "creation_datetime": ("created_at", _DATETIME),
+    "start_datetime": ("start_time", _DATETIME),
+    "end_datetime": ("end_time", _DATETIME),
+    "updated_datetime": ("updated_at", _DATETIME),
+}
+"""Experiment columns, mapped to their API field and column type."""
+
+ANALYSIS_RESULT_COLUMNS = {
+    "result_id": ("uuid", _OBJECT),
+    "experiment_id": ("experiment_uuid", _OBJECT),
+    "result_type": ("type", _OBJECT),
+    "backend_name": ("device_name", _OBJECT),
+    "result_data": ("fit", _OBJECT),
+    "device_components": ("device_components", _RAGGED),
+    "quality": ("quality", _QUALITY),
+    "verified": ("verified", _BOOL),
+    "chisq": ("chisq", _FLOAT),
+    "tags": ("tags", _RAGGED),
+    "creation_datetime": ("created_at", _DATETIME),
+    "updated_datetime": ("updated_at", _DATETIME),
+}
+"""Analysis result columns, mapped to their API field and column type."""
+
+
+class RaggedColumn(namedtuple("RaggedColumn", ["values", "offsets"])):
+    """Column whose rows are variable length lists.
+
+    The values of all the rows are stored in a single flat array. The values of
+    row ``i`` are ``values[offsets[i]:offsets[i + 1]]``.
+    """
+
+    __slots__ = ()
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, idx: int) -> np.ndarray:  # type: ignore[override]
+        return self.values[self.offsets[idx] : self.offsets[idx + 1]]
+
+    def lengths(self) -> np.ndarray:
+        """Return the number of values in each row."""
+        return np.diff(self.offsets)
+
+
+class ColumnBuilder:
+    """Build columns from raw API records, without converting each record."""
+
+    def __init__(self, columns: Dict[str, Tuple[str, str]]) -> None:
+        """ColumnBuilder constructor.
+
+        Args:
+            columns: Column names mapped to their API field and column type.
+        """
+        self._columns = columns
+        self._data = {name: [] for name in columns}  # type: Dict[str, List]
+
+    def extend(self, records: Iterable[Dict]) -> None:
+        """Append raw API records to the columns.
+
+        Args:
+            records: Raw API records.
+        """
+        appenders = [
+            (self._data[name].append, field)
+            for name, (field, _) in self._columns.items()
+        ]
+        for record in records:
+            for append, field in appenders:
+                append(record.get(field))
+
+    def build(self) -> Dict[str, Union[np.ndarray, RaggedColumn]]:
+        """Return the columns built so far.
+
+        Returns:
+            The column names mapped to their values.
+        """
+        return {
+            name: _BUILDERS[kind](self._data[name])
+            for name, (_, kind) in self._columns.items()
+        }
+
+
+def _object_column(values: List[Any]) -> np.ndarray:
+    """Return an object array, keeping lists and dictionaries as single values."""
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def _bool_column(values: List[Optional[bool]]) -> np.ndarray:
+    """Return a boolean array, missing values being ``False``."""
+    return np.array([bool(value) for value in values], dtype=bool)
+
+
+def _float_column(values: List[Optional[float]]) -> np.ndarray:
+    """Return a float array, missing values being ``NaN``."""
+    return np.array(
+        [np.nan if value is None else value for value in values], dtype=float
+    )
+
+
+def _datetime_column(values: List[Optional[str]]) -> np.ndarray:
+    """Return a ``datetime64[ns]`` array of UTC timestamps, missing values being ``NaT``."""
+    return np.array([_utc_timestamp(value) for value in values], dtype="datetime64[ns]")
+
+
+def _ragged_column(values: List[Optional[List]]) -> RaggedColumn:
+    """Return a ragged column, missing values being empty rows."""
+    rows = [value or [] for value in values]
+    offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum([len(row) for row in rows], out=offsets[1:])
+    flat = [item for row in rows for item in row]
+    return RaggedColumn(_object_column(flat), offsets)
+
+
+def _quality_column(values: List[Optional[str]]) -> np.ndarray:
+    """Return an object array of result quality values, such as ``"GOOD"``."""
+    return _object_column(
+        [RESULT_QUALITY_FROM_API[value].value if value else None for value in values]
+    )
+
+
+def _utc_timestamp(timestamp: Optional[str]) -> str:
+    """Return a UTC timestamp without time zone, as expected by NumPy."""
+    if not timestamp:
+        return "NaT"
+    if timestamp.endswith("Z"):
+        return timestamp[:-1]
+    import dateutil.parser  # pylint: disable=import-outside-toplevel
+
+    parsed = dateutil.parser.isoparse(timestamp)
+    if parsed.tzinfo is None:
+        return timestamp
+    return parsed.astimezone(timezone.utc).replace(tzinfo=None).isoformat()
+
+
+_BUILDERS = {
+    _OBJECT: _object_column,
+    _BOOL: _bool_column,
+    _FLOAT: _float_column,
+    _DATETIME: _datetime_column,
+    _RAGGED: _ragged_column,
+    _QUALITY: _quality_column,
+}
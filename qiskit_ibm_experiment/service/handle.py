@@ -0,0 +1,90 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Picklable handles of experiment services."""
+
+import os
+import threading
+import uuid
+from typing import Any, Dict, Optional, Tuple, Type
+
+from ..accounts import Account
+
+# Services created from handles in this process, by handle ID.
+_SERVICES = {}  # type: Dict[str, Any]
+_SERVICES_LOCK = threading.Lock()
+
+
+class ServiceHandle:
+    """Picklable handle of an :class:`~qiskit_ibm_experiment.IBMExperimentService`.
+
+    A handle is returned by
+    :meth:`~qiskit_ibm_experiment.IBMExperimentService.handle`. It only holds the
+    account, the options and the access token of the service, so that it is
+    cheap to send to other processes, which get their own service with
+    :meth:`service`.
+    """
+
+    def __init__(
+        self,
+        service_class: Type,
+        account: Account,
+        session_options: Dict[str, Any],
+        options: Dict[str, Any],
+        access_token: Optional[Tuple[str, float, float]] = None,
+    ) -> None:
+        """ServiceHandle constructor.
+
+        Args:
+            service_class: Class of the service.
+            account: Account of the service.
+            session_options: Session options of the service.
+            options: Options of the service.
+            access_token: Access token of the service, with the times it should
+                be refreshed at and it expires at, if the service authenticated.
+        """
+        self.service_class = service_class
+        self.account = account
+        self.session_options = session_options
+        self.options = options
+        self.access_token = access_token
+        self.id = str(uuid.uuid4())  # pylint: disable=invalid-name
+
+    def service(self) -> Any:
+        """Return the service of the handle in the current process.
+
+        The service is created on the first call in each process, and then
+        shared by the copies of the handle in the process. It authenticates on
+        its first request, reusing the access token of the handle if it is
+        still valid.
+
+        Returns:
+            The service.
+        """
+        with _SERVICES_LOCK:
+            service = _SERVICES.get(self.id)
+            if service is None:
+                service = _SERVICES[self.id] = self.service_class._from_handle(self)
+            return service
+
+    def __repr__(self) -> str:
+        return f"<ServiceHandle {self.id} url={self.account.url}>"
+
+
+def _after_fork_in_child() -> None:
+    """Reset the lock of the services, which can be held by a thread of the parent."""
+    global _SERVICES_LOCK  # pylint: disable=global-statement
+    _SERVICES_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
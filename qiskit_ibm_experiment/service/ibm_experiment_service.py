@@ -12,28 +12,92 @@
 
 """IBM Quantum experiment service."""
 
+import contextvars
 import logging
+import os
+import weakref
 import json
 import copy
-from typing import Optional, List, Dict, Union, Tuple, Any, Type
+import itertools
+import threading
+import time
+import uuid
+from typing import (
+    Optional,
+    List,
+    Dict,
+    Union,
+    Tuple,
+    Any,
+    Type,
+    Callable,
+    Iterator,
+    Set,
+)
 from datetime import datetime
 from collections import defaultdict
-import requests
+from concurrent.futures import ThreadPoolExecutor, Future
 from .constants import (
     ExperimentShareLevel,
     ResultQuality,
-    RESULT_QUALITY_FROM_API,
     RESULT_QUALITY_TO_API,
     DEFAULT_BASE_URL,
 )
-from .utils import map_api_error, local_to_utc_str, utc_to_local
+from .utils import (
+    map_api_error,
+    local_to_utc,
+    local_to_utc_str,
+    utc_to_local,
+    setup_package_logger,
+)
 from .device_component import DeviceComponent
+from .cache import QueryCache, CacheInfo, freeze
+from .columns import ColumnBuilder, EXPERIMENT_COLUMNS, ANALYSIS_RESULT_COLUMNS
+from .records import ExperimentRecord, AnalysisResultRecord
+from .json_stream import StreamedPage
+from .handle import ServiceHandle
+from .uploads import UploadResult, api_error, batches
+from .write_queue import WriteQueue, WriteFailure
+from .pagination import (
+    QuerySpec,
+    SyncResult,
+    Watermark,
+    AdaptivePageSize,
+    page_size_for,
+    time_windows,
+    sort_key_for,
+    merge_sorted_streams,
+)
 from ..client.experiment import ExperimentClient
-from ..exceptions import RequestsApiError, IBMApiError
+from ..client.session import TransferStats
+from ..client.circuit_breaker import CircuitState
+from ..client.metrics import RequestMetrics
+from ..client.tracing import get_tracer, traced
+from ..client.token_manager import TokenManager
+from ..exceptions import (
+    RequestsApiError,
+    IBMApiError,
+    IBMError,
+    IBMExperimentEntryNotFound,
+)
 from ..accounts import AccountManager, Account, ProxyConfiguration
+from ..accounts.management import DEFAULT_TOKEN_CACHE_DIR
 
 logger = logging.getLogger(__name__)
 
+# Services of the process, whose threads are dropped after a fork.
+_SERVICES = weakref.WeakSet()  # type: weakref.WeakSet
+
+
+def _after_fork_in_child() -> None:
+    """Reset the services inherited from the parent process."""
+    for service in list(_SERVICES):
+        service._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
 
 class IBMExperimentService:
     """Provides experiment related services.
@@ -72,7 +136,21 @@ class IBMExperimentService:
     """
 
     _default_preferences = {"auto_save": False}
-    _default_options = {"prompt_for_delete": True}
+    _default_options = {
+        "prompt_for_delete": True,
+        "prefetch_pages": False,
+        "page_size": None,
+        "query_cache_size": 0,
+        "query_cache_ttl": 300,
+        "utc_timestamps": False,
+        "stream_pages": False,
+        "write_behind": False,
+        "write_queue_size": 1000,
+        "write_workers": 4,
+        "write_queue_timeout": None,
+        "on_write_error": None,
+    }
+    _MAX_BACKGROUND_WORKERS = 4
     _DEFAULT_AUTHENTICATION_PREFIX = "/v2/users/loginWithToken"
     _DEFAULT_EXPERIMENT_PREFIX = "/resultsdb"
 
@@ -84,6 +162,8 @@ class IBMExperimentService:
         proxies: Optional[dict] = None,
         verify: Optional[bool] = None,
         local: Optional[bool] = None,
+        session_options: Optional[Dict[str, Any]] = None,
+        lazy: bool = False,
         **kwargs,
     ) -> None:
         """IBMExperimentService constructor.
@@ -91,11 +171,143 @@ class IBMExperimentService:
         Args:
             token: the API token to use when establishing connection with the result DB
             url: the url for the result DB API
+            name: Name of a saved account to use.
+            proxies: Proxy configuration.
+            verify: Whether to verify the server's TLS certificate.
+            local: Whether to use the service without connecting to the result DB.
+                A local service does not store entries, and its requests to the
+                result DB raise :class:`~qiskit_ibm_experiment.exceptions.IBMApiError`.
+            session_options: Options of the HTTP session used to connect to the
+                result DB. Supported options are:
+
+                * ``pool_maxsize``: Maximum number of connections kept open to each
+                  host. Should be at least the number of threads using the service.
+                  Defaults to ``10``.
+                * ``pool_block``: Whether requests should wait for a free connection
+                  when ``pool_maxsize`` connections are in use, instead of opening
+                  connections that are discarded afterwards. Defaults to ``False``.
+                * ``pool_connections``: Number of hosts connection pools are kept
+                  for. Defaults to ``10``.
+                * ``host_pool_maxsize``: Dictionary mapping host names or URL
+                  prefixes, such as the object storage host files are uploaded to,
+                  to the maximum number of connections kept open to them.
+                * ``timeout``: Timeout of the requests, in the form of
+                  ``(connection_timeout, total_timeout)``.
+                * ``request_compression``: Content coding used to compress
+                  request bodies, either ``"gzip"``, or ``"br"`` and ``"zstd"``
+                  if the ``brotli`` and ``zstandard`` packages are installed.
+                  Defaults to ``None``, which does not compress requests.
+                * ``compress_min_size``: Minimum size of the request bodies to
+                  compress, in bytes. Defaults to ``1024``.
+                * ``http_cache_size``: Maximum size of the responses kept in
+                  memory to be revalidated with conditional requests, in bytes.
+                  The entries returned by :meth:`experiment`,
+                  :meth:`analysis_result` and :meth:`figure` are then only
+                  downloaded again when they changed. Lists of entries are not
+                  cached. Defaults to 16 MiB; ``0`` disables the cache.
+                * ``http_cache_dir``: Directory the cached responses are also
+                  stored in, to reuse them across processes. Defaults to
+                  ``None``, which only keeps them in memory.
+                * ``http_cache_disk_size``: Maximum size of the cached responses
+                  in ``http_cache_dir``, in bytes. Defaults to 256 MiB.
+                * ``retries_total``: Maximum number of retries of a request.
+                  Defaults to ``8``.
+                * ``retries_connect``: Maximum number of retries of a request
+                  after connection errors. Defaults to ``5``.
+                * ``backoff_factor``: Factor of the exponential backoff between
+                  retries, in seconds. Defaults to ``0.5``.
+                * ``backoff_max``: Maximum backoff between retries, in seconds.
+                  Defaults to ``120``.
+                * ``backoff_jitter``: Whether to wait a random time between zero
+                  and the backoff, so that clients do not retry in lockstep.
+                  Defaults to ``True``.
+                * ``retry_after_max``: Maximum time to wait when the server
+                  responds with a ``Retry-After`` header, in seconds. Defaults
+                  to ``300``.
+                * ``retry_budget_ratio``: Maximum number of retries per request,
+                  over the requests of the last ten seconds of all threads.
+                  Defaults to ``0.2``; ``None`` disables the budget.
+                * ``retry_budget_min_rate``: Number of retries per second
+                  allowed regardless of ``retry_budget_ratio``. Defaults to
+                  ``1``.
+                * ``circuit_breaker_threshold``: Number of consecutive failed
+                  requests to an endpoint family opening its circuit breaker.
+                  Defaults to ``5``; ``0`` disables the breakers. See
+                  :meth:`circuit_states`.
+                * ``circuit_breaker_timeout``: Number of seconds an open circuit
+                  breaker fails requests before letting one through. Defaults to
+                  ``30``.
+                * ``collect_metrics``: Whether to collect the request metrics
+                  returned by :meth:`metrics`. Defaults to ``False``.
+                * ``token_file_cache``: Whether to also cache the access tokens
+                  in files, so that processes using the same API token log in
+                  once. ``True`` stores them in the ``.qiskit`` directory of
+                  the saved accounts; a path stores them in that directory.
+                  Defaults to ``False``, which caches them in memory only.
+                * ``token_refresh_margin``: Number of seconds before its expiry
+                  an access token is replaced. Defaults to ``300``.
+
+                Requests are retried when the server responds with status
+                ``429`` or with a server error, and after connection errors.
+
+                The result DB and the other hosts use separate connection pools.
+            lazy: Whether to authenticate to the result DB on the first request,
+                or when calling :meth:`connect`, instead of in the constructor.
+                The account is still discovered and validated in the constructor.
+            **kwargs: Service options. Supported options are:
+
+                * ``prompt_for_delete``: Whether to ask for confirmation before
+                  deleting an entry from the database. Defaults to ``True``.
+                * ``prefetch_pages``: Whether paginated queries, such as
+                  :meth:`experiments`, should request the next page in a background
+                  thread while the current page is being processed.
+                  Defaults to ``False``.
+                * ``page_size``: Number of records requested per page by paginated
+                  queries. If ``None``, the server default is used. If ``"auto"``,
+                  the page size is adjusted based on the latency and size of the
+                  previous pages. Defaults to ``None``.
+                * ``query_cache_size``: Maximum number of :meth:`experiments` and
+                  :meth:`analysis_results` query results kept in an in-process cache.
+                  The cache is cleared whenever this service creates, updates or
+                  deletes an entry. Defaults to ``0``, which disables the cache.
+                * ``query_cache_ttl``: Number of seconds a cached query result stays
+                  valid, or ``None`` for no expiry. Defaults to ``300``.
+                * ``utc_timestamps``: Whether the timestamps of retrieved entries, such
+                  as ``creation_datetime``, are returned in UTC instead of being
+                  converted to the local time zone. Defaults to ``False``.
+                * ``stream_pages``: Whether paginated queries should decode each page
+                  while it is being downloaded, returning its records as soon as they
+                  are received instead of after the whole page is decoded. This
+                  reduces the memory used by large pages. Defaults to ``False``.
+                * ``write_behind``: Whether :meth:`create_experiment`,
+                  :meth:`update_experiment`, :meth:`create_analysis_result`,
+                  :meth:`update_analysis_result`, :meth:`create_figure`,
+                  :meth:`update_figure` and :meth:`file_upload` should queue their
+                  request and return without waiting for it. The queued writes are
+                  sent concurrently, except that an experiment is written before its
+                  analysis results, figures and files, and an entry is created
+                  before it is updated. Use :meth:`flush` to wait for the writes to
+                  complete. The queue is also
+                  flushed before entries are deleted, and when the service is
+                  closed. Defaults to ``False``.
+                * ``write_queue_size``: Maximum number of pending writes. Queuing a
+                  write waits for room in the queue once it is full. Read when the
+                  first write is queued. Defaults to ``1000``.
+                * ``write_workers``: Number of threads sending the queued writes.
+                  Read when the first write is queued. Defaults to ``4``.
+                * ``write_queue_timeout``: Number of seconds to wait for room in a
+                  full queue before raising
+                  :class:`~qiskit_ibm_experiment.IBMExperimentQueueFull`, or
+                  ``None`` to wait as long as needed. Defaults to ``None``.
+                * ``on_write_error``: Function called with a
+                  :class:`~qiskit_ibm_experiment.service.WriteFailure` when a queued
+                  write fails, from the thread that sent it. If ``None``, the
+                  failures are logged. Defaults to ``None``.
         """
         super().__init__()
         if url is None:
             url = DEFAULT_BASE_URL
-        self._account = self._discover_account(
+        account = self._discover_account(
             token=token,
             url=url,
             name=name,
@@ -103,25 +315,170 @@ class IBMExperimentService:
             verify=verify,
             local=local,
         )
+        self._setup(account, session_options, lazy, kwargs)
+
+    def _setup(
+        self,
+        account: Account,
+        session_options: Optional[Dict[str, Any]],
+        lazy: bool,
+        options: Dict[str, Any],
+    ) -> None:
+        """Setup the service for an account, as described in the constructor."""
+        setup_package_logger()
+        self._query_cache = None  # type: Optional[QueryCache]
+        # Whether the server has a batch endpoint, found out on first use.
+        self._bulk_upload = None  # type: Optional[bool]
+        self._write_queue = None  # type: Optional[WriteQueue]
+        self._executor = None  # type: Optional[ThreadPoolExecutor]
+        # Pending background requests, cancelled when the service is closed.
+        self._background = set()  # type: Set[Future]
+        self._executor_lock = threading.Lock()
+        self._account = account
         if self._account.preferences is None:
             self._account.preferences = copy.deepcopy(self._default_preferences)
-        if not self._account.local:
-            db_url = self._account.url + self._DEFAULT_EXPERIMENT_PREFIX
-            auth_url = self._account.url + self._DEFAULT_AUTHENTICATION_PREFIX
-
-            self.get_access_token(auth_url)
-
-            self._additional_params = {
-                "proxies": self._account.proxies.to_request_params()
-                if self._account.proxies is not None
-                else None,
-                "verify": self._account.verify,
-            }
-            self._api_client = ExperimentClient(
-                self._access_token, db_url, self._additional_params
+        self._session_options = dict(session_options or {})
+        session_options = dict(self._session_options)
+        token_file_cache = session_options.pop("token_file_cache", False)
+        if token_file_cache is True:
+            token_file_cache = DEFAULT_TOKEN_CACHE_DIR
+        self._token_cache_dir = token_file_cache or None
+        self._token_refresh_margin = session_options.pop("token_refresh_margin", 300.0)
+        self._token_manager = None  # type: Optional[TokenManager]
+        self._additional_params = {
+            "proxies": self._account.proxies.to_request_params()
+            if self._account.proxies is not None
+            else None,
+            "verify": self._account.verify,
+            **session_options,
+        }
+        self._client = None  # type: Optional[ExperimentClient]
+        self._connect_lock = threading.Lock()
+        if not self._account.local and not lazy:
+            self.connect()
+        self.options = copy.deepcopy(self._default_options)
+        self.set_option(**options)
+        _SERVICES.add(self)
+
+    @classmethod
+    def _from_handle(cls, handle: ServiceHandle) -> "IBMExperimentService":
+        """Return a new lazy service using the account and options of a handle."""
+        if handle.access_token is not None:
+            TokenManager(
+                handle.account.url + cls._DEFAULT_AUTHENTICATION_PREFIX,
+                handle.account.token,
+            ).seed(handle.access_token)
+        service = cls.__new__(cls)
+        service._setup(
+            copy.deepcopy(handle.account),
+            handle.session_options,
+            lazy=True,
+            options=handle.options,
+        )
+        return service
+
+    def handle(self) -> ServiceHandle:
+        """Return a picklable handle of the service, to use it in other processes.
+
+        The handle only holds the account, the options and the current access
+        token of the service, so that it is cheap to send to the workers of a
+        process pool. Each process creates its own service from the handle, on
+        first use, reusing the access token instead of authenticating again::
+
+            def _experiment(handle, experiment_id):
+                return handle.service().experiment(experiment_id)
+
+            handle = service.handle()
+            with ProcessPoolExecutor() as executor:
+                experiments = list(
+                    executor.map(_experiment, repeat(handle), experiment_ids)
+                )
+
+        Returns:
+            The handle.
+
+        Raises:
+            ValueError: If the service is local, since its entries are only
+                stored in the memory of this process.
+        """
+        if self._account.local:
+            raise ValueError("A local service cannot be used in other processes.")
+        access_token = None
+        if self._token_manager is not None:
+            access_token = self._token_manager.cached()
+        # The error callback of the write queue belongs to this process.
+        options = {
+            name: value
+            for name, value in self.options.items()
+            if name != "on_write_error"
+        }
+        return ServiceHandle(
+            type(self),
+            copy.deepcopy(self._account),
+            dict(self._session_options),
+            copy.deepcopy(options),
+            access_token,
+        )
+
+    def __reduce_ex__(self, protocol: int) -> Any:
+        raise TypeError(
+            "IBMExperimentService cannot be pickled. "
+            "Use IBMExperimentService.handle() to use it in other processes."
+        )
+
+    def __copy__(self) -> "IBMExperimentService":
+        # The service is shared, like the connections and threads it holds.
+        return self
+
+    def __deepcopy__(self, memo: Dict) -> "IBMExperimentService":
+        return self
+
+    def _after_fork(self) -> None:
+        """Drop the threads and locks of the parent process after a fork."""
+        self._executor = None
+        self._background = set()
+        self._executor_lock = threading.Lock()
+        self._connect_lock = threading.Lock()
+        self._query_cache = None
+        self._write_queue = None
+
+    def connect(self) -> None:
+        """Authenticate to the result DB, if not done yet.
+
+        Services created with ``lazy=True`` authenticate on their first request.
+        Calling this method authenticates beforehand, for example to report
+        invalid credentials early.
+
+        Raises:
+            IBMApiError: If the authentication failed, or the service is local.
+        """
+        with self._connect_lock:
+            if self._client is not None:
+                return
+            if self._account.local:
+                raise IBMApiError("A local service cannot connect to the result DB.")
+            self.get_access_token(
+                self._account.url + self._DEFAULT_AUTHENTICATION_PREFIX
             )
-        self.options = self._default_options
-        self.set_option(**kwargs)
+            self._client = ExperimentClient(
+                self._access_token,
+                self._account.url + self._DEFAULT_EXPERIMENT_PREFIX,
+                dict(self._additional_params, token_manager=self._token_manager),
+            )
+
+    @property
+    def _api_client(self) -> ExperimentClient:
+        """Return the client, authenticating first if needed."""
+        client = self._client
+        if client is None:
+            self.connect()
+            client = self._client
+        return client
+
+    @_api_client.setter
+    def _api_client(self, client: ExperimentClient) -> None:
+        """Set the client."""
+        self._client = client
 
     def set_option(self, **kwargs):
         """Sets the options given as keywords"""
@@ -131,23 +488,31 @@ class IBMExperimentService:
 
     def get_access_token(self, auth_url, api_token=None):
         """Authenticates to the server with the API token, receiving access token
-        for the current session"""
+        for the current session.
+
+        Access tokens are cached, and shared by the services of the process using
+        the same API token. The service requests a new access token before the
+        current one expires, or when the server rejects it.
+        """
         if api_token is None:
             try:
                 api_token = self._account.token
             except RuntimeError:
                 raise IBMApiError("No API token; cannot connect to service")
-        headers = {"accept": "application/json", "Content-Type": "application/json"}
-        data = {"apiToken": api_token}
-        try:
-            response = requests.post(url=auth_url, json=data, headers=headers)
-            access_token = response.json()["id"]
-        except KeyError:
-            raise IBMApiError(
-                "Did not receive access token (request returned {})".format(
-                    response.json()
-                )
-            )
+        if self._token_manager is not None:
+            self._token_manager.close()
+        self._token_manager = TokenManager(
+            auth_url,
+            api_token,
+            proxies=self._account.proxies.to_request_params()
+            if self._account.proxies is not None
+            else None,
+            verify=self._account.verify,
+            cache_dir=self._token_cache_dir,
+            refresh_margin=self._token_refresh_margin,
+        )
+        with map_api_error("Authentication failed."):
+            access_token = self._token_manager.token()
         self._access_token = access_token
         return access_token
 
@@ -229,6 +594,7 @@ class IBMExperimentService:
 
         return account
 
+    @traced("IBMExperimentService.backends")
     def backends(self) -> List[Dict]:
         """Return a list of backends that can be used for experiments.
 
@@ -237,6 +603,7 @@ class IBMExperimentService:
         """
         return self._api_client.devices()
 
+    @traced("IBMExperimentService.create_experiment")
     def create_experiment(
         self,
         experiment_type: str,
@@ -296,6 +663,10 @@ class IBMExperimentService:
                 kwargs.keys(),
             )
 
+        if experiment_id is None and self.options["write_behind"]:
+            # The ID is returned before the experiment is created.
+            experiment_id = str(uuid.uuid4())
+
         data = {
             "type": experiment_type,
             "device_name": backend_name,
@@ -316,12 +687,17 @@ class IBMExperimentService:
             )
         )
 
-        with map_api_error(f"Experiment {experiment_id} creation failed."):
-            response_data = self._api_client.experiment_upload(
-                json.dumps(data, cls=json_encoder)
-            )
-        return response_data["uuid"]
+        request = json.dumps(data, cls=json_encoder)
+
+        def _create() -> str:
+            with map_api_error(f"Experiment {experiment_id} creation failed."):
+                response_data = self._api_client.experiment_upload(request)
+            self.clear_query_cache()
+            return response_data["uuid"]
 
+        return self._write(experiment_id, "create_experiment", _create, experiment_id)
+
+    @traced("IBMExperimentService.update_experiment")
     def update_experiment(
         self,
         experiment_id: str,
@@ -380,10 +756,14 @@ class IBMExperimentService:
             logger.warning("update_experiment() called with nothing to update.")
             return
 
-        with map_api_error(f"Experiment {experiment_id} update failed."):
-            self._api_client.experiment_update(
-                experiment_id, json.dumps(data, cls=json_encoder)
-            )
+        request = json.dumps(data, cls=json_encoder)
+
+        def _update() -> None:
+            with map_api_error(f"Experiment {experiment_id} update failed."):
+                self._api_client.experiment_update(experiment_id, request)
+            self.clear_query_cache()
+
+        self._write(experiment_id, "update_experiment", _update)
 
     def _experiment_data_to_api(
         self,
@@ -436,6 +816,7 @@ class IBMExperimentService:
             data["end_time"] = local_to_utc_str(end_dt)
         return data
 
+    @traced("IBMExperimentService.experiment")
     def experiment(
         self,
         experiment_id: str,
@@ -458,6 +839,7 @@ class IBMExperimentService:
             raw_data = self._api_client.experiment_get(experiment_id)
         return self._api_to_experiment_data(json.loads(raw_data, cls=json_decoder))
 
+    @traced("IBMExperimentService.experiments")
     def experiments(
         self,
         limit: Optional[int] = 10,
@@ -480,8 +862,10 @@ class IBMExperimentService:
         mine_only: Optional[bool] = False,
         parent_id: Optional[str] = None,
         sort_by: Optional[Union[str, List[str]]] = None,
+        shards: Optional[int] = None,
+        as_columns: bool = False,
         **filters: Any,
-    ) -> List[Dict]:
+    ) -> Union[List[Dict], Dict[str, Any]]:
         """Retrieve all experiments, with optional filtering.
 
         By default, results returned are as inclusive as possible. For example,
@@ -554,17 +938,242 @@ class IBMExperimentService:
                 ascending order, then by start datetime by descending order.
                 By default, experiments are sorted by ``start_datetime``
                 descending and ``experiment_id`` ascending.
+            shards: If specified, the time range given by `start_datetime_after` and
+                `start_datetime_before` is split into this many windows, which are
+                retrieved concurrently and merged back in `sort_by` order.
+                `start_datetime_after` must be specified in this case, and
+                `start_datetime_before` defaults to the current time.
+            as_columns: If ``True``, return the experiments as columns instead of
+                a list of dictionaries. Columns are built directly from the server
+                response, which is much faster for large numbers of experiments.
+                Timestamps are returned as ``datetime64[ns]`` arrays in UTC, and
+                list fields, such as ``tags``, as
+                :class:`~qiskit_ibm_experiment.service.RaggedColumn`.
+                Cannot be combined with `shards`.
             **filters: Additional filtering keywords that are not supported and will be ignored.
 
         Returns:
             A list of experiments. Each experiment is a dictionary containing the
-            retrieved experiment data.
+            retrieved experiment data. If `as_columns` is ``True``, a dictionary
+            mapping each experiment field to the array of its values.
 
         Raises:
             ValueError: If an invalid parameter value is specified.
             IBMApiError: If the request to the server failed.
         """
         # pylint: disable=arguments-differ
+        query = self._experiments_query(
+            limit=limit,
+            device_components=device_components,
+            device_components_operator=device_components_operator,
+            experiment_type=experiment_type,
+            experiment_type_operator=experiment_type_operator,
+            backend_name=backend_name,
+            tags=tags,
+            tags_operator=tags_operator,
+            start_datetime_after=start_datetime_after,
+            start_datetime_before=start_datetime_before,
+            hub=hub,
+            group=group,
+            project=project,
+            exclude_public=exclude_public,
+            public_only=public_only,
+            exclude_mine=exclude_mine,
+            mine_only=mine_only,
+            parent_id=parent_id,
+            sort_by=sort_by,
+            **filters,
+        )
+        if as_columns:
+            return self._column_query(query, limit, json_decoder, shards)
+        return self._cached_query(query, limit, json_decoder, shards)
+
+    def iter_experiments(
+        self,
+        limit: Optional[int] = None,
+        json_decoder: Type[json.JSONDecoder] = json.JSONDecoder,
+        device_components: Optional[List[Union[str, DeviceComponent]]] = None,
+        device_components_operator: Optional[str] = None,
+        experiment_type: Optional[str] = None,
+        experiment_type_operator: Optional[str] = None,
+        backend_name: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        tags_operator: Optional[str] = "OR",
+        start_datetime_after: Optional[datetime] = None,
+        start_datetime_before: Optional[datetime] = None,
+        hub: Optional[str] = None,
+        group: Optional[str] = None,
+        project: Optional[str] = None,
+        exclude_public: Optional[bool] = False,
+        public_only: Optional[bool] = False,
+        exclude_mine: Optional[bool] = False,
+        mine_only: Optional[bool] = False,
+        parent_id: Optional[str] = None,
+        sort_by: Optional[Union[str, List[str]]] = None,
+        shards: Optional[int] = None,
+        **filters: Any,
+    ) -> Iterator[Dict]:
+        """Iterate over experiments, with optional filtering.
+
+        This accepts the same filters as :meth:`experiments`, but instead of
+        building a list of all matching experiments it returns a generator.
+        Experiments are retrieved from the server one page at a time, and the
+        next page is only requested once the current one has been consumed.
+
+        Args:
+            limit: Number of experiments to retrieve. ``None`` indicates no limit.
+            json_decoder: Custom JSON decoder to use to decode the retrieved experiments.
+            device_components: Filter by device components.
+            device_components_operator: Operator used when filtering by device components.
+            experiment_type: Experiment type used for filtering.
+            experiment_type_operator: Operator used when filtering by experiment type.
+            backend_name: Backend name used for filtering.
+            tags: Filter by tags assigned to experiments.
+            tags_operator: Logical operator to use when filtering by tags.
+            start_datetime_after: Filter by the given start timestamp, in local time.
+            start_datetime_before: Filter by the given start timestamp, in local time.
+            hub: Filter by hub.
+            group: Filter by hub and group.
+            project: Filter by hub, group, and project.
+            exclude_public: If ``True``, public experiments will not be returned.
+            public_only: If ``True``, only public experiments will be returned.
+            exclude_mine: If ``True``, experiments where I am the owner will not be returned.
+            mine_only: If ``True``, only experiments where I am the owner will be returned.
+            parent_id: Filter experiments by this parent experiment ID.
+            sort_by: Specifies how the output should be sorted.
+            shards: Number of time windows to retrieve concurrently.
+            **filters: Additional filtering keywords that are not supported and will be ignored.
+
+        Returns:
+            A generator of experiments. Each experiment is a dictionary containing the
+            retrieved experiment data.
+
+        Raises:
+            ValueError: If an invalid parameter value is specified.
+        """
+        query = self._experiments_query(
+            limit=limit,
+            device_components=device_components,
+            device_components_operator=device_components_operator,
+            experiment_type=experiment_type,
+            experiment_type_operator=experiment_type_operator,
+            backend_name=backend_name,
+            tags=tags,
+            tags_operator=tags_operator,
+            start_datetime_after=start_datetime_after,
+            start_datetime_before=start_datetime_before,
+            hub=hub,
+            group=group,
+            project=project,
+            exclude_public=exclude_public,
+            public_only=public_only,
+            exclude_mine=exclude_mine,
+            mine_only=mine_only,
+            parent_id=parent_id,
+            sort_by=sort_by,
+            **filters,
+        )
+        return self._run_query(query, limit, json_decoder, shards)
+
+    @traced("IBMExperimentService.sync_experiments")
+    def sync_experiments(
+        self,
+        since: Optional[Union[str, datetime, Watermark]] = None,
+        json_decoder: Type[json.JSONDecoder] = json.JSONDecoder,
+        **filters: Any,
+    ) -> SyncResult:
+        """Retrieve the experiments that changed since a watermark.
+
+        This is meant for keeping a local copy of the experiments up to date. The
+        first call, without `since`, returns all the experiments matching the
+        filters. Subsequent calls pass the watermark returned by the previous call
+        and only receive the experiments created or updated after it::
+
+            records, watermark = service.sync_experiments(backend_name="ibmq_lima")
+            ...
+            changes, watermark = service.sync_experiments(
+                since=watermark, backend_name="ibmq_lima"
+            )
+
+        Deleted experiments are not reported.
+
+        The watermark holds the latest update time of the returned experiments,
+        and the IDs of the experiments updated at that time. Experiments updated
+        at the same time but not yet returned, for instance because they were
+        updated in the same clock tick after the previous call, are returned by
+        the next call, while the others are not returned twice.
+
+        Args:
+            since: Watermark returned by the previous call, or timestamp in local
+                time. With a timestamp, the experiments updated at or after it are
+                returned. If ``None``, all the experiments matching the filters
+                are returned.
+            json_decoder: Custom JSON decoder to use to decode the retrieved experiments.
+            **filters: Filters accepted by :meth:`experiments`, except for ``limit``.
+
+        Returns:
+            The changed experiments and the new watermark, which is `since`
+            if no experiment changed, and ``None`` if there is no experiment.
+
+        Raises:
+            ValueError: If an invalid parameter value is specified.
+        """
+        return self._sync(self._experiments_query(**filters), since, json_decoder)
+
+    def _experiments_query(
+        self,
+        limit: Optional[int] = None,
+        device_components: Optional[List[Union[str, DeviceComponent]]] = None,
+        device_components_operator: Optional[str] = None,
+        experiment_type: Optional[str] = None,
+        experiment_type_operator: Optional[str] = None,
+        backend_name: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        tags_operator: Optional[str] = "OR",
+        start_datetime_after: Optional[datetime] = None,
+        start_datetime_before: Optional[datetime] = None,
+        hub: Optional[str] = None,
+        group: Optional[str] = None,
+        project: Optional[str] = None,
+        exclude_public: Optional[bool] = False,
+        public_only: Optional[bool] = False,
+        exclude_mine: Optional[bool] = False,
+        mine_only: Optional[bool] = False,
+        parent_id: Optional[str] = None,
+        sort_by: Optional[Union[str, List[str]]] = None,
+        **filters: Any,
+    ) -> QuerySpec:
+        """Validate experiment filters and convert them to server format.
+
+        Args:
+            limit: Number of experiments to retrieve.
+            device_components: Filter by device components.
+            device_components_operator: Operator used when filtering by device components.
+            experiment_type: Experiment type used for filtering.
+            experiment_type_operator: Operator used when filtering by experiment type.
+            backend_name: Backend name used for filtering.
+            tags: Filter by tags assigned to experiments.
+            tags_operator: Logical operator to use when filtering by tags.
+            start_datetime_after: Filter by the given start timestamp, in local time.
+            start_datetime_before: Filter by the given start timestamp, in local time.
+            hub: Filter by hub.
+            group: Filter by hub and group.
+            project: Filter by hub, group, and project.
+            exclude_public: Whether to exclude public experiments.
+            public_only: Whether to only return public experiments.
+            exclude_mine: Whether to exclude experiments where I am the owner.
+            mine_only: Whether to only return experiments where I am the owner.
+            parent_id: Filter experiments by this parent experiment ID.
+            sort_by: Specifies how the output should be sorted.
+            **filters: Additional filtering keywords that are not supported and will be ignored.
+
+        Returns:
+            The experiments query.
+
+        Raises:
+            ValueError: If an invalid parameter value is specified.
+        """
+        # pylint: disable=arguments-differ
         if filters:
             logger.info(
                 "Keywords %s are not supported by IBM Quantum experiment service "
@@ -611,99 +1220,621 @@ class IBMExperimentService:
             item_type_operator=experiment_type_operator,
         )
 
-        experiments = []
-        marker = None
-        while limit is None or limit > 0:
-            with map_api_error(f"Request failed."):
-                response = self._api_client.experiments(
-                    limit=limit,
-                    marker=marker,
-                    backend_name=backend_name,
-                    experiment_type=converted["type"],
-                    start_time=start_time_filters,
-                    device_components=converted["device_components"],
-                    tags=converted["tags"],
-                    hub=hub,
-                    group=group,
-                    project=project,
-                    exclude_public=exclude_public,
-                    public_only=public_only,
-                    exclude_mine=exclude_mine,
-                    mine_only=mine_only,
-                    parent_id=parent_id,
-                    sort_by=converted["sort_by"],
-                )
-            raw_data = json.loads(response, cls=json_decoder)
-            marker = raw_data.get("marker")
-            for exp in raw_data["experiments"]:
-                experiments.append(self._api_to_experiment_data(exp))
-            if limit:
-                limit -= len(raw_data["experiments"])
-            if not marker:  # No more experiments to return.
-                break
-        return experiments
+        params = {
+            "backend_name": backend_name,
+            "experiment_type": converted["type"],
+            "start_time": start_time_filters,
+            "device_components": converted["device_components"],
+            "tags": converted["tags"],
+            "hub": hub,
+            "group": group,
+            "project": project,
+            "exclude_public": exclude_public,
+            "public_only": public_only,
+            "exclude_mine": exclude_mine,
+            "mine_only": mine_only,
+            "parent_id": parent_id,
+            "sort_by": converted["sort_by"],
+        }
+        return QuerySpec(
+            kind="experiments",
+            params=params,
+            time_filter=("start_time", start_datetime_after, start_datetime_before),
+            sort_by=sort_by or ["start_datetime:desc"],
+        )
 
-    def _api_to_experiment_data(
+    def _run_query(
         self,
-        raw_data: Dict,
-    ) -> Dict:
-        """Convert API response to experiment data.
+        query: QuerySpec,
+        limit: Optional[int],
+        json_decoder: Type[json.JSONDecoder],
+        shards: Optional[int] = None,
+        raw: bool = False,
+    ) -> Iterator[Dict]:
+        """Run a query, returning a generator of the converted records.
 
         Args:
-            raw_data: API response
+            query: The query to run.
+            limit: Number of records to retrieve. ``None`` indicates no limit.
+            json_decoder: Custom JSON decoder to use to decode the retrieved records.
+            shards: Number of time windows to retrieve concurrently, if any.
+            raw: Whether to return the records as received from the server.
+
+        Returns:
+            A generator of converted records.
+
+        Raises:
+            ValueError: If raw records are requested from a sharded query.
+        """
+        if query.kind == "experiments":
+            fetch = self._api_client.experiments
+            converter = self._api_to_experiment_data
+            id_field = "experiment_id"
+        else:
+            fetch = self._api_client.analysis_results
+            converter = self._api_to_analysis_result
+            id_field = "result_id"
+        if raw:
+            if shards is not None:
+                raise ValueError("Sharded queries cannot return raw records.")
+            converter = None
+        if shards is not None:
+            return self._sharded_paginate(
+                fetch=fetch,
+                query=query.params,
+                time_filter=query.time_filter,
+                shards=shards,
+                sort_by=query.sort_by,
+                id_field=id_field,
+                records_key=query.kind,
+                converter=converter,
+                limit=limit,
+                json_decoder=json_decoder,
+            )
+        return self._paginate(
+            fetch=fetch,
+            query=query.params,
+            records_key=query.kind,
+            converter=converter,
+            limit=limit,
+            json_decoder=json_decoder,
+        )
+
+    def _sync(
+        self,
+        query: QuerySpec,
+        since: Optional[Union[str, datetime, Watermark]],
+        json_decoder: Type[json.JSONDecoder],
+    ) -> SyncResult:
+        """Run a query, only keeping the records updated after a watermark.
+
+        Args:
+            query: The query to run.
+            since: Watermark, or timestamp in local time. ``None`` keeps all the
+                records.
+            json_decoder: Custom JSON decoder to use to decode the retrieved records.
+
+        Returns:
+            The records updated after the watermark and the new watermark.
+        """
+        id_key = "experiment_id" if query.kind == "experiments" else "result_id"
+        timestamp, seen = None, frozenset()
+        if isinstance(since, Watermark):
+            timestamp, seen = since
+        elif since:
+            timestamp = utc_to_local(local_to_utc(since))
+        if timestamp is not None:
+            # Servers that do not support filtering by update time ignore this
+            # parameter, so the records are filtered again below. The filter
+            # includes the watermark, so that records updated in the same tick
+            # as the last synced ones are not missed.
+            params = dict(query.params)
+            params["updated_at"] = ["ge:{}".format(local_to_utc_str(timestamp))]
+            query = query._replace(params=params)
+        records = []
+        new_timestamp, new_seen = timestamp, set(seen)
+        for record in self._run_query(query, None, json_decoder):
+            updated = record.get("updated_datetime") or record.get("creation_datetime")
+            if timestamp is not None and (
+                updated is None
+                or updated < timestamp
+                or (updated == timestamp and record.get(id_key) in seen)
+            ):
+                continue
+            records.append(record)
+            if updated is None:
+                continue
+            if new_timestamp is None or updated > new_timestamp:
+                new_timestamp, new_seen = updated, set()
+            if updated == new_timestamp:
+                new_seen.add(record.get(id_key))
+        if new_timestamp is None:
+            return SyncResult(records, None)
+        return SyncResult(records, Watermark(new_timestamp, frozenset(new_seen)))
+
+    def _column_query(
+        self,
+        query: QuerySpec,
+        limit: Optional[int],
+        json_decoder: Type[json.JSONDecoder],
+        shards: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Run a query, returning the records as columns.
+
+        Args:
+            query: The query to run.
+            limit: Number of records to retrieve. ``None`` indicates no limit.
+            json_decoder: Custom JSON decoder to use to decode the retrieved records.
+            shards: Number of time windows to retrieve concurrently, if any.
+
+        Returns:
+            The record fields mapped to the array of their values.
+
+        Raises:
+            ValueError: If `shards` is specified.
+        """
+        if shards is not None:
+            raise ValueError("`as_columns` cannot be combined with `shards`.")
+        builder = ColumnBuilder(
+            EXPERIMENT_COLUMNS
+            if query.kind == "experiments"
+            else ANALYSIS_RESULT_COLUMNS
+        )
+        builder.extend(self._run_query(query, limit, json_decoder, raw=True))
+        return builder.build()
+
+    def _cached_query(
+        self,
+        query: QuerySpec,
+        limit: Optional[int],
+        json_decoder: Type[json.JSONDecoder],
+        shards: Optional[int] = None,
+    ) -> List[Dict]:
+        """Run a query, using the query cache if it is enabled.
+
+        Args:
+            query: The query to run.
+            limit: Number of records to retrieve. ``None`` indicates no limit.
+            json_decoder: Custom JSON decoder to use to decode the retrieved records.
+            shards: Number of time windows to retrieve concurrently, if any.
 
         Returns:
-            Converted experiment data.
+            A list of converted records.
         """
-        backend_name = raw_data["device_name"]
-        # should decide whether the wanted functionality is returning
-        # an actual backend (requires a given provider) or simply the name
-        # backend = self._provider.get_backend(backend_name)
-        backend = backend_name
-
-        extra_data: Dict[str, Any] = {}
-        self._convert_dt(
-            raw_data.get("created_at", None), extra_data, "creation_datetime"
+        cache = self._get_query_cache()
+        if cache is None:
+            return list(self._run_query(query, limit, json_decoder, shards))
+        key = (
+            query.kind,
+            freeze(query.params),
+            limit,
+            json_decoder,
+            shards,
+            self.options["utc_timestamps"],
         )
-        self._convert_dt(raw_data.get("start_time", None), extra_data, "start_datetime")
-        self._convert_dt(raw_data.get("end_time", None), extra_data, "end_datetime")
-        self._convert_dt(
-            raw_data.get("updated_at", None), extra_data, "updated_datetime"
+        records = cache.get(key)
+        if records is None:
+            records = list(self._run_query(query, limit, json_decoder, shards))
+            cache.put(key, records)
+        # Return copies so that callers modifying the records do not modify the cache.
+        return [record.copy() for record in records]
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the executor of background requests, creating it if needed."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._MAX_BACKGROUND_WORKERS,
+                    thread_name_prefix="ibm_experiment",
+                )
+            return self._executor
+
+    def _submit_background(self, function: Callable, *args: Any) -> Future:
+        """Call a function on a background thread, in the context of the caller.
+
+        Running the function in the context of the caller gives its trace spans
+        the right parent.
+        """
+        future = self._get_executor().submit(
+            contextvars.copy_context().run, function, *args
         )
+        with self._executor_lock:
+            self._background.add(future)
+        future.add_done_callback(self._discard_background)
+        return future
 
-        out_dict = {
-            "experiment_type": raw_data["type"],
-            "backend": backend,
-            "experiment_id": raw_data["uuid"],
-            "parent_id": raw_data.get("parent_experiment_uuid", None),
-            "tags": raw_data.get("tags", None),
-            "job_ids": raw_data["jobs"],
-            "share_level": raw_data.get("visibility", None),
-            "metadata": raw_data.get("extra", None),
-            "figure_names": raw_data.get("plot_names", None),
-            "notes": raw_data.get("notes", ""),
-            "hub": raw_data.get("hub_id", ""),
-            "group": raw_data.get("group_id", ""),
-            "project": raw_data.get("project_id", ""),
-            "owner": raw_data.get("owner", ""),
-            **extra_data,
-        }
-        return out_dict
+    def _discard_background(self, future: Future) -> None:
+        """Forget a completed background request."""
+        with self._executor_lock:
+            self._background.discard(future)
 
-    def _convert_dt(
-        self, timestamp: Optional[str], data: Dict, field_name: str
-    ) -> None:
-        """Convert input timestamp.
+    def close(self) -> None:
+        """Close the connections of the service.
+
+        The service can be used from multiple threads, each using its own
+        connections to the result DB. This closes the connections of all the
+        threads, and stops the threads used for background requests. The service
+        can still be used afterwards, in which case new connections are opened.
+        The writes queued with the ``write_behind`` option are sent first.
+
+        The service can also be used as a context manager, closing it on exit::
+
+            with IBMExperimentService() as service:
+                experiments = service.experiments()
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+            pending, self._background = self._background, set()
+            write_queue, self._write_queue = self._write_queue, None
+        if write_queue is not None:
+            write_queue.close()
+        if executor is not None:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+        if self._client is not None:
+            self._client.close()
+        if self._token_manager is not None:
+            self._token_manager.close()
+
+    def _get_write_queue(self) -> Optional[WriteQueue]:
+        """Return the write queue, if the ``write_behind`` option is enabled."""
+        if not self.options["write_behind"]:
+            return None
+        with self._executor_lock:
+            if self._write_queue is None:
+                self._write_queue = WriteQueue(
+                    max_pending=self.options["write_queue_size"],
+                    max_workers=self.options["write_workers"],
+                    on_error=self._write_failed,
+                )
+            return self._write_queue
+
+    def _write(
+        self,
+        key: Any,
+        operation: str,
+        function: Callable[[], Any],
+        result: Any = None,
+        after: Optional[str] = None,
+    ) -> Any:
+        """Run a write, or queue it with the ``write_behind`` option.
 
         Args:
-            timestamp: Timestamp to be converted.
-            data: Data used to stored the converted timestamp.
-            field_name: Name used to store the converted timestamp.
+            key: Key of the entry written, such as its ID.
+            operation: Name of the write.
+            function: Function sending the write.
+            result: Value returned if the write is queued.
+            after: ID of the experiment that must be written first, if any.
+
+        Returns:
+            The value returned by `function`, or `result` if the write is queued.
         """
-        if not timestamp:
-            return
-        data[field_name] = utc_to_local(timestamp)
+        queue = self._get_write_queue()
+        if queue is None:
+            return function()
+        queue.submit(
+            key,
+            operation,
+            function,
+            after=after,
+            timeout=self.options["write_queue_timeout"],
+        )
+        return result
+
+    def _write_failed(self, failure: WriteFailure) -> None:
+        """Report a queued write that failed."""
+        callback = self.options["on_write_error"]
+        if callback is None:
+            logger.error(
+                "Background %s of %s failed: %s",
+                failure.operation,
+                failure.key,
+                failure.error,
+            )
+        else:
+            callback(failure)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the writes queued with the ``write_behind`` option to be sent.
+
+        Args:
+            timeout: Maximum number of seconds to wait. ``None`` waits until all
+                the writes are sent.
+
+        Returns:
+            Whether all the writes were sent. Failed writes are reported to the
+            ``on_write_error`` callback.
+        """
+        queue = self._write_queue
+        if queue is None:
+            return True
+        return queue.flush(timeout)
+
+    def pending(self) -> int:
+        """Return the number of writes queued with the ``write_behind`` option.
+
+        Returns:
+            The number of writes not sent yet, including those being sent.
+        """
+        queue = self._write_queue
+        if queue is None:
+            return 0
+        return queue.pending()
+
+    def metrics(self) -> Optional[RequestMetrics]:
+        """Return the metrics of the requests sent by the service.
+
+        Metrics are collected when the ``collect_metrics`` session option is set.
+        They include the number of requests, errors and retries, the request and
+        response body bytes, and a histogram of the request latencies, by
+        endpoint URL template and HTTP method::
+
+            service = IBMExperimentService(session_options={"collect_metrics": True})
+            ...
+            for (endpoint, method), metrics in service.metrics().snapshot().items():
+                print(endpoint, method, metrics.requests, metrics.latency_sum)
+            print(service.metrics().to_prometheus())
+            service.metrics().reset()
+
+        Returns:
+            The metrics collector, or ``None`` if metrics are not collected or
+            the service did not connect yet.
+        """
+        if self._client is None:
+            return None
+        return self._client.metrics()
+
+    def circuit_states(self) -> Dict[str, CircuitState]:
+        """Return the states of the circuit breakers of the result DB endpoints.
+
+        Requests to the ``experiments``, ``analysis_results``, ``plots`` and
+        ``files`` endpoints each go through a circuit breaker. After repeated
+        failures, such as server errors persisting through the retries, the
+        breaker of the endpoint family opens and its requests fail immediately
+        with :class:`~qiskit_ibm_experiment.IBMExperimentCircuitOpen`, while the
+        other endpoints keep being used. After the ``circuit_breaker_timeout``
+        session option, one request is let through, closing the breaker if it
+        succeeds.
+
+        Returns:
+            The state of each breaker by endpoint family, or an empty dictionary
+            if the breakers are disabled or the service did not connect yet.
+        """
+        if self._client is None:
+            return {}
+        return self._client.circuit_states()
+
+    def transfer_stats(self, reset: bool = False) -> Optional[TransferStats]:
+        """Return the number of requests and bytes transferred by the service.
 
+        The counts include the requests of all threads. Comparing the transferred
+        and uncompressed body sizes shows the savings of compression::
+
+            stats = service.transfer_stats()
+            saved = stats.body_bytes_received - stats.bytes_received
+
+        Args:
+            reset: Whether to reset the counts afterwards.
+
+        Returns:
+            The transfer counts, or ``None`` for a local service or a service
+            that did not connect yet.
+        """
+        if self._client is None:
+            return None
+        return self._client.transfer_stats(reset=reset)
+
+    def __enter__(self) -> "IBMExperimentService":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _get_query_cache(self) -> Optional[QueryCache]:
+        """Return the query cache matching the current options, if enabled."""
+        maxsize = self.options["query_cache_size"]
+        ttl = self.options["query_cache_ttl"]
+        if not maxsize:
+            self._query_cache = None
+            return None
+        cache = self._query_cache
+        if cache is None or cache.maxsize != maxsize or cache.ttl != ttl:
+            cache = self._query_cache = QueryCache(maxsize, ttl)
+        return cache
+
+    def query_cache_info(self) -> Optional[CacheInfo]:
+        """Return the statistics of the query cache.
+
+        Returns:
+            The number of hits and misses, the maximum and current number of entries,
+            and the time to live of the entries. ``None`` if the cache is disabled.
+        """
+        cache = self._get_query_cache()
+        return cache.info() if cache is not None else None
+
+    def clear_query_cache(self) -> None:
+        """Remove all the entries of the query cache."""
+        if self._query_cache is not None:
+            self._query_cache.clear()
+
+    def _paginate(
+        self,
+        fetch: Callable[..., Union[str, Iterator[bytes]]],
+        query: Dict[str, Any],
+        records_key: str,
+        converter: Optional[Callable[[Dict], Dict]],
+        limit: Optional[int],
+        json_decoder: Type[json.JSONDecoder],
+    ) -> Iterator[Dict]:
+        """Retrieve records page by page, following the server marker.
+
+        Args:
+            fetch: Client method used to retrieve a single page.
+            query: Filtering arguments passed to `fetch`.
+            records_key: Key of the records list in the server response.
+            converter: Function used to convert a single record. If ``None``, the
+                records are returned as received from the server.
+            limit: Number of records to retrieve. ``None`` indicates no limit.
+            json_decoder: Custom JSON decoder to use to decode the retrieved records.
+
+        Yields:
+            Converted records.
+
+        Raises:
+            IBMApiError: If the request to the server failed.
+        """
+
+        page_size = page_size_for(self.options["page_size"])
+        stream = self.options["stream_pages"]
+        if stream:
+            query = dict(query, stream=True)
+
+        def _fetch_page(
+            page_marker: Optional[str], page_limit: Optional[int]
+        ) -> Tuple[Union[str, Iterator[bytes]], Optional[int], float]:
+            size = (
+                page_size.size if isinstance(page_size, AdaptivePageSize) else page_size
+            )
+            start_time = time.monotonic()
+            tracer = get_tracer()
+            with map_api_error("Request failed."):
+                if tracer is None:
+                    response = fetch(
+                        limit=page_limit, marker=page_marker, page_size=size, **query
+                    )
+                else:
+                    with tracer.start_span("page", {"page.size": size}):
+                        response = fetch(
+                            limit=page_limit,
+                            marker=page_marker,
+                            page_size=size,
+                            **query,
+                        )
+            return response, size, time.monotonic() - start_time
+
+        # When prefetching, the request for the next page is sent on a worker
+        # thread as soon as its marker is known, while the current page is
+        # being converted and consumed.
+        prefetch = self.options["prefetch_pages"]
+        next_page = None  # type: Optional[Future]
+        marker = None
+        try:
+            while limit is None or limit > 0:
+                if next_page is not None:
+                    response, size, latency = next_page.result()
+                    next_page = None
+                else:
+                    response, size, latency = _fetch_page(marker, limit)
+                if stream:
+                    # Records are returned while the page is being downloaded,
+                    # and the marker is only known once the page is complete.
+                    page = StreamedPage(response, records_key, json_decoder)
+                    with map_api_error("Request failed."):
+                        for record in page:
+                            yield record if converter is None else converter(record)
+                    marker = page.marker
+                    records = []
+                    num_records, num_bytes = page.num_records, page.num_bytes
+                else:
+                    tracer = get_tracer()
+                    if tracer is None:
+                        raw_data = json.loads(response, cls=json_decoder)
+                    else:
+                        with tracer.start_span("decode", {"bytes": len(response)}):
+                            raw_data = json.loads(response, cls=json_decoder)
+                    marker = raw_data.get("marker")
+                    records = raw_data[records_key]
+                    num_records, num_bytes = len(records), len(response)
+                if isinstance(page_size, AdaptivePageSize):
+                    requested = size if limit is None else min(size, limit)
+                    page_size.update(requested, num_records, latency, num_bytes)
+                if limit:
+                    limit -= num_records
+                if prefetch and marker and (limit is None or limit > 0):
+                    next_page = self._submit_background(_fetch_page, marker, limit)
+                if converter is None:
+                    yield from records
+                else:
+                    for record in records:
+                        yield converter(record)
+                if not marker:  # No more records to return.
+                    break
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    def _sharded_paginate(
+        self,
+        fetch: Callable[..., str],
+        query: Dict[str, Any],
+        time_filter: Tuple[str, Optional[datetime], Optional[datetime]],
+        shards: int,
+        sort_by: Union[str, List[str]],
+        id_field: str,
+        records_key: str,
+        converter: Callable[[Dict], Dict],
+        limit: Optional[int],
+        json_decoder: Type[json.JSONDecoder],
+    ) -> Iterator[Dict]:
+        """Retrieve records from several time windows concurrently.
+
+        Args:
+            fetch: Client method used to retrieve a single page.
+            query: Filtering arguments passed to `fetch`.
+            time_filter: The name of the time filter argument of `fetch`, and
+                the start and end of the time range to split.
+            shards: Number of time windows.
+            sort_by: Sorting options of the query.
+            id_field: Name of the converted record field holding the record ID.
+            records_key: Key of the records list in the server response.
+            converter: Function used to convert a single record.
+            limit: Number of records to retrieve. ``None`` indicates no limit.
+            json_decoder: Custom JSON decoder to use to decode the retrieved records.
+
+        Returns:
+            A generator of converted records.
+        """
+        filter_name, after, before = time_filter
+        streams = []
+        for window_start, window_end in time_windows(after, before, shards):
+            shard_query = dict(query)
+            shard_query[filter_name] = [
+                "ge:{}".format(local_to_utc_str(window_start)),
+                "le:{}".format(local_to_utc_str(window_end)),
+            ]
+            streams.append(
+                self._paginate(
+                    fetch=fetch,
+                    query=shard_query,
+                    records_key=records_key,
+                    converter=converter,
+                    limit=limit,
+                    json_decoder=json_decoder,
+                )
+            )
+        if not isinstance(sort_by, list):
+            sort_by = [sort_by]
+        records = merge_sorted_streams(streams, sort_key_for(sort_by), id_field)
+        if limit:
+            records = itertools.islice(records, limit)
+        return records
+
+    def _api_to_experiment_data(
+        self,
+        raw_data: Dict,
+    ) -> ExperimentRecord:
+        """Convert API response to experiment data.
+
+        Args:
+            raw_data: API response
+
+        Returns:
+            Converted experiment data. Fields are converted on first access.
+        """
+        return ExperimentRecord(raw_data, utc=self.options["utc_timestamps"])
+
+    @traced("IBMExperimentService.delete_experiment")
     def delete_experiment(self, experiment_id: str) -> None:
         """Delete an experiment.
 
@@ -721,14 +1852,15 @@ class IBMExperimentService:
             "Results and plots for the experiment will also be deleted. [y/N]: "
         ):
             return
+        self.flush()
         try:
-            self._api_client.experiment_delete(experiment_id)
-        except RequestsApiError as api_err:
-            if api_err.status_code == 404:
-                logger.warning("Experiment %s not found.", experiment_id)
-            else:
-                raise IBMApiError(f"Failed to process the request: {api_err}") from None
+            with map_api_error(f"Experiment {experiment_id} deletion failed."):
+                self._api_client.experiment_delete(experiment_id)
+        except IBMExperimentEntryNotFound:
+            logger.warning("Experiment %s not found.", experiment_id)
+        self.clear_query_cache()
 
+    @traced("IBMExperimentService.create_analysis_result")
     def create_analysis_result(
         self,
         experiment_id: str,
@@ -770,6 +1902,52 @@ class IBMExperimentService:
             IBMApiError: If the request to the server failed.
         """
         # pylint: disable=arguments-differ
+        if result_id is None and self.options["write_behind"]:
+            # The ID is returned before the analysis result is created.
+            result_id = str(uuid.uuid4())
+        request = self._analysis_result_request(
+            experiment_id=experiment_id,
+            result_data=result_data,
+            result_type=result_type,
+            device_components=device_components,
+            tags=tags,
+            quality=quality,
+            verified=verified,
+            result_id=result_id,
+            chisq=chisq,
+            **kwargs,
+        )
+        data = json.dumps(request, cls=json_encoder)
+
+        def _create() -> str:
+            with map_api_error(f"Analysis result {result_id} creation failed."):
+                response = self._api_client.analysis_result_create(data)
+            self.clear_query_cache()
+            return response["uuid"]
+
+        return self._write(
+            result_id, "create_analysis_result", _create, result_id, after=experiment_id
+        )
+
+    def _analysis_result_request(
+        self,
+        experiment_id: str,
+        result_data: Dict,
+        result_type: str,
+        device_components: Optional[
+            Union[List[Union[str, DeviceComponent]], str, DeviceComponent]
+        ] = None,
+        tags: Optional[List[str]] = None,
+        quality: Union[ResultQuality, str] = ResultQuality.UNKNOWN,
+        verified: bool = False,
+        result_id: Optional[str] = None,
+        chisq: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Dict:
+        """Return the request creating an analysis result.
+
+        See :meth:`create_analysis_result` for the arguments.
+        """
         if kwargs:
             logger.info(
                 "Keywords %s are not supported by IBM Quantum experiment service "
@@ -787,7 +1965,7 @@ class IBMExperimentService:
         if isinstance(quality, str):
             quality = ResultQuality(quality.upper())
 
-        request = self._analysis_result_to_api(
+        return self._analysis_result_to_api(
             experiment_id=experiment_id,
             device_components=components,
             data=result_data,
@@ -798,12 +1976,160 @@ class IBMExperimentService:
             result_id=result_id,
             chisq=chisq,
         )
-        with map_api_error(f"Analysis result {result_id} creation failed."):
-            response = self._api_client.analysis_result_create(
-                json.dumps(request, cls=json_encoder)
+
+    @traced("IBMExperimentService.create_analysis_results")
+    def create_analysis_results(
+        self,
+        results: List[Dict[str, Any]],
+        max_workers: int = 8,
+        batch_size: int = 50,
+        json_encoder: Type[json.JSONEncoder] = json.JSONEncoder,
+    ) -> List[UploadResult]:
+        """Create many analysis results in the database.
+
+        The results are uploaded concurrently, in batches of `batch_size` results
+        per request if the server has a batch endpoint, and otherwise one result
+        per request. A result failing to upload does not stop the upload of the
+        others. For example::
+
+            outcomes = service.create_analysis_results(
+                [
+                    {
+                        "experiment_id": experiment_id,
+                        "result_type": "T1",
+                        "result_data": {"value": t1},
+                        "device_components": [f"Q{qubit}"],
+                    }
+                    for qubit, t1 in enumerate(t1_values)
+                ]
             )
-        return response["uuid"]
+            failed = [outcome for outcome in outcomes if outcome.error]
 
+        Args:
+            results: Analysis results to create, each given as a dictionary of
+                the arguments of :meth:`create_analysis_result`, except
+                `json_encoder`. Results without a ``result_id`` are given a new
+                one before the upload, so that the IDs of all the results are
+                known even if some uploads fail.
+            max_workers: Maximum number of concurrent requests.
+            batch_size: Maximum number of results per request to the batch
+                endpoint. ``1`` sends one request per result.
+            json_encoder: Custom JSON encoder to use to encode the analysis results.
+
+        Returns:
+            The outcome of the upload of each result, in the order of `results`:
+            its ID, and the error raised by its upload, such as
+            :class:`~qiskit_ibm_experiment.IBMExperimentEntryExists`, or ``None``
+            if it was created.
+
+        Raises:
+            IBMApiError: If the authentication failed.
+        """
+        # The results can be for experiments whose creation is queued.
+        self.flush()
+        outcomes = [None] * len(results)  # type: List[Optional[UploadResult]]
+        requests = []  # type: List[Tuple[int, str, str]]
+        for index, result in enumerate(results):
+            result = dict(result)
+            result_id = result.get("result_id") or str(uuid.uuid4())
+            result["result_id"] = result_id
+            try:
+                request = json.dumps(
+                    self._analysis_result_request(**result), cls=json_encoder
+                )
+            except (TypeError, ValueError) as ex:
+                outcomes[index] = UploadResult(result_id, ex)
+            else:
+                requests.append((index, result_id, request))
+
+        client = self._api_client
+
+        # Each upload records its outcome, so that a failure does not lose the
+        # outcomes of the other uploads.
+        def _upload(request: Tuple[int, str, str]) -> None:
+            index, result_id, data = request
+            error = None
+            try:
+                with map_api_error(f"Analysis result {result_id} creation failed."):
+                    client.analysis_result_create(data)
+            except Exception as ex:  # pylint: disable=broad-except
+                error = ex
+            outcomes[index] = UploadResult(result_id, error)
+
+        def _upload_batch(
+            batch: List[Tuple[int, str, str]], probe: bool = False
+        ) -> Optional[bool]:
+            try:
+                created = client.analysis_results_bulk_create(
+                    "[" + ",".join(data for _, _, data in batch) + "]"
+                )["analysis_results"]
+            except RequestsApiError as ex:
+                if probe and ex.status_code in (404, 405):
+                    return False
+                for index, result_id, _ in batch:
+                    error = api_error(
+                        f"Analysis result {result_id} creation failed.", ex
+                    )
+                    outcomes[index] = UploadResult(result_id, error)
+                return True
+            except Exception as ex:  # pylint: disable=broad-except
+                for index, result_id, _ in batch:
+                    outcomes[index] = UploadResult(result_id, ex)
+                # Whether the server has a batch endpoint is still unknown.
+                return None if probe else True
+            for position, (index, result_id, _) in enumerate(batch):
+                error = None
+                if position >= len(created):
+                    error = IBMApiError(
+                        f"Analysis result {result_id} creation failed: "
+                        "it is missing from the server response."
+                    )
+                elif "error" in created[position]:
+                    entry_error = created[position]["error"]
+                    error = api_error(
+                        f"Analysis result {result_id} creation failed.",
+                        RequestsApiError(
+                            entry_error.get("message", ""),
+                            entry_error.get("code", -1),
+                        ),
+                    )
+                outcomes[index] = UploadResult(result_id, error)
+            return True
+
+        tasks = []  # type: List[Tuple[Callable, Any]]
+        if batch_size > 1 and self._bulk_upload is not False:
+            pending = list(batches(requests, batch_size))
+            if pending and self._bulk_upload is None:
+                # The first batch finds out whether the server has a batch endpoint.
+                first = pending.pop(0)
+                self._bulk_upload = _upload_batch(first, probe=True)
+                if self._bulk_upload is False:
+                    tasks = [(_upload, request) for request in first]
+            if self._bulk_upload is False:
+                tasks += [(_upload, request) for batch in pending for request in batch]
+            else:
+                tasks = [(_upload_batch, batch) for batch in pending]
+        else:
+            tasks = [(_upload, request) for request in requests]
+
+        if len(tasks) <= 1 or max_workers <= 1:
+            for function, argument in tasks:
+                function(argument)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(tasks)),
+                thread_name_prefix="ibm_experiment_upload",
+            ) as executor:
+                futures = [
+                    executor.submit(contextvars.copy_context().run, function, argument)
+                    for function, argument in tasks
+                ]
+                for future in futures:
+                    future.result()
+        self.clear_query_cache()
+        return outcomes
+
+    @traced("IBMExperimentService.update_analysis_result")
     def update_analysis_result(
         self,
         result_id: str,
@@ -846,10 +2172,14 @@ class IBMExperimentService:
         request = self._analysis_result_to_api(
             data=result_data, tags=tags, quality=quality, verified=verified, chisq=chisq
         )
-        with map_api_error(f"Analysis result {result_id} update failed."):
-            self._api_client.analysis_result_update(
-                result_id, json.dumps(request, cls=json_encoder)
-            )
+        data = json.dumps(request, cls=json_encoder)
+
+        def _update() -> None:
+            with map_api_error(f"Analysis result {result_id} update failed."):
+                self._api_client.analysis_result_update(result_id, data)
+            self.clear_query_cache()
+
+        self._write(result_id, "update_analysis_result", _update)
 
     def _confirm_delete(self, msg: str) -> bool:
         """Confirms a delete command; if the options indicate a prompt should be
@@ -911,6 +2241,7 @@ class IBMExperimentService:
             out["chisq"] = chisq
         return out
 
+    @traced("IBMExperimentService.analysis_result")
     def analysis_result(
         self, result_id: str, json_decoder: Type[json.JSONDecoder] = json.JSONDecoder
     ) -> Dict:
@@ -932,6 +2263,7 @@ class IBMExperimentService:
 
         return self._api_to_analysis_result(json.loads(raw_data, cls=json_decoder))
 
+    @traced("IBMExperimentService.analysis_results")
     def analysis_results(
         self,
         limit: Optional[int] = 10,
@@ -951,8 +2283,10 @@ class IBMExperimentService:
         creation_datetime_after: Optional[datetime] = None,
         creation_datetime_before: Optional[datetime] = None,
         sort_by: Optional[Union[str, List[str]]] = None,
+        shards: Optional[int] = None,
+        as_columns: bool = False,
         **filters: Any,
-    ) -> List[Dict]:
+    ) -> Union[List[Dict], Dict[str, Any]]:
         """Retrieve all analysis results, with optional filtering.
 
         Args:
@@ -1010,18 +2344,203 @@ class IBMExperimentService:
                 ascending order, then by creation datetime by descending order.
                 By default, analysis results are sorted by ``creation_datetime``
                 descending and ``result_id`` ascending.
-
+            shards: If specified, the time range given by `creation_datetime_after` and
+                `creation_datetime_before` is split into this many windows, which are
+                retrieved concurrently and merged back in `sort_by` order.
+                `creation_datetime_after` must be specified in this case, and
+                `creation_datetime_before` defaults to the current time.
+            as_columns: If ``True``, return the analysis results as columns instead
+                of a list of dictionaries. Columns are built directly from the
+                server response, which is much faster for large numbers of analysis
+                results. Timestamps are returned as ``datetime64[ns]`` arrays in UTC,
+                ``quality`` as the :class:`ResultQuality` values, ``chisq`` as a float
+                array with ``NaN`` for missing values, and list fields, such as
+                ``device_components``, as
+                :class:`~qiskit_ibm_experiment.service.RaggedColumn`.
+                Cannot be combined with `shards`.
             **filters: Additional filtering keywords that are not supported and will be ignored.
 
         Returns:
             A list of analysis results. Each analysis result is a dictionary
-            containing the retrieved analysis result.
+            containing the retrieved analysis result. If `as_columns` is ``True``,
+            a dictionary mapping each analysis result field to the array of its values.
 
         Raises:
             ValueError: If an invalid parameter value is specified.
             IBMApiError: If the request to the server failed.
         """
         # pylint: disable=arguments-differ
+        query = self._analysis_results_query(
+            limit=limit,
+            device_components=device_components,
+            device_components_operator=device_components_operator,
+            experiment_id=experiment_id,
+            result_type=result_type,
+            result_type_operator=result_type_operator,
+            backend_name=backend_name,
+            quality=quality,
+            verified=verified,
+            tags=tags,
+            tags_operator=tags_operator,
+            creation_datetime_after=creation_datetime_after,
+            creation_datetime_before=creation_datetime_before,
+            sort_by=sort_by,
+            **filters,
+        )
+        if as_columns:
+            return self._column_query(query, limit, json_decoder, shards)
+        return self._cached_query(query, limit, json_decoder, shards)
+
+    def iter_analysis_results(
+        self,
+        limit: Optional[int] = None,
+        json_decoder: Type[json.JSONDecoder] = json.JSONDecoder,
+        device_components: Optional[List[Union[str, DeviceComponent]]] = None,
+        device_components_operator: Optional[str] = None,
+        experiment_id: Optional[str] = None,
+        result_type: Optional[str] = None,
+        result_type_operator: Optional[str] = None,
+        backend_name: Optional[str] = None,
+        quality: Optional[
+            Union[List[Union[ResultQuality, str]], ResultQuality, str]
+        ] = None,
+        verified: Optional[bool] = None,
+        tags: Optional[List[str]] = None,
+        tags_operator: Optional[str] = "OR",
+        creation_datetime_after: Optional[datetime] = None,
+        creation_datetime_before: Optional[datetime] = None,
+        sort_by: Optional[Union[str, List[str]]] = None,
+        shards: Optional[int] = None,
+        **filters: Any,
+    ) -> Iterator[Dict]:
+        """Iterate over analysis results, with optional filtering.
+
+        This accepts the same filters as :meth:`analysis_results`, but instead of
+        building a list of all matching analysis results it returns a generator.
+        Analysis results are retrieved from the server one page at a time, and the
+        next page is only requested once the current one has been consumed.
+
+        Args:
+            limit: Number of analysis results to retrieve. ``None`` indicates no limit.
+            json_decoder: Custom JSON decoder to use to decode the retrieved analysis results.
+            device_components: Filter by device components.
+            device_components_operator: Operator used when filtering by device components.
+            experiment_id: Experiment ID used for filtering.
+            result_type: Analysis result type used for filtering.
+            result_type_operator: Operator used when filtering by result type.
+            backend_name: Backend name used for filtering.
+            quality: Quality value used for filtering.
+            verified: Indicates whether this result has been verified.
+            tags: Filter by tags assigned to analysis results.
+            tags_operator: Logical operator to use when filtering by tags.
+            creation_datetime_after: Filter by the given creation timestamp, in local time.
+            creation_datetime_before: Filter by the given creation timestamp, in local time.
+            sort_by: Specifies how the output should be sorted.
+            shards: Number of time windows to retrieve concurrently.
+            **filters: Additional filtering keywords that are not supported and will be ignored.
+
+        Returns:
+            A generator of analysis results. Each analysis result is a dictionary
+            containing the retrieved analysis result.
+
+        Raises:
+            ValueError: If an invalid parameter value is specified.
+        """
+        query = self._analysis_results_query(
+            limit=limit,
+            device_components=device_components,
+            device_components_operator=device_components_operator,
+            experiment_id=experiment_id,
+            result_type=result_type,
+            result_type_operator=result_type_operator,
+            backend_name=backend_name,
+            quality=quality,
+            verified=verified,
+            tags=tags,
+            tags_operator=tags_operator,
+            creation_datetime_after=creation_datetime_after,
+            creation_datetime_before=creation_datetime_before,
+            sort_by=sort_by,
+            **filters,
+        )
+        return self._run_query(query, limit, json_decoder, shards)
+
+    @traced("IBMExperimentService.sync_analysis_results")
+    def sync_analysis_results(
+        self,
+        since: Optional[Union[str, datetime, Watermark]] = None,
+        json_decoder: Type[json.JSONDecoder] = json.JSONDecoder,
+        **filters: Any,
+    ) -> SyncResult:
+        """Retrieve the analysis results that changed since a watermark.
+
+        This works like :meth:`sync_experiments`, but for analysis results.
+
+        Args:
+            since: Watermark returned by the previous call, or timestamp in local
+                time. With a timestamp, the analysis results updated at or after
+                it are returned. If ``None``, all the analysis results matching
+                the filters are returned.
+            json_decoder: Custom JSON decoder to use to decode the retrieved
+                analysis results.
+            **filters: Filters accepted by :meth:`analysis_results`, except for ``limit``.
+
+        Returns:
+            The changed analysis results and the new watermark, which is
+            `since` if no analysis result changed, and ``None`` if there is no
+            analysis result.
+
+        Raises:
+            ValueError: If an invalid parameter value is specified.
+        """
+        return self._sync(self._analysis_results_query(**filters), since, json_decoder)
+
+    def _analysis_results_query(
+        self,
+        limit: Optional[int] = None,
+        device_components: Optional[List[Union[str, DeviceComponent]]] = None,
+        device_components_operator: Optional[str] = None,
+        experiment_id: Optional[str] = None,
+        result_type: Optional[str] = None,
+        result_type_operator: Optional[str] = None,
+        backend_name: Optional[str] = None,
+        quality: Optional[
+            Union[List[Union[ResultQuality, str]], ResultQuality, str]
+        ] = None,
+        verified: Optional[bool] = None,
+        tags: Optional[List[str]] = None,
+        tags_operator: Optional[str] = "OR",
+        creation_datetime_after: Optional[datetime] = None,
+        creation_datetime_before: Optional[datetime] = None,
+        sort_by: Optional[Union[str, List[str]]] = None,
+        **filters: Any,
+    ) -> QuerySpec:
+        """Validate analysis result filters and convert them to server format.
+
+        Args:
+            limit: Number of analysis results to retrieve.
+            device_components: Filter by device components.
+            device_components_operator: Operator used when filtering by device components.
+            experiment_id: Experiment ID used for filtering.
+            result_type: Analysis result type used for filtering.
+            result_type_operator: Operator used when filtering by result type.
+            backend_name: Backend name used for filtering.
+            quality: Quality value used for filtering.
+            verified: Indicates whether this result has been verified.
+            tags: Filter by tags assigned to analysis results.
+            tags_operator: Logical operator to use when filtering by tags.
+            creation_datetime_after: Filter by the given creation timestamp, in local time.
+            creation_datetime_before: Filter by the given creation timestamp, in local time.
+            sort_by: Specifies how the output should be sorted.
+            **filters: Additional filtering keywords that are not supported and will be ignored.
+
+        Returns:
+            The analysis results query.
+
+        Raises:
+            ValueError: If an invalid parameter value is specified.
+        """
+        # pylint: disable=arguments-differ
         if filters:
             logger.info(
                 "Keywords %s are not supported by IBM Quantum experiment service "
@@ -1059,32 +2578,27 @@ class IBMExperimentService:
             item_type_operator=result_type_operator,
         )
 
-        results = []
-        marker = None
-        while limit is None or limit > 0:
-            with map_api_error("Request failed."):
-                response = self._api_client.analysis_results(
-                    limit=limit,
-                    marker=marker,
-                    backend_name=backend_name,
-                    device_components=converted["device_components"],
-                    experiment_uuid=experiment_id,
-                    result_type=converted["type"],
-                    quality=quality,
-                    verified=verified,
-                    tags=converted["tags"],
-                    created_at=created_at_filters,
-                    sort_by=converted["sort_by"],
-                )
-            raw_data = json.loads(response, cls=json_decoder)
-            marker = raw_data.get("marker")
-            for result in raw_data["analysis_results"]:
-                results.append(self._api_to_analysis_result(result))
-            if limit:
-                limit -= len(raw_data["analysis_results"])
-            if not marker:  # No more experiments to return.
-                break
-        return results
+        params = {
+            "backend_name": backend_name,
+            "device_components": converted["device_components"],
+            "experiment_uuid": experiment_id,
+            "result_type": converted["type"],
+            "quality": quality,
+            "verified": verified,
+            "tags": converted["tags"],
+            "created_at": created_at_filters,
+            "sort_by": converted["sort_by"],
+        }
+        return QuerySpec(
+            kind="analysis_results",
+            params=params,
+            time_filter=(
+                "created_at",
+                creation_datetime_after,
+                creation_datetime_before,
+            ),
+            sort_by=sort_by or ["creation_datetime:desc"],
+        )
 
     def _quality_filter_to_api(
         self,
@@ -1206,50 +2720,18 @@ class IBMExperimentService:
     def _api_to_analysis_result(
         self,
         raw_data: Dict,
-    ) -> Dict:
+    ) -> AnalysisResultRecord:
         """Map API response to a dictionary representing an analysis result.
 
         Args:
             raw_data: API response data.
 
         Returns:
-            Converted analysis result data.
+            Converted analysis result data. Fields are converted on first access.
         """
-        extra_data = {}
-
-        chisq = raw_data.get("chisq", None)
-        if chisq:
-            extra_data["chisq"] = chisq
-
-        backend_name = raw_data["device_name"]
-        if backend_name:
-            extra_data["backend_name"] = backend_name
-
-        quality = raw_data.get("quality", None)
-        if quality:
-            quality = RESULT_QUALITY_FROM_API[quality]
-
-        self._convert_dt(
-            raw_data.get("created_at", None), extra_data, "creation_datetime"
-        )
-        self._convert_dt(
-            raw_data.get("updated_at", None), extra_data, "updated_datetime"
-        )
-
-        out_dict = {
-            "result_data": raw_data.get("fit", {}),
-            "result_type": raw_data.get("type", None),
-            "device_components": raw_data.get("device_components", []),
-            "experiment_id": raw_data.get("experiment_uuid"),
-            "result_id": raw_data.get("uuid", None),
-            "quality": quality,
-            "verified": raw_data.get("verified", False),
-            "tags": raw_data.get("tags", []),
-            "service": self,
-            **extra_data,
-        }
-        return out_dict
+        return AnalysisResultRecord(raw_data, self, utc=self.options["utc_timestamps"])
 
+    @traced("IBMExperimentService.delete_analysis_result")
     def delete_analysis_result(self, result_id: str) -> None:
         """Delete an analysis result.
 
@@ -1266,14 +2748,15 @@ class IBMExperimentService:
             "Are you sure you want to delete the analysis result? [y/N]: "
         ):
             return
+        self.flush()
         try:
-            self._api_client.analysis_result_delete(result_id)
-        except RequestsApiError as api_err:
-            if api_err.status_code == 404:
-                logger.warning("Analysis result %s not found.", result_id)
-            else:
-                raise IBMApiError(f"Failed to process the request: {api_err}") from None
+            with map_api_error(f"Analysis result {result_id} deletion failed."):
+                self._api_client.analysis_result_delete(result_id)
+        except IBMExperimentEntryNotFound:
+            logger.warning("Analysis result %s not found.", result_id)
+        self.clear_query_cache()
 
+    @traced("IBMExperimentService.create_figure")
     def create_figure(
         self,
         experiment_id: str,
@@ -1295,7 +2778,8 @@ class IBMExperimentService:
                 Otherwise the upload will be asynchronous.
 
         Returns:
-            A tuple of the name and size of the saved figure.
+            A tuple of the name and size of the saved figure. The size is ``None``
+            if the figure was queued, with the ``write_behind`` option.
 
         Raises:
             IBMExperimentEntryExists: If the figure already exits.
@@ -1311,12 +2795,23 @@ class IBMExperimentService:
         if not figure_name.endswith(".svg"):
             figure_name += ".svg"
 
-        with map_api_error(f"Figure {figure_name} creation failed."):
-            response = self._api_client.experiment_plot_upload(
-                experiment_id, figure, figure_name, sync_upload=sync_upload
-            )
-        return response["name"], response["size"]
+        def _create() -> Tuple[str, int]:
+            with map_api_error(f"Figure {figure_name} creation failed."):
+                response = self._api_client.experiment_plot_upload(
+                    experiment_id, figure, figure_name, sync_upload=sync_upload
+                )
+            self.clear_query_cache()
+            return response["name"], response["size"]
+
+        return self._write(
+            (experiment_id, figure_name),
+            "create_figure",
+            _create,
+            (figure_name, None),
+            after=experiment_id,
+        )
 
+    @traced("IBMExperimentService.update_figure")
     def update_figure(
         self,
         experiment_id: str,
@@ -1334,19 +2829,31 @@ class IBMExperimentService:
                 Otherwise the upload will be asynchronous.
 
         Returns:
-            A tuple of the name and size of the saved figure.
+            A tuple of the name and size of the saved figure. The size is ``None``
+            if the figure was queued, with the ``write_behind`` option.
 
         Raises:
             IBMExperimentEntryNotFound: If the figure does not exist.
             IBMApiError: If the request to the server failed.
         """
-        with map_api_error(f"Figure {figure_name} update failed."):
-            response = self._api_client.experiment_plot_update(
-                experiment_id, figure, figure_name, sync_upload=sync_upload
-            )
 
-        return response["name"], response["size"]
+        def _update() -> Tuple[str, int]:
+            with map_api_error(f"Figure {figure_name} update failed."):
+                response = self._api_client.experiment_plot_update(
+                    experiment_id, figure, figure_name, sync_upload=sync_upload
+                )
+            self.clear_query_cache()
+            return response["name"], response["size"]
+
+        return self._write(
+            (experiment_id, figure_name),
+            "update_figure",
+            _update,
+            (figure_name, None),
+            after=experiment_id,
+        )
 
+    @traced("IBMExperimentService.figure")
     def figure(
         self, experiment_id: str, figure_name: str, file_name: Optional[str] = None
     ) -> Union[int, bytes]:
@@ -1376,6 +2883,7 @@ class IBMExperimentService:
 
         return data
 
+    @traced("IBMExperimentService.delete_figure")
     def delete_figure(self, experiment_id: str, figure_name: str) -> None:
         """Delete an experiment plot.
 
@@ -1393,14 +2901,15 @@ class IBMExperimentService:
             "Are you sure you want to delete the experiment plot? [y/N]: "
         ):
             return
+        self.flush()
         try:
-            self._api_client.experiment_plot_delete(experiment_id, figure_name)
-        except RequestsApiError as api_err:
-            if api_err.status_code == 404:
-                logger.warning("Figure %s not found.", figure_name)
-            else:
-                raise IBMApiError(f"Failed to process the request: {api_err}") from None
+            with map_api_error(f"Figure {figure_name} deletion failed."):
+                self._api_client.experiment_plot_delete(experiment_id, figure_name)
+        except IBMExperimentEntryNotFound:
+            logger.warning("Figure %s not found.", figure_name)
+        self.clear_query_cache()
 
+    @traced("IBMExperimentService.device_components")
     def device_components(
         self, backend_name: Optional[str] = None
     ) -> Union[Dict[str, List], List]:
@@ -1431,6 +2940,7 @@ class IBMExperimentService:
 
         return dict(components)
 
+    @traced("IBMExperimentService.files")
     def files(self, experiment_id: str) -> str:
         """Retrieve the file list for an experiment
 
@@ -1448,6 +2958,7 @@ class IBMExperimentService:
             data = self._api_client.experiment_files_get(experiment_id)
         return data
 
+    @traced("IBMExperimentService.file_upload")
     def file_upload(
         self, experiment_id: str, file_name: str, file_data: Union[Dict, str]
     ):
@@ -1468,8 +2979,16 @@ class IBMExperimentService:
             file_name += ".json"
         if isinstance(file_data, Dict):
             file_data = json.dumps(file_data)
-        self._api_client.experiment_file_upload(experiment_id, file_name, file_data)
+        self._write(
+            (experiment_id, file_name),
+            "file_upload",
+            lambda: self._api_client.experiment_file_upload(
+                experiment_id, file_name, file_data
+            ),
+            after=experiment_id,
+        )
 
+    @traced("IBMExperimentService.file_download")
     def file_download(self, experiment_id: str, file_name: str) -> Dict:
         """Downloads a data file from the DB and returns its deserialization
         Args:
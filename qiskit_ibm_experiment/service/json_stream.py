@@ -0,0 +1,158 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Incremental decoding of paginated JSON responses."""
+
+import codecs
+import json
+from typing import Any, Dict, Iterable, Iterator, Optional, Type
+
+_WHITESPACE = " \t\n\r"
+
+
+class StreamedPage:
+    """A page of records decoded while the response is being downloaded.
+
+    The response must be a JSON object holding the records in an array. Iterating
+    over the page yields the records of the array one by one, as soon as they are
+    received. The other fields of the object, such as the pagination marker, are
+    available in :attr:`fields` once the iteration finishes.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        records_key: str,
+        json_decoder: Type[json.JSONDecoder] = json.JSONDecoder,
+    ) -> None:
+        """StreamedPage constructor.
+
+        Args:
+            chunks: Response body, as chunks of UTF-8 encoded bytes.
+            records_key: Key of the records array in the response.
+            json_decoder: Decoder used to decode the values in the response. Its
+                ``raw_decode`` method is used, so hooks such as ``object_hook``
+                are honored.
+        """
+        self.records_key = records_key
+        self.fields = {}  # type: Dict[str, Any]
+        self.num_records = 0
+        self.num_bytes = 0
+        self._chunks = iter(chunks)
+        self._decoder = json_decoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    @property
+    def marker(self) -> Optional[str]:
+        """Return the marker of the next page, once the page has been read."""
+        return self.fields.get("marker")
+
+    def __iter__(self) -> Iterator[Any]:
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise self._error("Expecting property name enclosed in double quotes")
+            self._expect(":")
+            if key == self.records_key:
+                yield from self._records()
+            else:
+                self.fields[key] = self._value()
+            if self._next_char(",}") == "}":
+                return
+
+    def _records(self) -> Iterator[Any]:
+        """Yield the values of the records array."""
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            record = self._value()
+            self.num_records += 1
+            yield record
+            if self._next_char(",]") == "]":
+                return
+
+    def _fill(self) -> bool:
+        """Read the next chunk into the buffer, returning ``False`` at the end."""
+        if self._eof:
+            return False
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self._eof = True
+            self._buffer = self._buffer[self._pos :] + self._text_decoder.decode(
+                b"", final=True
+            )
+            self._pos = 0
+            return False
+        self.num_bytes += len(chunk)
+        # Drop the decoded part of the buffer, so that it does not grow
+        # with the size of the response.
+        self._buffer = self._buffer[self._pos :] + self._text_decoder.decode(chunk)
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character, or ``""`` at the end."""
+        while True:
+            while self._pos < len(self._buffer):
+                if self._buffer[self._pos] not in _WHITESPACE:
+                    return self._buffer[self._pos]
+                self._pos += 1
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        """Consume the given character, after any whitespace."""
+        if self._peek() != char:
+            raise self._error(f"Expecting '{char}' delimiter")
+        self._pos += 1
+
+    def _next_char(self, allowed: str) -> str:
+        """Consume and return the next character, which must be in `allowed`."""
+        char = self._peek()
+        if not char or char not in allowed:
+            raise self._error(
+                "Expecting " + " or ".join(f"'{option}'" for option in allowed)
+            )
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        """Decode the JSON value starting at the next character."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # The value may be incomplete.
+                if self._fill():
+                    continue
+                raise
+            # A value ending with the buffer, such as a number, may continue
+            # in the next chunk.
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        """Return a decoding error at the current position."""
+        return json.JSONDecodeError(message, self._buffer, self._pos)
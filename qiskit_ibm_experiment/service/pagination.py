@@ -0,0 +1,335 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Helpers for paginated experiment service queries."""
+
+import heapq
+import logging
+import queue
+import threading
+from collections import namedtuple
+from datetime import datetime, timezone
+from typing import Optional, Union, List, Tuple, Iterator, Dict, Any, Callable
+
+from .utils import local_to_utc
+
+logger = logging.getLogger(__name__)
+
+AUTO_PAGE_SIZE = "auto"
+_END_OF_STREAM = object()
+
+QuerySpec = namedtuple("QuerySpec", ["kind", "params", "time_filter", "sort_by"])
+"""A validated paginated query.
+
+``kind`` is either ``"experiments"`` or ``"analysis_results"``, ``params`` holds
+the filters in server format, ``time_filter`` is the name of the time filter
+parameter with the start and end of its range, and ``sort_by`` holds the
+sorting options in the user format.
+"""
+
+SyncResult = namedtuple("SyncResult", ["records", "watermark"])
+"""Records changed since a watermark, and the watermark to use for the next sync."""
+
+Watermark = namedtuple("Watermark", ["timestamp", "ids"])
+"""Position of a sync: the latest update time of the synced records, in local
+time, and the IDs of the records updated at that time, which were already
+returned."""
+
+
+class AdaptivePageSize:
+    """Page size that adapts to the latency and size of previous pages.
+
+    After every full page, the page size is scaled by the ratio between the
+    target latency and the observed latency, so that slow responses lead to
+    smaller pages and fast responses to larger ones. The page size is also
+    capped so that a page is not expected to exceed ``max_bytes``. Each
+    adjustment is limited to a factor of two in either direction.
+    """
+
+    def __init__(
+        self,
+        initial: int = 100,
+        minimum: int = 10,
+        maximum: int = 1000,
+        target_latency: float = 1.0,
+        max_bytes: int = 8 * 1024 * 1024,
+    ) -> None:
+        """AdaptivePageSize constructor.
+
+        Args:
+            initial: Page size used for the first request.
+            minimum: Smallest page size that can be requested.
+            maximum: Largest page size that can be requested.
+            target_latency: Desired response time of a single page, in seconds.
+            max_bytes: Desired maximum size of a single page response, in bytes.
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.max_bytes = max_bytes
+        self._size = self._clamp(initial)
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Return the page size to use for the next request."""
+        return self._size
+
+    def update(
+        self, requested: int, received: int, latency: float, num_bytes: int
+    ) -> None:
+        """Adjust the page size based on a received page.
+
+        Args:
+            requested: Number of records requested for the page.
+            received: Number of records received in the page.
+            latency: Time it took to receive the page, in seconds.
+            num_bytes: Size of the page response.
+        """
+        # A partial page is the last one and says nothing about the cost
+        # of a full page.
+        if received == 0 or received < requested:
+            return
+        with self._lock:
+            factor = self.target_latency / latency if latency > 0 else 2.0
+            new_size = self._size * min(max(factor, 0.5), 2.0)
+            new_size = min(new_size, self.max_bytes * received / max(num_bytes, 1))
+            new_size = self._clamp(int(new_size))
+            if new_size != self._size:
+                logger.debug(
+                    "Page size changed from %s to %s (latency=%.3fs, bytes=%s).",
+                    self._size,
+                    new_size,
+                    latency,
+                    num_bytes,
+                )
+            self._size = new_size
+
+    def _clamp(self, size: int) -> int:
+        """Clamp the size to the allowed range."""
+        return min(max(size, self.minimum), self.maximum)
+
+
+def page_size_for(
+    page_size: Optional[Union[int, str, AdaptivePageSize]]
+) -> Optional[Union[int, AdaptivePageSize]]:
+    """Return the page size to use for a single paginated query.
+
+    Args:
+        page_size: The ``page_size`` service option.
+
+    Returns:
+        ``None`` if the server default should be used, a fixed page size, or
+        a new :class:`AdaptivePageSize` instance if adaptive sizing is requested.
+
+    Raises:
+        ValueError: If the page size is invalid.
+    """
+    if page_size is None or isinstance(page_size, AdaptivePageSize):
+        return page_size
+    if isinstance(page_size, str):
+        if page_size.lower() != AUTO_PAGE_SIZE:
+            raise ValueError(
+                f'"{page_size}" is not a valid `page_size`. Valid values are '
+                f'positive integers and "{AUTO_PAGE_SIZE}".'
+            )
+        return AdaptivePageSize()
+    if not isinstance(page_size, int) or page_size <= 0:
+        raise ValueError(
+            f"{page_size} is not a valid `page_size`, which has to be a positive integer."
+        )
+    return page_size
+
+
+def time_windows(
+    after: Optional[Union[datetime, str]],
+    before: Optional[Union[datetime, str]],
+    num_windows: int,
+) -> List[Tuple[datetime, datetime]]:
+    """Split a time range into windows of equal length.
+
+    Adjacent windows share their boundary timestamp, so that records on the
+    boundary are included in both windows.
+
+    Args:
+        after: Start of the range, in local time.
+        before: End of the range, in local time. If ``None``, the current time is used.
+        num_windows: Number of windows.
+
+    Returns:
+        A list of ``(start, end)`` tuples of UTC timestamps.
+
+    Raises:
+        ValueError: If the input values are invalid.
+    """
+    if not isinstance(num_windows, int) or num_windows <= 0:
+        raise ValueError(
+            f"{num_windows} is not a valid number of shards, which has to be "
+            f"a positive integer."
+        )
+    if not after:
+        raise ValueError("Sharded queries require the start of the time range.")
+    start = local_to_utc(after)
+    end = local_to_utc(before) if before else datetime.now(timezone.utc)
+    if end < start:
+        raise ValueError("The end of the time range is before its start.")
+    step = (end - start) / num_windows
+    bounds = [start + step * idx for idx in range(num_windows)] + [end]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+class SortKey:
+    """Sort key of a record, honoring the direction of every sort field."""
+
+    __slots__ = ("values", "directions")
+
+    def __init__(self, values: Tuple, directions: Tuple[bool, ...]) -> None:
+        """SortKey constructor.
+
+        Args:
+            values: Values of the sort fields.
+            directions: Whether each field is sorted in descending order.
+        """
+        self.values = values
+        self.directions = directions
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, SortKey) and self.values == other.values
+
+    def __lt__(self, other: "SortKey") -> bool:
+        for mine, theirs, descending in zip(self.values, other.values, self.directions):
+            if mine == theirs:
+                continue
+            # Missing values are sorted as the largest ones.
+            if mine is None or theirs is None:
+                less = theirs is None
+            else:
+                less = mine < theirs
+            return not less if descending else less
+        return False
+
+
+def sort_key_for(sort_by: List[str]) -> Callable[[Dict[str, Any]], SortKey]:
+    """Return a function computing the sort key of a converted record.
+
+    Args:
+        sort_by: Sorting options, each being a field name and a direction
+            separated by a semicolon.
+
+    Returns:
+        A function that returns the sort key of a record.
+    """
+    fields = []
+    directions = []
+    for sorter in sort_by:
+        key, direction = sorter.split(":")
+        fields.append(key.strip().lower())
+        directions.append(direction.strip() == "desc")
+    directions_tuple = tuple(directions)
+
+    def _sort_key(record: Dict[str, Any]) -> SortKey:
+        return SortKey(tuple(record.get(field) for field in fields), directions_tuple)
+
+    return _sort_key
+
+
+def merge_sorted_streams(
+    streams: List[Iterator[Dict]],
+    sort_key: Callable[[Dict[str, Any]], SortKey],
+    id_field: str,
+    buffer_size: int = 1000,
+) -> Iterator[Dict]:
+    """Consume sorted streams concurrently and merge them into one sorted stream.
+
+    Each stream is consumed in its own thread, which buffers up to
+    `buffer_size` records ahead of the merge. Records that appear in more
+    than one stream are only returned once.
+
+    Args:
+        streams: Record streams, each sorted by `sort_key`.
+        sort_key: Function returning the sort key of a record.
+        id_field: Field holding the record ID, used to break ties and for
+            de-duplication.
+        buffer_size: Maximum number of records buffered per stream.
+
+    Yields:
+        Records from all streams, in sort order.
+    """
+    stop = threading.Event()
+    buffers = [
+        queue.Queue(maxsize=buffer_size) for _ in streams
+    ]  # type: List[queue.Queue]
+    for stream, buffer in zip(streams, buffers):
+        threading.Thread(
+            target=_produce, args=(stream, buffer, stop), daemon=True
+        ).start()
+
+    try:
+        # Ties are broken by the record ID, for a deterministic order. Shards may
+        # return tied records in any order, so copies of a record are not always
+        # adjacent, and the IDs of the records with the current sort key are kept.
+        last_key = None
+        seen_ids = set()
+        for record in heapq.merge(
+            *(_consume(buffer) for buffer in buffers),
+            key=lambda record: (sort_key(record), record.get(id_field)),
+        ):
+            key = sort_key(record)
+            record_id = record.get(id_field)
+            if key != last_key:
+                last_key = key
+                seen_ids = set()
+            elif record_id in seen_ids:
+                continue
+            seen_ids.add(record_id)
+            yield record
+    finally:
+        stop.set()
+
+
+def _produce(
+    stream: Iterator[Dict], buffer: queue.Queue, stop: threading.Event
+) -> None:
+    """Move records from a stream into a buffer until the stream ends or is stopped."""
+    try:
+        for record in stream:
+            if not _put(buffer, record, stop):
+                return
+        _put(buffer, _END_OF_STREAM, stop)
+    except Exception as ex:  # pylint: disable=broad-except
+        # The error is raised again by the consumer.
+        _put(buffer, ex, stop)
+    finally:
+        if hasattr(stream, "close"):
+            stream.close()
+
+
+def _put(buffer: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    """Put an item into a buffer, unless the consumer has stopped."""
+    while not stop.is_set():
+        try:
+            buffer.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _consume(buffer: queue.Queue) -> Iterator[Dict]:
+    """Yield records from a buffer filled by :func:`_produce`."""
+    while True:
+        item = buffer.get()
+        if item is _END_OF_STREAM:
+            return
+        if isinstance(item, Exception):
+            raise item
+        yield item
@@ -0,0 +1,340 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Lazily converted experiment service records."""
+
+import copy
+from collections.abc import Mapping
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    ItemsView,
+    Iterator,
+    KeysView,
+    Union,
+    ValuesView,
+)
+
+from .constants import RESULT_QUALITY_FROM_API
+from .utils import str_to_utc, utc_to_local
+
+
+class _Missing:
+    """Marker of a field the record does not have, preserved by pickling."""
+
+    __slots__ = ()
+
+    def __reduce__(self) -> str:
+        return "_MISSING"
+
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+_MISSING = _Missing()
+
+
+def _field(key: str, default: Any = None) -> Callable[[Dict, Any], Any]:
+    """Return a decoder copying an API field."""
+    return lambda raw, service: raw.get(key, default)
+
+
+def _mutable_field(key: str, factory: Callable[[], Any]) -> Callable[[Dict, Any], Any]:
+    """Return a decoder copying an API field, with a new default value every time."""
+    return lambda raw, service: raw[key] if key in raw else factory()
+
+
+def _optional_field(key: str) -> Callable[[Dict, Any], Any]:
+    """Return a decoder copying an API field, which is missing if the field is empty."""
+    return lambda raw, service: raw.get(key) or _MISSING
+
+
+class _TimestampField:
+    """Decoder converting an API timestamp to a ``datetime``."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+
+    def decode(self, raw: Dict, utc: bool) -> Any:
+        """Return the timestamp in local time, or in UTC if `utc` is ``True``."""
+        timestamp = raw.get(self.key)
+        if not timestamp:
+            return _MISSING
+        return str_to_utc(timestamp) if utc else utc_to_local(timestamp)
+
+
+def _quality_field(raw: Dict, service: Any) -> Any:
+    """Decode the quality of an analysis result."""
+    # pylint: disable=unused-argument
+    quality = raw.get("quality")
+    return RESULT_QUALITY_FROM_API[quality] if quality else quality
+
+
+class _LazyRecord(dict):
+    """Dictionary record backed by the raw API data.
+
+    The record is a ``dict``, like the dictionaries previously returned by the
+    service. Timestamps, which are expensive to convert, are decoded from the API
+    data the first time they are accessed and then stored in the dictionary.
+    Operations on the whole record, such as iterating over it, comparing it or
+    serializing it, decode all the remaining timestamps first. Fields can also be
+    read as attributes, for example ``record.experiment_id``.
+    """
+
+    __slots__ = ("_raw", "_service", "_utc", "_complete")
+
+    _FIELDS = {}  # type: Dict[str, Union[Callable[[Dict, Any], Any], _TimestampField]]
+    """Field names mapped to functions decoding them from the API data."""
+
+    def __init__(self, raw: Dict, service: Any = None, utc: bool = False) -> None:
+        """Record constructor.
+
+        Args:
+            raw: Record data in API format.
+            service: The service the record was retrieved from.
+            utc: Whether timestamps should be returned in UTC instead of local time.
+        """
+        super().__init__()
+        self._raw = raw
+        self._service = service
+        self._utc = utc
+        self._complete = False
+        for key, decoder in self._FIELDS.items():
+            if not isinstance(decoder, _TimestampField):
+                self._decode(key)
+
+    def _decode(self, key: str) -> Any:
+        """Decode and store a field, returning ``_MISSING`` if the record does not have it."""
+        decoder = self._FIELDS.get(key)
+        if decoder is None or self._complete:
+            return _MISSING
+        if isinstance(decoder, _TimestampField):
+            value = decoder.decode(self._raw, self._utc)
+        else:
+            value = decoder(self._raw, self._service)
+        if value is not _MISSING:
+            dict.__setitem__(self, key, value)
+        return value
+
+    def _decode_all(self) -> None:
+        """Decode all the remaining fields, keeping the fields in their usual order."""
+        if self._complete:
+            return
+        values = {}
+        for key in self._FIELDS:
+            value = dict.get(self, key, _MISSING)
+            if value is _MISSING:
+                value = self._decode(key)
+            if value is not _MISSING:
+                values[key] = value
+        for key, value in dict.items(self):
+            if key not in values:
+                values[key] = value
+        dict.clear(self)
+        dict.update(self, values)
+        self._complete = True
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return dict.__getitem__(self, key)
+        except KeyError:
+            if self._decode(key) is _MISSING:
+                raise
+            return dict.__getitem__(self, key)
+
+    def __delitem__(self, key: str) -> None:
+        self._decode_all()
+        dict.__delitem__(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return dict.__contains__(self, key) or (
+            isinstance(key, str) and self._decode(key) is not _MISSING
+        )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: str, *default: Any) -> Any:
+        self._decode_all()
+        return dict.pop(self, key, *default)
+
+    def popitem(self) -> Any:
+        self._decode_all()
+        return dict.popitem(self)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        self._decode_all()
+        dict.clear(self)
+
+    def __iter__(self) -> Iterator[str]:
+        self._decode_all()
+        return dict.__iter__(self)
+
+    def __len__(self) -> int:
+        self._decode_all()
+        return dict.__len__(self)
+
+    def keys(self) -> KeysView:
+        self._decode_all()
+        return dict.keys(self)
+
+    def values(self) -> ValuesView:
+        self._decode_all()
+        return dict.values(self)
+
+    def items(self) -> ItemsView:
+        self._decode_all()
+        return dict.items(self)
+
+    def __eq__(self, other: object) -> bool:
+        self._decode_all()
+        if isinstance(other, _LazyRecord):
+            other._decode_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __or__(self, other: Any) -> Any:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        new = self.to_dict()
+        new.update(other)
+        return new
+
+    def __ror__(self, other: Any) -> Any:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        new = dict(other)
+        new.update(self.items())
+        return new
+
+    def __ior__(self, other: Any) -> "_LazyRecord":
+        self.update(other)
+        return self
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            ) from None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __reduce__(self) -> Any:
+        self._decode_all()
+        return _restore_record, (
+            type(self),
+            self._raw,
+            self._service,
+            self._utc,
+            dict(self),
+        )
+
+    def copy(self) -> "_LazyRecord":
+        """Return a copy of the record.
+
+        The copy has its own copy of the API data and of the decoded values, so
+        that modifying nested values of the copy, such as its metadata, does not
+        modify the record.
+        """
+        new = type(self)(copy.deepcopy(self._raw), self._service, self._utc)
+        dict.update(new, copy.deepcopy(dict(dict.items(self))))
+        new._complete = self._complete
+        return new
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a plain dictionary, decoding all the fields."""
+        return dict(self.items())
+
+
+def _restore_record(
+    record_class: type, raw: Dict, service: Any, utc: bool, values: Dict
+) -> _LazyRecord:
+    """Rebuild a pickled record."""
+    record = record_class(raw, service, utc)
+    dict.update(record, values)
+    record._complete = True
+    return record
+
+
+class ExperimentRecord(_LazyRecord):
+    """An experiment retrieved from the experiment service."""
+
+    __slots__ = ()
+
+    _FIELDS = {
+        "experiment_type": _field("type"),
+        # The backend name, rather than a backend object which would require a provider.
+        "backend": _field("device_name"),
+        "experiment_id": _field("uuid"),
+        "parent_id": _field("parent_experiment_uuid"),
+        "tags": _field("tags"),
+        "job_ids": _field("jobs"),
+        "share_level": _field("visibility"),
+        "metadata": _field("extra"),
+        "figure_names": _field("plot_names"),
+        "notes": _field("notes", ""),
+        "hub": _field("hub_id", ""),
+        "group": _field("group_id", ""),
+        "project": _field("project_id", ""),
+        "owner": _field("owner", ""),
+        "creation_datetime": _TimestampField("created_at"),
+        "start_datetime": _TimestampField("start_time"),
+        "end_datetime": _TimestampField("end_time"),
+        "updated_datetime": _TimestampField("updated_at"),
+    }
+
+
+class AnalysisResultRecord(_LazyRecord):
+    """An analysis result retrieved from the experiment service."""
+
+    __slots__ = ()
+
+    _FIELDS = {
+        "result_data": _mutable_field("fit", dict),
+        "result_type": _field("type"),
+        "device_components": _mutable_field("device_components", list),
+        "experiment_id": _field("experiment_uuid"),
+        "result_id": _field("uuid"),
+        "quality": _quality_field,
+        "verified": _field("verified", False),
+        "tags": _mutable_field("tags", list),
+        "service": lambda raw, service: service,
+        "chisq": _optional_field("chisq"),
+        "backend_name": _optional_field("device_name"),
+        "creation_datetime": _TimestampField("created_at"),
+        "updated_datetime": _TimestampField("updated_at"),
+    }
@@ -0,0 +1,49 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Helpers of the bulk uploads."""
+
+from collections import namedtuple
+from typing import Iterator, List, Sequence, TypeVar
+
+from .utils import map_api_error
+from ..exceptions import IBMError, RequestsApiError
+
+_T = TypeVar("_T")
+
+UploadResult = namedtuple("UploadResult", ["result_id", "error"])
+"""Outcome of the upload of one entry: its ID, and the error raised by its
+upload, or ``None`` if it was created."""
+
+
+def batches(items: Sequence[_T], size: int) -> Iterator[List[_T]]:
+    """Return consecutive batches of at most `size` items."""
+    for start in range(0, len(items), size):
+        yield list(items[start : start + size])
+
+
+def api_error(message: str, error: RequestsApiError) -> IBMError:
+    """Return the user facing error matching a server error.
+
+    Args:
+        message: Message of the error.
+        error: The server error.
+
+    Returns:
+        The error :func:`~qiskit_ibm_experiment.service.utils.map_api_error`
+        raises for `error`.
+    """
+    try:
+        with map_api_error(message):
+            raise error
+    except IBMError as mapped:
+        return mapped
@@ -12,16 +12,19 @@
 
 """Utilities for working with IBM Quantum experiments."""
 
+import functools
 import logging
 import os
-from typing import Generator, Union, Optional
+import threading
+from typing import Generator, Union, Optional, Iterable, List
 from contextlib import contextmanager
-from datetime import datetime, timedelta, timezone
-import dateutil
+from datetime import datetime, timedelta, timezone, tzinfo
 
 from ..exceptions import (
     IBMExperimentEntryNotFound,
     IBMExperimentEntryExists,
+    IBMExperimentCircuitOpen,
+    CircuitOpenError,
     RequestsApiError,
     IBMApiError,
 )
@@ -32,6 +35,8 @@ def map_api_error(error_msg: str = "") -> Generator[None, None, None]:
     """Convert an ``RequestsApiError`` to a user facing error."""
     try:
         yield
+    except CircuitOpenError as api_err:
+        raise IBMExperimentCircuitOpen(error_msg + f" {api_err}") from None
     except RequestsApiError as api_err:
         if api_err.status_code == 409:
             raise IBMExperimentEntryExists(
@@ -98,9 +103,61 @@ def setup_logger(logger: logging.Logger) -> None:
         logger.setLevel(level)
 
 
+_LOGGER_LOCK = threading.Lock()
+_logger_setup_done = False  # pylint: disable=invalid-name
+
+
+def setup_package_logger() -> None:
+    """Setup the ``qiskit_ibm_experiment`` logger, if not done yet.
+
+    This is done when the first service is created rather than on import, so that
+    importing the package does not change the logging configuration.
+    """
+    global _logger_setup_done  # pylint: disable=global-statement
+    with _LOGGER_LOCK:
+        if not _logger_setup_done:
+            setup_logger(logging.getLogger("qiskit_ibm_experiment"))
+            _logger_setup_done = True
+
+
 # converters
 
 
+@functools.lru_cache(maxsize=None)
+def _local_tz() -> tzinfo:
+    """Return the local time zone.
+
+    It is looked up once, as creating ``tzlocal`` objects is costly, and on first
+    use rather than on import, as importing ``dateutil`` is too.
+    """
+    import dateutil.tz  # pylint: disable=import-outside-toplevel
+
+    return dateutil.tz.tzlocal()
+
+
+def parse_timestamp(timestamp: str) -> datetime:
+    """Parse a timestamp string.
+
+    ISO 8601 timestamps, as returned by the server, are parsed with
+    :meth:`datetime.fromisoformat`. Other formats fall back to ``dateutil``.
+
+    Args:
+        timestamp: Input timestamp string.
+
+    Returns:
+        The parsed ``datetime``. It is only timezone aware if the string includes
+        a time zone.
+    """
+    try:
+        if timestamp.endswith("Z"):
+            return datetime.fromisoformat(timestamp[:-1]).replace(tzinfo=timezone.utc)
+        return datetime.fromisoformat(timestamp)
+    except ValueError:
+        import dateutil.parser  # pylint: disable=import-outside-toplevel
+
+        return dateutil.parser.parse(timestamp)
+
+
 def utc_to_local(utc_dt: Union[datetime, str]) -> datetime:
     """Convert a UTC ``datetime`` object or string to a local timezone ``datetime``.
 
@@ -114,14 +171,32 @@ def utc_to_local(utc_dt: Union[datetime, str]) -> datetime:
         TypeError: If the input parameter value is not valid.
     """
     if isinstance(utc_dt, str):
-        utc_dt = dateutil.parser.parse(utc_dt)
+        utc_dt = parse_timestamp(utc_dt)
     if not isinstance(utc_dt, datetime):
         raise TypeError("Input `utc_dt` is not string or datetime.")
     utc_dt = utc_dt.replace(tzinfo=timezone.utc)  # type: ignore[arg-type]
-    local_dt = utc_dt.astimezone(dateutil.tz.tzlocal())  # type: ignore[attr-defined]
+    local_dt = utc_dt.astimezone(_local_tz())
     return local_dt
 
 
+def utc_to_local_many(
+    utc_dts: Iterable[Optional[Union[datetime, str]]], utc: bool = False
+) -> List[Optional[datetime]]:
+    """Convert UTC ``datetime`` objects or strings to local timezone ``datetime``.
+
+    Args:
+        utc_dts: Input UTC ``datetime`` objects or strings. ``None`` values are
+            returned as ``None``.
+        utc: If ``True``, return UTC ``datetime`` objects instead of converting
+            them to the local timezone.
+
+    Returns:
+        A list of converted ``datetime`` objects.
+    """
+    convert = str_to_utc if utc else utc_to_local
+    return [convert(utc_dt) if utc_dt else None for utc_dt in utc_dts]
+
+
 def local_to_utc(local_dt: Union[datetime, str]) -> datetime:
     """Convert a local ``datetime`` object or string to a UTC ``datetime``.
 
@@ -135,13 +210,15 @@ def local_to_utc(local_dt: Union[datetime, str]) -> datetime:
         TypeError: If the input parameter value is not valid.
     """
     if isinstance(local_dt, str):
-        local_dt = dateutil.parser.parse(local_dt)
+        local_dt = parse_timestamp(local_dt)
     if not isinstance(local_dt, datetime):
         raise TypeError("Input `local_dt` is not string or datetime.")
 
     # Input is considered local if it's ``utcoffset()`` is ``None`` or none-zero.
     if local_dt.utcoffset() is None or local_dt.utcoffset() != timedelta(0):
-        local_dt = local_dt.replace(tzinfo=dateutil.tz.tzlocal())
+        import dateutil.tz  # pylint: disable=import-outside-toplevel
+
+        local_dt = local_dt.replace(tzinfo=_local_tz())
         return local_dt.astimezone(dateutil.tz.UTC)
     return local_dt  # Already in UTC.
 
@@ -163,16 +240,17 @@ def local_to_utc_str(local_dt: Union[datetime, str], suffix: str = "Z") -> str:
     return utc_dt_str
 
 
-def str_to_utc(utc_dt: Optional[str]) -> Optional[datetime]:
+def str_to_utc(utc_dt: Optional[Union[datetime, str]]) -> Optional[datetime]:
     """Convert a UTC string to a ``datetime`` object with UTC timezone.
 
     Args:
-        utc_dt: Input UTC string in ISO format.
+        utc_dt: Input UTC string in ISO format, or UTC ``datetime``.
 
     Returns:
         A ``datetime`` with the UTC timezone, or ``None`` if the input is ``None``.
     """
     if not utc_dt:
         return None
-    parsed_dt = dateutil.parser.isoparse(utc_dt)
-    return parsed_dt.replace(tzinfo=timezone.utc)
+    if isinstance(utc_dt, str):
+        utc_dt = parse_timestamp(utc_dt)
+    return utc_dt.replace(tzinfo=timezone.utc)
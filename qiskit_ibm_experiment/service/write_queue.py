@@ -0,0 +1,218 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Bounded queue of writes run in the background."""
+
+import contextvars
+import logging
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set
+
+from ..exceptions import IBMExperimentQueueFull
+
+logger = logging.getLogger(__name__)
+
+WriteFailure = namedtuple("WriteFailure", ["operation", "key", "error"])
+"""Write that failed in the background: the name of its operation, such as
+``"create_analysis_result"``, the key of the entry it wrote, such as the ID of
+the analysis result, and the error it raised."""
+
+
+class _Write:
+    """Queued write, with the writes waiting for it."""
+
+    __slots__ = (
+        "operation",
+        "key",
+        "after",
+        "function",
+        "context",
+        "waiting_for",
+        "waiters",
+    )
+
+    def __init__(
+        self,
+        operation: str,
+        key: Hashable,
+        after: Optional[Hashable],
+        function: Callable[[], Any],
+    ) -> None:
+        self.operation = operation
+        self.key = key
+        self.after = after
+        self.function = function
+        self.context = contextvars.copy_context()
+        self.waiting_for = 0
+        self.waiters = []  # type: List[_Write]
+
+
+class _Entry:
+    """Pending writes of an entry."""
+
+    __slots__ = ("writer", "readers")
+
+    def __init__(self) -> None:
+        self.writer = None  # type: Optional[_Write]
+        self.readers = set()  # type: Set[_Write]
+
+
+class WriteQueue:
+    """Bounded queue of writes run in the background by a pool of threads.
+
+    Each write has the key of the entry it writes, such as the ID of an
+    experiment, and can have the key of an entry that must be written before it,
+    such as the ID of the experiment of an analysis result. A write runs after
+    the pending writes queued before it with the same key, and after those of
+    the entry it depends on; a write of an entry also waits for the pending
+    writes depending on the entry. So an experiment is created before its
+    analysis results and figures, which are created concurrently, and an
+    analysis result is created before it is updated.
+    """
+
+    def __init__(
+        self,
+        max_pending: int = 1000,
+        max_workers: int = 4,
+        on_error: Optional[Callable[[WriteFailure], None]] = None,
+    ) -> None:
+        """WriteQueue constructor.
+
+        Args:
+            max_pending: Maximum number of queued and running writes. Queuing
+                more writes waits for some to complete.
+            max_workers: Number of threads running the writes.
+            on_error: Function called with a :class:`WriteFailure` when a write
+                fails, from the thread that ran it. The failures are logged if
+                ``None``.
+        """
+        self.max_pending = max_pending
+        self.on_error = on_error
+        self._condition = threading.Condition()
+        self._entries = {}  # type: Dict[Hashable, _Entry]
+        self._pending = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ibm_experiment_write"
+        )
+
+    def submit(
+        self,
+        key: Hashable,
+        operation: str,
+        function: Callable[[], Any],
+        after: Optional[Hashable] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Queue a write.
+
+        Args:
+            key: Key of the entry written.
+            operation: Name of the write, reported if it fails.
+            function: Function doing the write.
+            after: Key of the entry that must be written first, if any.
+            timeout: Number of seconds to wait for room in the queue if it is
+                full. ``None`` waits until there is room.
+
+        Raises:
+            IBMExperimentQueueFull: If the queue is still full after `timeout`.
+        """
+        if after == key:
+            after = None
+        write = _Write(operation, key, after, function)
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: self._pending < self.max_pending, timeout
+            ):
+                raise IBMExperimentQueueFull(
+                    f"Cannot queue {operation}: {self._pending} writes are pending."
+                )
+            self._pending += 1
+            entry = self._entries.setdefault(key, _Entry())
+            waiting_for = list(entry.readers)
+            if entry.writer is not None:
+                waiting_for.append(entry.writer)
+            entry.writer, entry.readers = write, set()
+            if after is not None:
+                entry = self._entries.setdefault(after, _Entry())
+                if entry.writer is not None:
+                    waiting_for.append(entry.writer)
+                entry.readers.add(write)
+            for other in waiting_for:
+                other.waiters.append(write)
+            write.waiting_for = len(waiting_for)
+        if not waiting_for:
+            self._executor.submit(self._run, write)
+
+    def pending(self) -> int:
+        """Return the number of queued and running writes."""
+        return self._pending
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the pending writes to complete.
+
+        Args:
+            timeout: Maximum number of seconds to wait. ``None`` waits until all
+                the writes complete.
+
+        Returns:
+            Whether all the writes completed.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self) -> None:
+        """Wait for the pending writes to complete, and stop the threads."""
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    def _run(self, write: _Write) -> None:
+        """Run a write, and then the writes that were only waiting for it."""
+        try:
+            write.context.run(write.function)
+        except Exception as ex:  # pylint: disable=broad-except
+            self._report(WriteFailure(write.operation, write.key, ex))
+        ready = []
+        with self._condition:
+            for waiter in write.waiters:
+                waiter.waiting_for -= 1
+                if not waiter.waiting_for:
+                    ready.append(waiter)
+            for key in (write.key, write.after):
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                if entry.writer is write:
+                    entry.writer = None
+                entry.readers.discard(write)
+                if entry.writer is None and not entry.readers:
+                    del self._entries[key]
+            self._pending -= 1
+            self._condition.notify_all()
+        for waiter in ready:
+            self._executor.submit(self._run, waiter)
+
+    def _report(self, failure: WriteFailure) -> None:
+        """Report a failed write."""
+        if self.on_error is None:
+            logger.error(
+                "Background %s of %s failed: %s",
+                failure.operation,
+                failure.key,
+                failure.error,
+            )
+            return
+        try:
+            self.on_error(failure)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Write error callback failed.")
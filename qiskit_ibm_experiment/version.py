@@ -17,9 +17,10 @@ Example::
     print(__version__)
 """
 
+import functools
 import os
 import subprocess
-from typing import List
+from typing import Any, List
 
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -64,6 +65,7 @@ with open(os.path.join(ROOT_DIR, "VERSION.txt"), "r") as version_file:
     VERSION = version_file.read().strip()
 
 
+@functools.lru_cache(maxsize=None)
 def get_version_info() -> str:
     """Get the full version string."""
     # Adding the git rev number needs to be done inside
@@ -88,4 +90,12 @@ def get_version_info() -> str:
     return full_version
 
 
-__version__ = get_version_info()
+def __getattr__(name: str) -> Any:
+    """Return ``__version__``, which is computed on first use.
+
+    Computing the version can run ``git`` when the package is used from a
+    checkout, which is not done on import.
+    """
+    if name == "__version__":
+        return get_version_info()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
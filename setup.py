@@ -67,8 +67,12 @@ setuptools.setup(
         "Topic :: Scientific/Engineering",
     ],
     keywords="qiskit sdk quantum api experiment ibm",
-    packages=setuptools.find_packages(exclude=["test*"]),
+    packages=setuptools.find_packages(exclude=["test*", "benchmarks*"]),
     install_requires=REQUIREMENTS,
+    extras_require={
+        "async": ["aiohttp>=3.8"],
+        "tracing": ["opentelemetry-api>=1.0"],
+    },
     include_package_data=True,
     python_requires=">=3.7",
     zip_safe=False,
@@ -0,0 +1,321 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Local stand-in for the result DB server, used by the tests."""
+
+import gzip
+import hashlib
+import json
+import re
+import threading
+import uuid
+from collections import Counter, deque
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from test.service.local_client import LocalExperimentClient
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlsplit
+
+from qiskit_ibm_experiment import IBMExperimentService
+from qiskit_ibm_experiment.exceptions import RequestsApiError
+
+ACCESS_TOKEN = "fake-access-token"
+
+# Provider of the experiments created by the tests.
+PROVIDER = SimpleNamespace(
+    credentials=SimpleNamespace(hub="hub", group="group", project="project")
+)
+
+# Query parameters of the list endpoints mapped to the client arguments.
+_EXPERIMENT_PARAMS = {
+    "device_name": "backend_name",
+    "type": "experiment_type",
+    "hub_id": "hub",
+    "group_id": "group",
+    "project_id": "project",
+    "parent_experiment_uuid": "parent_id",
+    "sort": "sort_by",
+}
+_ANALYSIS_RESULT_PARAMS = {
+    "device_name": "backend_name",
+    "type": "result_type",
+    "sort": "sort_by",
+}
+_LIST_PARAMS = {"start_time", "updated_at", "created_at"}
+
+
+class FakeResultsDBServer:
+    """HTTP server serving the result DB API from a :class:`LocalExperimentClient`.
+
+    The server runs in a background thread and accepts the access token returned
+    by its login endpoint. Use it as a context manager::
+
+        with FakeResultsDBServer() as server:
+            service = IBMExperimentService(token="token", url=server.url)
+    """
+
+    def __init__(self):
+        self.client = LocalExperimentClient()
+        self.requests = Counter()
+        self.logins = 0
+        self.access_tokens = set()
+        self.token_ttl = None
+        self.failures = deque()
+        self.request_encodings = {"gzip"}
+        self.compress_min_size = 256
+        self.received = []
+        self.validators = True
+        self.bulk_endpoint = True
+        self.not_modified = 0
+        self.last_modified = formatdate(usegmt=True)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.fake = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        """Return the base URL of the server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Start serving requests."""
+        self._thread.start()
+
+    def stop(self):
+        """Stop serving requests."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def revoke_tokens(self):
+        """Reject the access tokens issued so far."""
+        with self._lock:
+            self.access_tokens.clear()
+
+    def fail_next(self, status, count=1, headers=None):
+        """Make the next requests fail with the given status code."""
+        with self._lock:
+            self.failures.extend([(status, headers or {})] * count)
+
+    def record(self, method, path):
+        """Count a request, returning the failure to respond with, if any."""
+        with self._lock:
+            self.requests[(method, path)] += 1
+            return self.failures.popleft() if self.failures else None
+
+    def handle(self, method, path, query, body):
+        """Handle an API request.
+
+        Returns:
+            The status code and the JSON-serializable or bytes response body.
+        """
+        if path == "/v2/users/loginWithToken":
+            with self._lock:
+                self.logins += 1
+                token = f"{ACCESS_TOKEN}-{self.logins}"
+                self.access_tokens.add(token)
+            if self.token_ttl is None:
+                return 200, {"id": token}
+            return 200, {"id": token, "ttl": self.token_ttl}
+        path = path[len("/resultsdb") :]
+        client = self.client
+        if method == "GET" and path == "/experiments":
+            return 200, client.experiments(**_list_args(query, _EXPERIMENT_PARAMS))
+        if method == "GET" and path == "/analysis_results":
+            return 200, client.analysis_results(
+                **_list_args(query, _ANALYSIS_RESULT_PARAMS)
+            )
+        if method == "POST" and path == "/experiments":
+            return 200, client.experiment_upload(body.decode("utf-8"))
+        if method == "POST" and path == "/analysis_results":
+            return 200, client.analysis_result_create(body.decode("utf-8"))
+        if method == "POST" and path == "/analysis_results/bulk" and self.bulk_endpoint:
+            return 200, client.analysis_results_bulk_create(body.decode("utf-8"))
+        if method == "GET" and path == "/devices":
+            return 200, {"devices": client.devices()}
+        if method == "GET" and path == "/device_components":
+            return 200, {
+                "device_components": client.device_components(
+                    query.get("device_name", [None])[0]
+                )
+            }
+        match = re.fullmatch(r"/(experiments|analysis_results)/([^/]+)", path)
+        if match:
+            kind, uuid = match.groups()
+            if kind == "experiments":
+                get, update, delete = (
+                    client.experiment_get,
+                    client.experiment_update,
+                    client.experiment_delete,
+                )
+            else:
+                get, update, delete = (
+                    client.analysis_result_get,
+                    client.analysis_result_update,
+                    client.analysis_result_delete,
+                )
+            if method == "GET":
+                return 200, get(uuid)
+            if method == "PUT":
+                return 200, update(uuid, body.decode("utf-8"))
+            if method == "DELETE":
+                return 200, delete(uuid)
+        return 404, {"error": {"message": "Not found", "code": 404}}
+
+
+def service_for(server, service_class=IBMExperimentService, **kwargs):
+    """Return a service using the API of a :class:`FakeResultsDBServer`.
+
+    Args:
+        server: The server.
+        service_class: Class of the service.
+        **kwargs: Other arguments of the service.
+
+    Returns:
+        The service.
+    """
+    return service_class(token="api-token", url=server.url, **kwargs)
+
+
+def create_experiment(service, **kwargs):
+    """Create a T1 experiment of :data:`PROVIDER` and return its ID.
+
+    Args:
+        service: Service creating the experiment. The ID is awaitable if it is
+            asynchronous.
+        **kwargs: Arguments of ``create_experiment`` replacing the defaults.
+
+    Returns:
+        The experiment ID.
+    """
+    arguments = {
+        "experiment_type": "T1",
+        "backend_name": "ibmq_lima",
+        "provider": PROVIDER,
+        "experiment_id": str(uuid.uuid4()),
+    }
+    arguments.update(kwargs)
+    return service.create_experiment(**arguments)
+
+
+def _list_args(query, renames):
+    """Return the client arguments of a list request."""
+    args = {}
+    for key, values in query.items():
+        value = values if key in _LIST_PARAMS else values[0]
+        if key == "limit":
+            value = int(value)
+        args[renames.get(key, key)] = value
+    if "visibility" in args:
+        visibility = args.pop("visibility")
+        args["exclude_public" if visibility == "!public" else "public_only"] = True
+    if "owner" in args:
+        owner = args.pop("owner")
+        args["exclude_mine" if owner == "!me" else "mine_only"] = True
+    if "verified" in args:
+        args["verified"] = args["verified"] == "true"
+    args.setdefault("backend_name", None)
+    args.setdefault("limit", None)
+    args.setdefault("marker", None)
+    return args
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler forwarding requests to the fake server."""
+
+    protocol_version = "HTTP/1.1"
+
+    def _serve(self):
+        fake = self.server.fake
+        parts = urlsplit(self.path)
+        failure = fake.record(self.command, parts.path)
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        encoding = self.headers.get("Content-Encoding")
+        fake.received.append(
+            (
+                self.command,
+                parts.path,
+                encoding,
+                len(body),
+                self.headers.get("traceparent"),
+            )
+        )
+        headers = {}
+        if encoding and encoding not in fake.request_encodings:
+            status = 415
+            payload = {"error": {"message": "Unsupported encoding", "code": 415}}
+        elif failure:
+            status, headers = failure
+            payload = {"error": {"message": "Injected failure", "code": status}}
+        elif (
+            not parts.path.startswith("/v2/users")
+            and self.headers.get("X-Access-Token") not in fake.access_tokens
+        ):
+            status, payload = 401, {"error": {"message": "Unauthorized", "code": 401}}
+        else:
+            if encoding == "gzip":
+                body = gzip.decompress(body)
+            try:
+                status, payload = fake.handle(
+                    self.command, parts.path, parse_qs(parts.query), body
+                )
+            except RequestsApiError as err:
+                status = err.status_code
+                payload = {"error": {"message": str(err), "code": status}}
+        if isinstance(payload, str):
+            data = payload.encode("utf-8")
+        elif isinstance(payload, bytes):
+            data = payload
+        else:
+            data = json.dumps(payload).encode("utf-8")
+        if self.command != "GET" and status == 200:
+            fake.last_modified = formatdate(usegmt=True)
+        elif self.command == "GET" and status == 200 and fake.validators:
+            headers["ETag"] = '"{}"'.format(hashlib.sha1(data).hexdigest())
+            headers["Last-Modified"] = fake.last_modified
+            if self._not_modified(headers):
+                fake.not_modified += 1
+                status, data = 304, b""
+        if len(data) >= fake.compress_min_size and "gzip" in self.headers.get(
+            "Accept-Encoding", ""
+        ):
+            data = gzip.compress(data)
+            headers["Content-Encoding"] = "gzip"
+        if fake.request_encodings:
+            headers["Accept-Encoding"] = ", ".join(sorted(fake.request_encodings))
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _not_modified(self, headers):
+        """Return whether the client has the current version of the response."""
+        if "If-None-Match" in self.headers:
+            return self.headers["If-None-Match"] == headers["ETag"]
+        return self.headers.get("If-Modified-Since") == headers["Last-Modified"]
+
+    do_GET = do_POST = do_PUT = do_DELETE = _serve
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Do not log requests."""
@@ -0,0 +1,702 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""In-memory stand-in for the experiment database client, used by the tests."""
+
+import json
+import logging
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import List, Dict, Optional, Union, Any, Callable, Iterator
+
+from qiskit_ibm_experiment import IBMExperimentService
+from qiskit_ibm_experiment.exceptions import RequestsApiError
+
+logger = logging.getLogger(__name__)
+
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class LocalExperimentClient:
+    """In-memory stand-in for :class:`ExperimentClient`.
+
+    This client implements the same interface as :class:`ExperimentClient`, but
+    stores experiments, analysis results, figures and files in memory instead
+    of sending them to the experiment database. All the entries are owned by
+    the local user.
+    """
+
+    def __init__(self) -> None:
+        """LocalExperimentClient constructor."""
+        self._experiments = {}  # type: Dict[str, Dict]
+        self._analysis_results = {}  # type: Dict[str, Dict]
+        self._figures = {}  # type: Dict[str, Dict[str, bytes]]
+        self._files = {}  # type: Dict[str, Dict[str, str]]
+        self._lock = threading.RLock()
+
+    def devices(self) -> List:
+        """Return the device list from the experiment DB."""
+        return []
+
+    def close(self) -> None:
+        """Close the client. Entries are kept in memory."""
+
+    def circuit_states(self) -> Dict:
+        """Return an empty dictionary, since the local client has no breakers."""
+        return {}
+
+    def metrics(self) -> None:
+        """Return ``None``, since the local client does not send requests."""
+        return None
+
+    def transfer_stats(self, reset: bool = False) -> None:
+        """Return ``None``, since the local client does not transfer data."""
+        # pylint: disable=unused-argument
+        return None
+
+    def experiments(
+        self,
+        limit: Optional[int],
+        marker: Optional[str],
+        backend_name: Optional[str],
+        experiment_type: Optional[str] = None,
+        start_time: Optional[List] = None,
+        device_components: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        hub: Optional[str] = None,
+        group: Optional[str] = None,
+        project: Optional[str] = None,
+        exclude_public: Optional[bool] = False,
+        public_only: Optional[bool] = False,
+        exclude_mine: Optional[bool] = False,
+        mine_only: Optional[bool] = False,
+        parent_id: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        page_size: Optional[int] = None,
+        updated_at: Optional[List] = None,
+        stream: bool = False,
+    ) -> Union[str, Iterator[bytes]]:
+        """Retrieve experiments, with optional filtering.
+
+        Args:
+            limit: Number of experiments to retrieve.
+            marker: Marker used to indicate where to start the next query.
+            backend_name: Name of the backend.
+            experiment_type: Experiment type.
+            start_time: A list of timestamps used to filter by experiment start time.
+            device_components: A list of device components used for filtering.
+                Experiments do not store device components, so this is ignored.
+            tags: Tags used for filtering.
+            hub: Filter by hub.
+            group: Filter by hub and group.
+            project: Filter by hub, group, and project.
+            exclude_public: Whether or not to exclude experiments with a public share level.
+            public_only: Whether or not to only return experiments with a public share level.
+            exclude_mine: Whether or not to exclude experiments where I am the owner.
+            mine_only: Whether or not to only return experiments where I am the owner.
+            parent_id: Filter by parent experiment ID.
+            sort_by: Sorting order.
+            page_size: Maximum number of experiments to retrieve in this request.
+            updated_at: A list of timestamps used to filter by last update time.
+            stream: Whether to return the response as an iterator of encoded chunks.
+
+        Returns:
+            A list of experiments and the marker, if applicable. If `stream` is
+            ``True``, an iterator of the encoded response chunks.
+        """
+        # pylint: disable=unused-argument
+        filters = [
+            _equal_filter("device_name", backend_name),
+            _text_filter("type", experiment_type),
+            _time_filter("start_time", start_time),
+            _time_filter("updated_at", updated_at),
+            _tags_filter(tags),
+            _equal_filter("hub_id", hub),
+            _equal_filter("group_id", group),
+            _equal_filter("project_id", project),
+            _equal_filter("parent_experiment_uuid", parent_id),
+        ]
+        if exclude_public:
+            filters.append(lambda entry: entry.get("visibility") != "public")
+        if public_only:
+            filters.append(lambda entry: entry.get("visibility") == "public")
+        if exclude_mine:
+            filters.append(lambda entry: False)
+        with self._lock:
+            entries = list(self._experiments.values())
+        return self._page(
+            "experiments",
+            entries,
+            filters,
+            sort_by or "start_time:desc",
+            limit,
+            marker,
+            page_size,
+            stream,
+        )
+
+    def experiment_get(self, experiment_id: str) -> str:
+        """Get a specific experiment.
+
+        Args:
+            experiment_id: Experiment uuid.
+
+        Returns:
+            Experiment data.
+        """
+        with self._lock:
+            return json.dumps(self._get("experiment", self._experiments, experiment_id))
+
+    def experiment_upload(self, data: str) -> Dict:
+        """Upload an experiment.
+
+        Args:
+            data: Experiment data.
+
+        Returns:
+            Experiment data.
+        """
+        entry = {
+            "jobs": [],
+            "tags": [],
+            "visibility": "private",
+            "owner": "",
+            "plot_names": [],
+            **json.loads(data),
+        }
+        with self._lock:
+            entry = self._create("experiment", self._experiments, entry)
+            self._figures[entry["uuid"]] = {}
+            self._files[entry["uuid"]] = {}
+        return entry
+
+    def experiment_update(self, experiment_id: str, new_data: str) -> Dict:
+        """Update an experiment.
+
+        Args:
+            experiment_id: Experiment UUID.
+            new_data: New experiment data.
+
+        Returns:
+            Experiment data.
+        """
+        with self._lock:
+            return self._update(
+                "experiment", self._experiments, experiment_id, json.loads(new_data)
+            )
+
+    def experiment_delete(self, experiment_id: str) -> Dict:
+        """Delete an experiment.
+
+        Args:
+            experiment_id: Experiment UUID.
+
+        Returns:
+            JSON response.
+        """
+        with self._lock:
+            entry = self._get("experiment", self._experiments, experiment_id)
+            del self._experiments[experiment_id]
+            self._figures.pop(experiment_id, None)
+            self._files.pop(experiment_id, None)
+            for result_id, result in list(self._analysis_results.items()):
+                if result.get("experiment_uuid") == experiment_id:
+                    del self._analysis_results[result_id]
+        return entry
+
+    def experiment_plot_upload(
+        self,
+        experiment_id: str,
+        plot: Union[bytes, str],
+        plot_name: str,
+        sync_upload: bool = True,
+    ) -> Dict:
+        """Upload an experiment plot.
+
+        Args:
+            experiment_id: Experiment UUID.
+            plot: Plot file name or data to upload.
+            plot_name: Name of the plot.
+            sync_upload: Ignored, plots are always stored immediately.
+
+        Returns:
+            JSON response.
+        """
+        # pylint: disable=unused-argument
+        with self._lock:
+            self._get("experiment", self._experiments, experiment_id)
+            if plot_name in self._figures[experiment_id]:
+                raise RequestsApiError(f"Figure {plot_name} already exists.", 409)
+            return self._store_plot(experiment_id, plot, plot_name)
+
+    def experiment_plot_update(
+        self,
+        experiment_id: str,
+        plot: Union[bytes, str],
+        plot_name: str,
+        sync_upload: bool = True,
+    ) -> Dict:
+        """Update an experiment plot.
+
+        Args:
+            experiment_id: Experiment UUID.
+            plot: Plot file name or data to upload.
+            plot_name: Name of the plot.
+            sync_upload: Ignored, plots are always stored immediately.
+
+        Returns:
+            JSON response.
+        """
+        # pylint: disable=unused-argument
+        with self._lock:
+            self._get_plot(experiment_id, plot_name)
+            return self._store_plot(experiment_id, plot, plot_name)
+
+    def experiment_plot_get(self, experiment_id: str, plot_name: str) -> bytes:
+        """Retrieve an experiment plot.
+
+        Args:
+            experiment_id: Experiment UUID.
+            plot_name: Name of the plot.
+
+        Returns:
+            Retrieved experiment plot.
+        """
+        with self._lock:
+            return self._get_plot(experiment_id, plot_name)
+
+    def experiment_plot_delete(self, experiment_id: str, plot_file_name: str) -> None:
+        """Delete an experiment plot.
+
+        Args:
+            experiment_id: Experiment UUID.
+            plot_file_name: Plot file name.
+        """
+        with self._lock:
+            self._get_plot(experiment_id, plot_file_name)
+            del self._figures[experiment_id][plot_file_name]
+            self._experiments[experiment_id]["plot_names"].remove(plot_file_name)
+            self._touch(self._experiments[experiment_id])
+
+    def experiment_devices(self) -> List:
+        """Return list of experiment devices."""
+        return []
+
+    def analysis_results(
+        self,
+        limit: Optional[int],
+        marker: Optional[str],
+        backend_name: Optional[str] = None,
+        device_components: Optional[Union[str, List[str]]] = None,
+        experiment_uuid: Optional[str] = None,
+        result_type: Optional[str] = None,
+        quality: Optional[Union[str, List[str]]] = None,
+        verified: Optional[bool] = None,
+        tags: Optional[List[str]] = None,
+        created_at: Optional[List] = None,
+        sort_by: Optional[str] = None,
+        page_size: Optional[int] = None,
+        updated_at: Optional[List] = None,
+        stream: bool = False,
+    ) -> Union[str, Iterator[bytes]]:
+        """Return a list of analysis results.
+
+        Args:
+            limit: Number of analysis results to retrieve.
+            marker: Marker used to indicate where to start the next query.
+            backend_name: Name of the backend.
+            device_components: A list of device components used for filtering.
+            experiment_uuid: Experiment UUID used for filtering.
+            result_type: Analysis result type used for filtering.
+            quality: Quality value used for filtering.
+            verified: Indicates whether this result has been verified.
+            tags: Filter by tags assigned to analysis results.
+            created_at: A list of timestamps used to filter by creation time.
+            sort_by: Indicates how the output should be sorted.
+            page_size: Maximum number of analysis results to retrieve in this request.
+            updated_at: A list of timestamps used to filter by last update time.
+            stream: Whether to return the response as an iterator of encoded chunks.
+
+        Returns:
+            A list of analysis results and the marker, if applicable. If `stream`
+            is ``True``, an iterator of the encoded response chunks.
+        """
+        filters = [
+            _equal_filter("device_name", backend_name),
+            _components_filter(device_components),
+            _equal_filter("experiment_uuid", experiment_uuid),
+            _text_filter("type", result_type),
+            _quality_filter(quality),
+            _equal_filter("verified", verified),
+            _tags_filter(tags),
+            _time_filter("created_at", created_at),
+            _time_filter("updated_at", updated_at),
+        ]
+        with self._lock:
+            entries = [
+                self._with_device_name(entry)
+                for entry in self._analysis_results.values()
+            ]
+        return self._page(
+            "analysis_results",
+            entries,
+            filters,
+            sort_by or "created_at:desc",
+            limit,
+            marker,
+            page_size,
+            stream,
+        )
+
+    def analysis_result_create(self, result: str) -> Dict:
+        """Upload an analysis result.
+
+        Args:
+            result: The analysis result to upload.
+
+        Returns:
+            Analysis result data.
+        """
+        entry = {
+            "device_components": [],
+            "fit": {},
+            "tags": [],
+            "verified": False,
+            **json.loads(result),
+        }
+        with self._lock:
+            self._get("experiment", self._experiments, entry.get("experiment_uuid"))
+            entry = self._create("analysis result", self._analysis_results, entry)
+            return self._with_device_name(entry)
+
+    def analysis_results_bulk_create(self, results: str) -> Dict:
+        """Upload analysis results with one request.
+
+        Args:
+            results: JSON list of the analysis results to upload.
+
+        Returns:
+            Created analysis results or errors, in the order of `results`.
+        """
+        created = []
+        for result in json.loads(results):
+            try:
+                created.append(self.analysis_result_create(json.dumps(result)))
+            except RequestsApiError as err:
+                created.append(
+                    {"error": {"message": str(err), "code": err.status_code}}
+                )
+        return {"analysis_results": created}
+
+    def analysis_result_update(self, result_id: str, new_data: str) -> Dict:
+        """Update an analysis result.
+
+        Args:
+            result_id: Analysis result ID.
+            new_data: New analysis result data.
+
+        Returns:
+            Analysis result data.
+        """
+        with self._lock:
+            entry = self._update(
+                "analysis result",
+                self._analysis_results,
+                result_id,
+                json.loads(new_data),
+            )
+            return self._with_device_name(entry)
+
+    def analysis_result_delete(self, result_id: str) -> Dict:
+        """Delete an analysis result.
+
+        Args:
+            result_id: Analysis result ID.
+
+        Returns:
+            Analysis result data.
+        """
+        with self._lock:
+            entry = self._get("analysis result", self._analysis_results, result_id)
+            del self._analysis_results[result_id]
+        return entry
+
+    def analysis_result_get(self, result_id: str) -> str:
+        """Retrieve an analysis result.
+
+        Args:
+            result_id: Analysis result ID.
+
+        Returns:
+            Analysis result data.
+        """
+        with self._lock:
+            entry = self._get("analysis result", self._analysis_results, result_id)
+            return json.dumps(self._with_device_name(entry))
+
+    def experiment_files_get(self, experiment_id: str) -> Dict:
+        """Retrieve experiment related files.
+
+        Args:
+            experiment_id: Experiment ID.
+
+        Returns:
+            Experiment files.
+        """
+        with self._lock:
+            self._get("experiment", self._experiments, experiment_id)
+            files = [
+                {"Key": name, "Size": len(data)}
+                for name, data in self._files[experiment_id].items()
+            ]
+        return {"files": files, "files_count": len(files)}
+
+    def experiment_file_upload(
+        self, experiment_id: str, file_name: str, file_data: str
+    ) -> None:
+        """Uploads a data file to the DB
+
+        Args:
+            experiment_id: The experiment the data file belongs to
+            file_name: The expected filename of the data file
+            file_data: The data to upload
+        """
+        with self._lock:
+            self._get("experiment", self._experiments, experiment_id)
+            self._files[experiment_id][file_name] = file_data
+
+    def experiment_file_download(self, experiment_id: str, file_name: str) -> Dict:
+        """Downloads a data file from the DB
+
+        Args:
+            experiment_id: The experiment the data file belongs to
+            file_name: The expected filename of the data file
+
+        Returns:
+            The JSON deserialization of the data file
+        """
+        with self._lock:
+            self._get("experiment", self._experiments, experiment_id)
+            if file_name not in self._files[experiment_id]:
+                raise RequestsApiError(f"File {file_name} not found.", 404)
+            return json.loads(self._files[experiment_id][file_name])
+
+    def device_components(self, backend_name: Optional[str]) -> List[Dict]:
+        """Get device components for the backends.
+
+        Args:
+            backend_name: Name of the backend.
+
+        Returns:
+            A list of device components.
+        """
+        # pylint: disable=unused-argument
+        return []
+
+    def _create(self, kind: str, entries: Dict[str, Dict], entry: Dict) -> Dict:
+        """Store a new entry."""
+        entry_id = entry.setdefault("uuid", str(uuid.uuid4()))
+        if entry_id in entries:
+            raise RequestsApiError(f"The {kind} {entry_id} already exists.", 409)
+        entry["created_at"] = _now()
+        entry["updated_at"] = entry["created_at"]
+        entries[entry_id] = entry
+        return dict(entry)
+
+    def _update(
+        self, kind: str, entries: Dict[str, Dict], entry_id: str, new_data: Dict
+    ) -> Dict:
+        """Update an existing entry."""
+        entry = self._get(kind, entries, entry_id)
+        entry.update(new_data)
+        self._touch(entry)
+        return dict(entry)
+
+    def _get(self, kind: str, entries: Dict[str, Dict], entry_id: str) -> Dict:
+        """Return an existing entry."""
+        if entry_id not in entries:
+            raise RequestsApiError(f"The {kind} {entry_id} does not exist.", 404)
+        return entries[entry_id]
+
+    def _get_plot(self, experiment_id: str, plot_name: str) -> bytes:
+        """Return an existing plot."""
+        self._get("experiment", self._experiments, experiment_id)
+        if plot_name not in self._figures[experiment_id]:
+            raise RequestsApiError(f"Figure {plot_name} not found.", 404)
+        return self._figures[experiment_id][plot_name]
+
+    def _store_plot(
+        self, experiment_id: str, plot: Union[bytes, str], plot_name: str
+    ) -> Dict:
+        """Store the content of a plot."""
+        if isinstance(plot, str):
+            with open(plot, "rb") as file:
+                plot = file.read()
+        self._figures[experiment_id][plot_name] = plot
+        experiment = self._experiments[experiment_id]
+        if plot_name not in experiment["plot_names"]:
+            experiment["plot_names"].append(plot_name)
+        self._touch(experiment)
+        return {"name": plot_name, "size": len(plot)}
+
+    def _with_device_name(self, result: Dict) -> Dict:
+        """Return a copy of an analysis result with the backend of its experiment."""
+        experiment = self._experiments.get(result.get("experiment_uuid"), {})
+        return {**result, "device_name": experiment.get("device_name")}
+
+    @staticmethod
+    def _touch(entry: Dict) -> None:
+        """Mark an entry as updated."""
+        entry["updated_at"] = _now()
+
+    @staticmethod
+    def _page(
+        records_key: str,
+        entries: List[Dict],
+        filters: List[Optional[Callable[[Dict], bool]]],
+        sort_by: str,
+        limit: Optional[int],
+        marker: Optional[str],
+        page_size: Optional[int],
+        stream: bool = False,
+    ) -> Union[str, Iterator[bytes]]:
+        """Filter and sort entries, returning a single page in server format."""
+        filters = [entry_filter for entry_filter in filters if entry_filter]
+        matches = [
+            dict(entry)
+            for entry in entries
+            if all(entry_filter(entry) for entry_filter in filters)
+        ]
+        # Sort by the least significant key first, relying on sort stability.
+        for sorter in reversed(sort_by.split(",")):
+            key, direction = sorter.split(":")
+            matches.sort(key=lambda entry: entry.get(key) or "")
+            if direction == "desc":
+                matches.reverse()
+            # Entries without the key are always last.
+            matches.sort(key=lambda entry: entry.get(key) is None)
+        start = int(marker) if marker else 0
+        if page_size is not None:
+            limit = page_size if limit is None else min(limit, page_size)
+        end = start + limit if limit else len(matches)
+        response = {records_key: matches[start:end]}  # type: Dict[str, Any]
+        if end < len(matches):
+            response["marker"] = str(end)
+        if stream:
+            data = json.dumps(response).encode("utf-8")
+            return (
+                data[idx : idx + _STREAM_CHUNK_SIZE]
+                for idx in range(0, len(data), _STREAM_CHUNK_SIZE)
+            )
+        return json.dumps(response)
+
+
+def local_service(**kwargs: Any) -> IBMExperimentService:
+    """Return a local service storing its entries in a :class:`LocalExperimentClient`.
+
+    Args:
+        **kwargs: Other arguments of the service.
+
+    Returns:
+        The service.
+    """
+    service = IBMExperimentService(local=True, **kwargs)
+    service._api_client = LocalExperimentClient()
+    return service
+
+
+def _now() -> str:
+    """Return the current UTC time in server format."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _equal_filter(field: str, value: Any) -> Optional[Callable[[Dict], bool]]:
+    """Return a filter matching entries whose field equals the value."""
+    if value is None or value == "":
+        return None
+    return lambda entry: entry.get(field) == value
+
+
+def _text_filter(field: str, value: Optional[str]) -> Optional[Callable[[Dict], bool]]:
+    """Return a filter for a text field, supporting the ``like:`` operator."""
+    if not value:
+        return None
+    if value.startswith("like:"):
+        text = value[len("like:") :]
+        return lambda entry: text in (entry.get(field) or "")
+    return _equal_filter(field, value)
+
+
+def _tags_filter(value: Optional[str]) -> Optional[Callable[[Dict], bool]]:
+    """Return a filter for the ``any:`` and ``contains:`` tag operators."""
+    if not value:
+        return None
+    operator, tags = value.split(":", 1)
+    wanted = set(tags.split(","))
+    if operator == "contains":
+        return lambda entry: wanted.issubset(entry.get("tags") or [])
+    return lambda entry: bool(wanted.intersection(entry.get("tags") or []))
+
+
+def _components_filter(
+    value: Optional[Union[str, List[str]]]
+) -> Optional[Callable[[Dict], bool]]:
+    """Return a filter for device components, supporting the ``contains:`` operator."""
+    if not value:
+        return None
+    if isinstance(value, str) and value.startswith("contains:"):
+        wanted = set(value[len("contains:") :].split(","))
+        return lambda entry: wanted.issubset(entry.get("device_components") or [])
+    if isinstance(value, str):
+        value = [value]
+    return lambda entry: sorted(entry.get("device_components") or []) == sorted(value)
+
+
+def _quality_filter(
+    value: Optional[Union[str, List[str]]]
+) -> Optional[Callable[[Dict], bool]]:
+    """Return a filter for result quality, supporting the ``in:`` operator."""
+    if not value:
+        return None
+    if isinstance(value, str):
+        value = value[len("in:") :].split(",") if value.startswith("in:") else [value]
+    return lambda entry: entry.get("quality") in value
+
+
+def _time_filter(
+    field: str, value: Optional[List[str]]
+) -> Optional[Callable[[Dict], bool]]:
+    """Return a filter for a list of ``ge:``, ``gt:``, ``le:`` and ``lt:`` timestamps."""
+    if not value:
+        return None
+    import dateutil.parser  # pylint: disable=import-outside-toplevel
+
+    comparisons = {
+        "ge": lambda a, b: a >= b,
+        "gt": lambda a, b: a > b,
+        "le": lambda a, b: a <= b,
+        "lt": lambda a, b: a < b,
+    }
+    bounds = []
+    for time_filter in value:
+        operator, timestamp = time_filter.split(":", 1)
+        bounds.append((comparisons[operator], dateutil.parser.isoparse(timestamp)))
+
+    def _filter(entry: Dict) -> bool:
+        timestamp = entry.get(field)
+        if not timestamp:
+            return False
+        timestamp = dateutil.parser.isoparse(timestamp)
+        return all(compare(timestamp, bound) for compare, bound in bounds)
+
+    return _filter
@@ -0,0 +1,208 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Asynchronous experiment service tests."""
+
+import asyncio
+import unittest
+from test.service.fake_server import (
+    FakeResultsDBServer,
+    create_experiment,
+    service_for,
+)
+from test.service.ibm_test_case import IBMTestCase
+from unittest import mock
+
+from qiskit_ibm_experiment import AsyncIBMExperimentService
+from qiskit_ibm_experiment.client.async_session import AsyncRetrySession
+from qiskit_ibm_experiment.exceptions import (
+    IBMApiError,
+    IBMExperimentEntryExists,
+    IBMExperimentEntryNotFound,
+    RequestsApiError,
+)
+
+try:
+    import aiohttp
+
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+
+@unittest.skipUnless(HAS_AIOHTTP, "aiohttp is required for the asynchronous service.")
+class TestAsyncExperimentService(IBMTestCase):
+    """Test the asynchronous experiment service against a local server."""
+
+    def setUp(self):
+        """Test level setup."""
+        super().setUp()
+        self.server = FakeResultsDBServer()
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+    def _service(self, **kwargs):
+        """Return a service connected to the local server."""
+        return service_for(
+            self.server,
+            AsyncIBMExperimentService,
+            session_options={"backoff_factor": 0},
+            **kwargs,
+        )
+
+    def test_lazy_authentication(self):
+        """Test the service authenticates once, on its first request."""
+
+        async def _run():
+            async with self._service() as service:
+                self.assertEqual(self.server.logins, 0)
+                await asyncio.gather(service.backends(), service.backends())
+                await service.backends()
+
+        asyncio.run(_run())
+        self.assertEqual(self.server.logins, 1)
+
+    def test_entries(self):
+        """Test creating, updating and retrieving entries."""
+
+        async def _run():
+            async with self._service(prompt_for_delete=False) as service:
+                exp_id = await create_experiment(service)
+                await service.update_experiment(exp_id, notes="some notes")
+                experiment = await service.experiment(exp_id)
+                self.assertEqual(experiment["notes"], "some notes")
+                self.assertEqual(experiment["hub"], "hub")
+
+                result_id = await service.create_analysis_result(
+                    exp_id, {"value": 1}, "T1", device_components=["Q0"], quality="good"
+                )
+                result = await service.analysis_result(result_id)
+                self.assertEqual(result["result_data"], {"value": 1})
+                self.assertEqual(result["device_components"], ["Q0"])
+                with self.assertRaises(IBMExperimentEntryExists):
+                    await service.create_analysis_result(
+                        exp_id, {}, "T1", result_id=result_id
+                    )
+
+                await service.delete_analysis_result(result_id)
+                with self.assertRaises(IBMExperimentEntryNotFound):
+                    await service.analysis_result(result_id)
+
+        asyncio.run(_run())
+
+    def test_pagination(self):
+        """Test experiments and analysis results are retrieved page by page."""
+
+        async def _run():
+            async with self._service(page_size=3) as service:
+                exp_ids = await asyncio.gather(
+                    *(create_experiment(service) for _ in range(10))
+                )
+                result_ids = await asyncio.gather(
+                    *(
+                        service.create_analysis_result(exp_ids[0], {"i": i}, "T1")
+                        for i in range(50)
+                    )
+                )
+                experiments = [
+                    exp["experiment_id"]
+                    async for exp in service.iter_experiments(limit=None)
+                ]
+                self.assertCountEqual(experiments, exp_ids)
+                self.assertEqual(len(await service.experiments(limit=4)), 4)
+                results = await service.analysis_results(
+                    limit=None, experiment_id=exp_ids[0]
+                )
+                self.assertCountEqual(
+                    [result["result_id"] for result in results], result_ids
+                )
+
+        asyncio.run(_run())
+        self.assertEqual(self.server.requests[("GET", "/resultsdb/experiments")], 6)
+
+    def test_retries(self):
+        """Test requests are retried on server errors."""
+
+        async def _run():
+            async with self._service() as service:
+                await service.connect()
+                self.server.fail_next(503, count=2)
+                self.assertEqual(await service.experiments(), [])
+                self.server.fail_next(400)
+                with self.assertRaises(IBMApiError):
+                    await service.experiments()
+
+        asyncio.run(_run())
+
+    def test_auto_page_size(self):
+        """Test the page size adapts to the server when set to "auto"."""
+
+        async def _run():
+            async with self._service(page_size="auto") as service:
+                exp_ids = await asyncio.gather(
+                    *(create_experiment(service) for _ in range(12))
+                )
+                experiments = await service.experiments(limit=None)
+                self.assertCountEqual(
+                    [exp["experiment_id"] for exp in experiments], exp_ids
+                )
+                self.assertEqual(len(await service.experiments(limit=5)), 5)
+
+        asyncio.run(_run())
+
+    def test_reauthenticate(self):
+        """Test a rejected access token is replaced and the request sent again."""
+
+        async def _run():
+            async with self._service() as service:
+                await service.backends()
+                self.server.revoke_tokens()
+                await asyncio.gather(service.backends(), service.backends())
+                self.assertEqual(self.server.logins, 2)
+
+        asyncio.run(_run())
+
+
+@unittest.skipUnless(HAS_AIOHTTP, "aiohttp is required for the asynchronous service.")
+class TestAsyncRetrySession(IBMTestCase):
+    """Test the retries of the asynchronous session."""
+
+    def _send(self, method, error):
+        """Send a request failing with an error, returning the number of attempts."""
+        session = AsyncRetrySession(
+            "https://api.example.com", "token", backoff_factor=0
+        )
+        client_session = mock.Mock()
+        client_session.request.side_effect = error
+
+        async def _run():
+            with mock.patch.object(
+                session, "_get_session", return_value=client_session
+            ):
+                with self.assertRaises(RequestsApiError):
+                    await session.request(method, "/experiments")
+
+        asyncio.run(_run())
+        return client_session.request.call_count
+
+    def test_connection_errors(self):
+        """Test requests that may have been sent are only retried if idempotent."""
+        disconnected = aiohttp.ServerDisconnectedError()
+        refused = aiohttp.ClientConnectorError(mock.Mock(), OSError("Refused"))
+        self.assertEqual(self._send("POST", disconnected), 1)
+        self.assertEqual(self._send("POST", asyncio.TimeoutError()), 1)
+        self.assertEqual(self._send("GET", disconnected), 6)
+        self.assertEqual(self._send("POST", refused), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Bulk analysis result upload tests."""
+
+import json
+import unittest
+import uuid
+from test.service.fake_server import (
+    FakeResultsDBServer,
+    create_experiment,
+    service_for,
+)
+from test.service.ibm_test_case import IBMTestCase
+from test.service.local_client import local_service
+from unittest import mock
+
+from qiskit_ibm_experiment import (
+    IBMExperimentEntryExists,
+    IBMExperimentEntryNotFound,
+)
+from qiskit_ibm_experiment.exceptions import IBMApiError
+
+BULK = ("POST", "/resultsdb/analysis_results/bulk")
+SINGLE = ("POST", "/resultsdb/analysis_results")
+
+
+class TestBulkUpload(IBMTestCase):
+    """Test the bulk creation of analysis results."""
+
+    def setUp(self):
+        """Test level setup."""
+        super().setUp()
+        self.server = FakeResultsDBServer().__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+        self.service = service_for(self.server)
+        self.addCleanup(self.service.close)
+        self.experiment_id = create_experiment(self.service)
+
+    def _results(self, count):
+        """Return results of the experiment to upload."""
+        return [
+            {
+                "experiment_id": self.experiment_id,
+                "result_type": "T1",
+                "result_data": {"value": qubit},
+                "device_components": [f"Q{qubit}"],
+            }
+            for qubit in range(count)
+        ]
+
+    def test_batch_endpoint(self):
+        """Test results are uploaded in batches to the batch endpoint."""
+        outcomes = self.service.create_analysis_results(
+            self._results(120), batch_size=50
+        )
+        self.assertEqual(len(outcomes), 120)
+        self.assertTrue(all(outcome.error is None for outcome in outcomes))
+        self.assertEqual(self.server.requests[BULK], 3)
+        self.assertEqual(self.server.requests[SINGLE], 0)
+        result = self.service.analysis_result(outcomes[7].result_id)
+        self.assertEqual(result.result_data["value"], 7)
+        self.assertEqual(str(result.device_components[0]), "Q7")
+
+    def test_no_batch_endpoint(self):
+        """Test results are uploaded one per request without a batch endpoint."""
+        self.server.bulk_endpoint = False
+        outcomes = self.service.create_analysis_results(
+            self._results(10), batch_size=4, max_workers=3
+        )
+        self.assertTrue(all(outcome.error is None for outcome in outcomes))
+        self.assertEqual(self.server.requests[SINGLE], 10)
+        self.service.create_analysis_results(self._results(2), batch_size=4)
+        self.assertEqual(self.server.requests[BULK], 1)
+        self.assertEqual(self.server.requests[SINGLE], 12)
+        self.assertEqual(
+            len(
+                self.service.analysis_results(
+                    experiment_id=self.experiment_id, limit=None
+                )
+            ),
+            12,
+        )
+
+    def test_partial_failure(self):
+        """Test failed results are reported without stopping the others."""
+        for batch_size in (50, 1):
+            with self.subTest(batch_size=batch_size):
+                existing = self.service.create_analysis_result(
+                    self.experiment_id, {}, "T1", result_id=str(uuid.uuid4())
+                )
+                results = self._results(4)
+                results[1]["result_id"] = existing
+                results[2]["experiment_id"] = str(uuid.uuid4())
+                results[3]["quality"] = "unknown quality"
+                outcomes = self.service.create_analysis_results(
+                    results, batch_size=batch_size
+                )
+                self.assertIsNone(outcomes[0].error)
+                self.assertEqual(outcomes[1].result_id, existing)
+                self.assertIsInstance(outcomes[1].error, IBMExperimentEntryExists)
+                self.assertIsInstance(outcomes[2].error, IBMExperimentEntryNotFound)
+                self.assertIsInstance(outcomes[3].error, ValueError)
+                self.assertEqual(
+                    str(uuid.UUID(outcomes[2].result_id, version=4)),
+                    outcomes[2].result_id,
+                )
+
+    def test_batch_exception(self):
+        """Test a batch failing with any error does not lose the other outcomes."""
+        client = self.service._api_client
+        bulk_create = client.analysis_results_bulk_create
+
+        def _bulk_create(data):
+            if json.loads(data)[0]["device_components"] == ["Q2"]:
+                raise ConnectionError("Connection reset.")
+            return bulk_create(data)
+
+        with mock.patch.object(
+            client, "analysis_results_bulk_create", side_effect=_bulk_create
+        ):
+            outcomes = self.service.create_analysis_results(
+                self._results(6), batch_size=2
+            )
+        self.assertEqual(len(outcomes), 6)
+        for index, outcome in enumerate(outcomes):
+            if index in (2, 3):
+                self.assertIsInstance(outcome.error, ConnectionError)
+            else:
+                self.assertIsNone(outcome.error)
+
+    def test_short_batch_response(self):
+        """Test results missing from a batch response are reported as failed."""
+        client = self.service._api_client
+        bulk_create = client.analysis_results_bulk_create
+
+        def _bulk_create(data):
+            response = bulk_create(data)
+            response["analysis_results"] = response["analysis_results"][:1]
+            return response
+
+        with mock.patch.object(
+            client, "analysis_results_bulk_create", side_effect=_bulk_create
+        ):
+            outcomes = self.service.create_analysis_results(self._results(3))
+        self.assertIsNone(outcomes[0].error)
+        self.assertIsInstance(outcomes[1].error, IBMApiError)
+        self.assertIsInstance(outcomes[2].error, IBMApiError)
+
+    def test_local(self):
+        """Test the bulk creation of analysis results with the local client."""
+        service = local_service()
+        experiment_id = create_experiment(service)
+        results = self._results(5)
+        for result in results:
+            result["experiment_id"] = experiment_id
+        outcomes = service.create_analysis_results(results, batch_size=2)
+        self.assertTrue(all(outcome.error is None for outcome in outcomes))
+        self.assertEqual(len(service.analysis_results(experiment_id=experiment_id)), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
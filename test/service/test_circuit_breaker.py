@@ -0,0 +1,111 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Circuit breaker tests."""
+
+import time
+import unittest
+from test.service.fake_server import (
+    FakeResultsDBServer,
+    create_experiment,
+    service_for,
+)
+from test.service.ibm_test_case import IBMTestCase
+
+from qiskit_ibm_experiment import IBMExperimentCircuitOpen
+from qiskit_ibm_experiment.client.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+    endpoint_family,
+)
+from qiskit_ibm_experiment.exceptions import CircuitOpenError, IBMApiError
+
+
+class TestCircuitBreaker(IBMTestCase):
+    """Test the circuit breakers."""
+
+    def test_endpoint_family(self):
+        """Test URLs are mapped to their endpoint family."""
+        self.assertEqual(endpoint_family("/experiments"), "experiments")
+        self.assertEqual(endpoint_family("/experiments/1234"), "experiments")
+        self.assertEqual(endpoint_family("/experiments/1234/plots/a.svg"), "plots")
+        self.assertEqual(endpoint_family("/experiments/1234/files"), "files")
+        self.assertEqual(endpoint_family("/analysis_results/1"), "analysis_results")
+        self.assertIsNone(endpoint_family("/devices"))
+
+    def test_states(self):
+        """Test the breaker opens, lets a trial request through and closes."""
+        breaker = CircuitBreaker(
+            "experiments", failure_threshold=2, recovery_timeout=0.2
+        )
+        breaker.record_failure()
+        breaker.before_request()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitState.OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request()
+
+        time.sleep(0.25)
+        self.assertEqual(breaker.state, CircuitState.HALF_OPEN)
+        breaker.before_request()
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitState.OPEN)
+
+        time.sleep(0.25)
+        breaker.before_request()
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitState.CLOSED)
+
+    def test_service(self):
+        """Test a failing endpoint family fails fast while the others are used."""
+        with FakeResultsDBServer() as server:
+            with service_for(
+                server,
+                session_options={
+                    "retries_total": 0,
+                    "circuit_breaker_threshold": 2,
+                    "circuit_breaker_timeout": 0.5,
+                },
+                prompt_for_delete=False,
+            ) as service:
+                experiment_id = create_experiment(service)
+                path = f"/resultsdb/experiments/{experiment_id}"
+                server.fail_next(503, count=2)
+                for _ in range(2):
+                    with self.assertRaises(IBMApiError):
+                        service.experiment(experiment_id)
+                with self.assertRaises(IBMExperimentCircuitOpen):
+                    service.experiment(experiment_id)
+                with self.assertRaises(IBMExperimentCircuitOpen):
+                    service.delete_experiment(experiment_id)
+                self.assertEqual(server.requests[("GET", path)], 2)
+                self.assertEqual(server.requests[("DELETE", path)], 0)
+
+                states = service.circuit_states()
+                self.assertEqual(states["experiments"], CircuitState.OPEN)
+                self.assertEqual(states["analysis_results"], CircuitState.CLOSED)
+                service.create_analysis_result(
+                    experiment_id=experiment_id,
+                    result_data={},
+                    result_type="T1",
+                )
+
+                time.sleep(0.5)
+                service.experiment(experiment_id)
+                states = service.circuit_states()
+                self.assertEqual(states["experiments"], CircuitState.CLOSED)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Request compression tests."""
+
+import unittest
+from test.service.fake_server import (
+    FakeResultsDBServer,
+    create_experiment,
+    service_for,
+)
+from test.service.ibm_test_case import IBMTestCase
+
+from qiskit_ibm_experiment.client.compression import negotiate_encoding
+from qiskit_ibm_experiment.client.session import RetrySession
+
+
+class TestCompression(IBMTestCase):
+    """Test the compression of requests and responses."""
+
+    def test_negotiate_encoding(self):
+        """Test choosing the request coding from the server Accept-Encoding."""
+        self.assertEqual(negotiate_encoding("gzip, deflate", "br"), "gzip")
+        self.assertEqual(negotiate_encoding("GZIP;q=0.5", "br"), "gzip")
+        self.assertEqual(negotiate_encoding("gzip;q=0", "br"), "br")
+        self.assertEqual(negotiate_encoding("identity", "gzip"), "gzip")
+
+    def test_invalid_compression(self):
+        """Test an unknown request compression is rejected."""
+        with self.assertRaises(ValueError):
+            RetrySession("https://api.example.com", None, request_compression="lz4")
+
+    def test_compressed_requests(self):
+        """Test large request bodies are compressed and small ones are not."""
+        notes = "Repeated note. " * 1000
+        with FakeResultsDBServer() as server:
+            with service_for(
+                server,
+                session_options={"request_compression": "gzip"},
+            ) as service:
+                large_id = create_experiment(service, notes=notes)
+                create_experiment(service, notes="short")
+                self.assertEqual(service.experiment(large_id)["notes"], notes)
+                stats = service.transfer_stats()
+
+        uploads = [item for item in server.received if item[0] == "POST"][1:]
+        self.assertEqual([item[2] for item in uploads], ["gzip", None])
+        self.assertLess(uploads[0][3], len(notes) / 10)
+        self.assertLess(stats.bytes_sent * 10, stats.body_bytes_sent)
+        self.assertLess(stats.bytes_received * 10, stats.body_bytes_received)
+
+    def test_unsupported_compression(self):
+        """Test compression is disabled when the server rejects it."""
+        notes = "Repeated note. " * 1000
+        with FakeResultsDBServer() as server:
+            server.request_encodings = set()
+            with service_for(
+                server,
+                session_options={"request_compression": "gzip"},
+            ) as service:
+                experiment_id = create_experiment(service, notes=notes)
+                create_experiment(service, notes=notes)
+                self.assertEqual(service.experiment(experiment_id)["notes"], notes)
+
+        uploads = [item[2] for item in server.received if item[0] == "POST"][1:]
+        self.assertEqual(uploads, ["gzip", None, None])
+
+    def test_streamed_transfer_stats(self):
+        """Test the bytes of streamed pages are counted."""
+        with FakeResultsDBServer() as server:
+            with service_for(server, stream_pages=True) as service:
+                for index in range(20):
+                    create_experiment(service, notes=f"Experiment {index}")
+                service.transfer_stats(reset=True)
+                self.assertEqual(len(service.experiments(limit=None)), 20)
+                stats = service.transfer_stats()
+
+        self.assertGreater(stats.body_bytes_received, stats.bytes_received)
+        self.assertEqual(stats.requests, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
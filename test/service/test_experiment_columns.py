@@ -0,0 +1,111 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Columnar query result tests."""
+
+import json
+import unittest
+import uuid
+from datetime import timezone
+from test.service.ibm_test_case import IBMTestCase
+from test.service.local_client import local_service
+
+import numpy as np
+
+from qiskit_ibm_experiment.service import RaggedColumn
+
+
+class TestColumnQueries(IBMTestCase):
+    """Test queries returning columns."""
+
+    def setUp(self):
+        """Test level setup."""
+        super().setUp()
+        self.service = local_service()
+        self.exp_id = self.service._api_client.experiment_upload(
+            json.dumps(
+                {
+                    "type": "T1",
+                    "device_name": "ibmq_lima",
+                    "start_time": "2022-01-01T10:00:00.5+02:00",
+                    "tags": ["foo", "bar"],
+                }
+            )
+        )["uuid"]
+        self.result_ids = [
+            self.service.create_analysis_result(
+                experiment_id=self.exp_id,
+                result_data={"value": idx},
+                result_type="T1",
+                device_components=[f"Q{qubit}" for qubit in range(idx)],
+                quality="good" if idx else "bad",
+                verified=bool(idx % 2),
+                chisq=float(idx) or None,
+                result_id=str(uuid.UUID(int=idx)),
+            )
+            for idx in range(3)
+        ]
+
+    def test_analysis_result_columns(self):
+        """Test analysis results are returned as columns."""
+        records = self.service.analysis_results(sort_by="creation_datetime:asc")
+        columns = self.service.analysis_results(
+            sort_by="creation_datetime:asc", as_columns=True
+        )
+        self.assertEqual(list(columns["result_id"]), self.result_ids)
+        self.assertEqual(list(columns["result_type"]), ["T1"] * 3)
+        self.assertEqual(list(columns["quality"]), ["BAD", "GOOD", "GOOD"])
+        self.assertEqual(columns["verified"].dtype, bool)
+        self.assertEqual(list(columns["verified"]), [False, True, False])
+        self.assertTrue(np.isnan(columns["chisq"][0]))
+        self.assertEqual(list(columns["chisq"][1:]), [1.0, 2.0])
+        self.assertEqual(columns["creation_datetime"].dtype, np.dtype("datetime64[ns]"))
+        for idx, record in enumerate(records):
+            created = record["creation_datetime"].astimezone(timezone.utc)
+            self.assertEqual(
+                columns["creation_datetime"][idx],
+                np.datetime64(created.replace(tzinfo=None), "ns"),
+            )
+            self.assertEqual(columns["result_data"][idx], record["result_data"])
+
+        components = columns["device_components"]
+        self.assertIsInstance(components, RaggedColumn)
+        self.assertEqual(len(components), 3)
+        self.assertEqual(list(components.lengths()), [0, 1, 2])
+        self.assertEqual(list(components[2]), ["Q0", "Q1"])
+
+    def test_experiment_columns(self):
+        """Test experiments are returned as columns."""
+        columns = self.service.experiments(as_columns=True)
+        self.assertEqual(list(columns["experiment_id"]), [self.exp_id])
+        self.assertEqual(list(columns["tags"][0]), ["foo", "bar"])
+        self.assertEqual(
+            columns["start_datetime"][0], np.datetime64("2022-01-01T08:00:00.5", "ns")
+        )
+        self.assertTrue(np.isnat(columns["end_datetime"][0]))
+
+    def test_empty_columns(self):
+        """Test columns of a query without matches."""
+        columns = self.service.analysis_results(result_type="T2", as_columns=True)
+        self.assertEqual(len(columns["result_id"]), 0)
+        self.assertEqual(len(columns["device_components"]), 0)
+
+    def test_columns_with_shards(self):
+        """Test columns cannot be combined with sharded queries."""
+        with self.assertRaises(ValueError):
+            self.service.experiments(
+                as_columns=True, shards=2, start_datetime_after="2022-01-01"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
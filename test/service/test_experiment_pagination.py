@@ -0,0 +1,410 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Experiment pagination tests."""
+
+import json
+import time
+import uuid
+import unittest
+from datetime import datetime, timedelta, timezone
+from test.service.ibm_test_case import IBMTestCase
+from qiskit_ibm_experiment import IBMExperimentService
+from qiskit_ibm_experiment.service.pagination import (
+    AdaptivePageSize,
+    merge_sorted_streams,
+    sort_key_for,
+)
+
+
+def _api_experiment(index):
+    """Return an experiment in the server format."""
+    return {
+        "uuid": str(uuid.UUID(int=index)),
+        "type": "qiskit_test",
+        "device_name": "ibmq_fake",
+        "jobs": [],
+        "start_time": f"2022-01-01T00:00:{index % 60:02d}Z",
+    }
+
+
+def _api_analysis_result(index):
+    """Return an analysis result in the server format."""
+    return {
+        "uuid": str(uuid.UUID(int=index)),
+        "type": "T1",
+        "device_name": "ibmq_fake",
+        "experiment_uuid": str(uuid.UUID(int=0)),
+        "created_at": f"2022-01-01T00:00:{index % 60:02d}Z",
+    }
+
+
+class FakePagedClient:
+    """Experiment client serving pages of generated records."""
+
+    def __init__(self, num_records, default_page_size=10, max_page_size=1000):
+        self.num_records = num_records
+        self.default_page_size = default_page_size
+        self.max_page_size = max_page_size
+        self.calls = []
+
+    def _page(self, records_key, make_record, limit, marker, page_size=None, **query):
+        if page_size is not None:
+            limit = page_size if limit is None else min(limit, page_size)
+        self.calls.append({"limit": limit, "marker": marker, **query})
+        start = int(marker) if marker else 0
+        size = min(limit or self.default_page_size, self.max_page_size)
+        end = min(start + size, self.num_records)
+        page = {records_key: [make_record(idx) for idx in range(start, end)]}
+        if end < self.num_records:
+            page["marker"] = str(end)
+        return json.dumps(page)
+
+    def experiments(self, limit, marker, **query):
+        """Return a page of experiments."""
+        return self._page("experiments", _api_experiment, limit, marker, **query)
+
+    def analysis_results(self, limit, marker, **query):
+        """Return a page of analysis results."""
+        return self._page(
+            "analysis_results", _api_analysis_result, limit, marker, **query
+        )
+
+    def analysis_result_create(self, result):
+        """Create an analysis result."""
+        self.num_records += 1
+        return {"uuid": json.loads(result).get("uuid", str(uuid.uuid4()))}
+
+
+class FakeTimeRangeClient:
+    """Experiment client filtering and sorting experiments by start time."""
+
+    def __init__(self, start_times, page_size=4):
+        self.experiments_data = [
+            dict(_api_experiment(idx), start_time=start_time)
+            for idx, start_time in enumerate(start_times)
+        ]
+        self.page_size = page_size
+        self.calls = []
+
+    def experiments(
+        self, limit, marker, start_time=None, sort_by=None, page_size=None, **query
+    ):
+        """Return a page of experiments within the start time filters."""
+        # pylint: disable=unused-argument
+        self.calls.append({"start_time": start_time, "marker": marker})
+        matching = self.experiments_data
+        for time_filter in start_time or []:
+            operator, value = time_filter.split(":", 1)
+            value = value.replace("Z", "+00:00")
+            if operator == "ge":
+                matching = [exp for exp in matching if exp["start_time"] >= value]
+            else:
+                matching = [exp for exp in matching if exp["start_time"] <= value]
+        matching = sorted(matching, key=lambda exp: exp["uuid"])
+        matching = sorted(
+            matching,
+            key=lambda exp: exp["start_time"],
+            reverse=sort_by != "start_time:asc",
+        )
+        start = int(marker) if marker else 0
+        end = min(start + min(limit or self.page_size, self.page_size), len(matching))
+        page = {"experiments": matching[start:end]}
+        if end < len(matching):
+            page["marker"] = str(end)
+        return json.dumps(page)
+
+
+class TestExperimentPagination(IBMTestCase):
+    """Test paginated experiment and analysis result queries."""
+
+    def setUp(self):
+        """Test level setup."""
+        super().setUp()
+        self.service = IBMExperimentService(local=True)
+        self.client = FakePagedClient(num_records=25)
+        self.service._api_client = self.client
+
+    def test_experiments_all_pages(self):
+        """Test retrieving all experiments across pages."""
+        experiments = self.service.experiments(limit=None)
+        self.assertEqual(len(experiments), 25)
+        self.assertEqual(len(self.client.calls), 3)
+        self.assertEqual(
+            [call["marker"] for call in self.client.calls], [None, "10", "20"]
+        )
+
+    def test_iter_experiments_is_lazy(self):
+        """Test pages are only requested when consumed."""
+        experiments = self.service.iter_experiments(backend_name="ibmq_fake")
+        self.assertEqual(len(self.client.calls), 0)
+        first = next(experiments)
+        self.assertEqual(first["experiment_id"], str(uuid.UUID(int=0)))
+        self.assertEqual(len(self.client.calls), 1)
+        self.assertEqual(self.client.calls[0]["backend_name"], "ibmq_fake")
+        for _ in range(9):
+            next(experiments)
+        self.assertEqual(len(self.client.calls), 1)
+        next(experiments)
+        self.assertEqual(len(self.client.calls), 2)
+
+    def test_iter_experiments_limit(self):
+        """Test the limit is honored across pages."""
+        self.client.max_page_size = 10
+        experiments = list(self.service.iter_experiments(limit=15))
+        self.assertEqual(len(experiments), 15)
+        self.assertEqual([call["limit"] for call in self.client.calls], [15, 5])
+
+    def test_iter_experiments_invalid_filter(self):
+        """Test invalid filters are reported before iterating."""
+        with self.assertRaises(ValueError):
+            self.service.iter_experiments(limit=0)
+        with self.assertRaises(ValueError):
+            self.service.iter_experiments(exclude_mine=True, mine_only=True)
+
+    def test_iter_analysis_results(self):
+        """Test iterating over analysis results."""
+        results = self.service.iter_analysis_results(result_type="T1")
+        result_ids = [result["result_id"] for result in results]
+        self.assertEqual(len(result_ids), 25)
+        self.assertEqual(len(set(result_ids)), 25)
+        self.assertEqual(self.client.calls[0]["result_type"], "T1")
+
+    def test_prefetch_pages(self):
+        """Test the next page is requested while the current one is consumed."""
+        self.service.set_option(prefetch_pages=True)
+        experiments = self.service.iter_experiments()
+        next(experiments)
+        deadline = time.time() + 5
+        while len(self.client.calls) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual([call["marker"] for call in self.client.calls], [None, "10"])
+        remaining = list(experiments)
+        self.assertEqual(len(remaining), 24)
+        self.assertEqual(len(self.client.calls), 3)
+
+    def test_prefetch_pages_limit(self):
+        """Test no page is prefetched beyond the limit."""
+        self.service.set_option(prefetch_pages=True)
+        experiments = self.service.experiments(limit=10)
+        self.assertEqual(len(experiments), 10)
+        self.assertEqual(len(self.client.calls), 1)
+
+    def test_page_size(self):
+        """Test a fixed page size is used for every request."""
+        self.service.set_option(page_size=7)
+        experiments = self.service.experiments(limit=None)
+        self.assertEqual(len(experiments), 25)
+        self.assertEqual([call["limit"] for call in self.client.calls], [7, 7, 7, 7])
+
+    def test_page_size_with_limit(self):
+        """Test the page size does not exceed the remaining limit."""
+        self.service.set_option(page_size=7)
+        self.service.experiments(limit=10)
+        self.assertEqual([call["limit"] for call in self.client.calls], [7, 3])
+
+    def test_auto_page_size(self):
+        """Test the adaptive page size is used for requests."""
+        self.client.num_records = 1000
+        self.service.set_option(page_size="auto")
+        experiments = self.service.experiments(limit=None)
+        self.assertEqual(len(experiments), 1000)
+        self.assertEqual(self.client.calls[0]["limit"], 100)
+        self.assertGreater(self.client.calls[1]["limit"], 100)
+
+    def test_invalid_page_size(self):
+        """Test an invalid page size is rejected."""
+        for page_size in [0, "big"]:
+            with self.subTest(page_size=page_size):
+                self.service.set_option(page_size=page_size)
+                with self.assertRaises(ValueError):
+                    self.service.experiments()
+
+
+class TestShardedScan(IBMTestCase):
+    """Test time window sharded queries."""
+
+    def setUp(self):
+        """Test level setup."""
+        super().setUp()
+        self.start = datetime(2022, 1, 1, tzinfo=timezone.utc)
+        start_times = [
+            (self.start + timedelta(hours=hours)).isoformat()
+            for hours in [0, 1, 1, 5, 6, 9, 12, 12, 17, 20, 23, 24]
+        ]
+        self.service = IBMExperimentService(local=True)
+        self.client = FakeTimeRangeClient(start_times)
+        self.service._api_client = self.client
+
+    def test_sharded_experiments(self):
+        """Test sharded results match a single scan."""
+        kwargs = {
+            "limit": None,
+            "start_datetime_after": self.start,
+            "start_datetime_before": self.start + timedelta(hours=24),
+        }
+        expected = [exp["experiment_id"] for exp in self.service.experiments(**kwargs)]
+        self.assertEqual(len(expected), 12)
+        for shards in [1, 2, 4, 8]:
+            with self.subTest(shards=shards):
+                self.client.calls = []
+                sharded = self.service.experiments(shards=shards, **kwargs)
+                self.assertEqual([exp["experiment_id"] for exp in sharded], expected)
+                first_pages = [call for call in self.client.calls if not call["marker"]]
+                self.assertEqual(len(first_pages), shards)
+
+    def test_sharded_boundary_duplicates(self):
+        """Test records on a window boundary are returned once."""
+        experiments = self.service.experiments(
+            limit=None,
+            shards=2,
+            start_datetime_after=self.start,
+            start_datetime_before=self.start + timedelta(hours=24),
+            sort_by="start_datetime:asc",
+        )
+        experiment_ids = [exp["experiment_id"] for exp in experiments]
+        self.assertEqual(len(experiment_ids), 12)
+        self.assertEqual(len(set(experiment_ids)), 12)
+        start_times = [exp["start_datetime"] for exp in experiments]
+        self.assertEqual(start_times, sorted(start_times))
+
+    def test_sharded_tied_duplicates(self):
+        """Test tied records are returned once, whatever their order in the shards."""
+        streams = [
+            [{"time": 1, "id": "b"}, {"time": 1, "id": "a"}, {"time": 2, "id": "c"}],
+            [{"time": 1, "id": "a"}, {"time": 1, "id": "b"}, {"time": 2, "id": "c"}],
+        ]
+        records = merge_sorted_streams(
+            [iter(stream) for stream in streams], sort_key_for(["time:asc"]), "id"
+        )
+        self.assertEqual(
+            [(record["time"], record["id"]) for record in records],
+            [(1, "a"), (1, "b"), (2, "c")],
+        )
+
+    def test_sharded_limit(self):
+        """Test the limit is applied to the merged results."""
+        experiments = self.service.experiments(
+            limit=3, shards=3, start_datetime_after=self.start
+        )
+        self.assertEqual(len(experiments), 3)
+        self.assertEqual(
+            experiments[0]["start_datetime"],
+            self.start + timedelta(hours=24),
+        )
+
+    def test_sharded_requires_start(self):
+        """Test sharded queries require the start of the time range."""
+        with self.assertRaises(ValueError):
+            self.service.iter_experiments(shards=4)
+
+
+class TestQueryCache(IBMTestCase):
+    """Test the query result cache."""
+
+    def setUp(self):
+        """Test level setup."""
+        super().setUp()
+        self.service = IBMExperimentService(local=True, query_cache_size=2)
+        self.client = FakePagedClient(num_records=25)
+        self.service._api_client = self.client
+
+    def test_cache_disabled_by_default(self):
+        """Test queries are not cached by default."""
+        service = IBMExperimentService(local=True)
+        service._api_client = self.client
+        service.experiments()
+        service.experiments()
+        self.assertEqual(len(self.client.calls), 2)
+        self.assertIsNone(service.query_cache_info())
+
+    def test_cache_hit(self):
+        """Test identical queries are served from the cache."""
+        first = self.service.experiments(limit=None, tags=["a", "b"])
+        second = self.service.experiments(limit=None, tags=["a", "b"])
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.client.calls), 3)
+        info = self.service.query_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+    def test_cache_key_normalized(self):
+        """Test equivalent filters share a cache entry."""
+        self.service.experiments(sort_by="start_datetime:asc")
+        self.service.experiments(sort_by=["START_DATETIME:asc"])
+        self.service.experiments(sort_by="start_datetime:desc")
+        self.assertEqual(self.service.query_cache_info().hits, 1)
+        self.assertEqual(len(self.client.calls), 2)
+
+    def test_cached_records_are_copies(self):
+        """Test modifying returned records does not modify the cache."""
+        self.service.experiments()[0]["notes"] = "modified"
+        self.assertEqual(self.service.experiments()[0]["notes"], "")
+        self.service.experiments()[0]["job_ids"].append("job")
+        self.assertEqual(self.service.experiments()[0]["job_ids"], [])
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted."""
+        self.service.experiments(backend_name="a")
+        self.service.experiments(backend_name="b")
+        self.service.experiments(backend_name="a")
+        self.service.experiments(backend_name="c")
+        self.assertEqual(self.service.query_cache_info().currsize, 2)
+        self.service.experiments(backend_name="a")
+        self.assertEqual(len(self.client.calls), 3)
+        self.service.experiments(backend_name="b")
+        self.assertEqual(len(self.client.calls), 4)
+
+    def test_ttl(self):
+        """Test expired entries are not used."""
+        self.service.set_option(query_cache_ttl=0.05)
+        self.service.experiments()
+        time.sleep(0.1)
+        self.service.experiments()
+        self.assertEqual(len(self.client.calls), 2)
+
+    def test_invalidated_on_write(self):
+        """Test the cache is cleared when the service creates an entry."""
+        self.assertEqual(len(self.service.analysis_results(limit=None)), 25)
+        self.service.create_analysis_result(
+            experiment_id=str(uuid.uuid4()), result_data={}, result_type="T1"
+        )
+        self.assertEqual(len(self.service.analysis_results(limit=None)), 26)
+
+
+class TestAdaptivePageSize(IBMTestCase):
+    """Test the adaptive page size."""
+
+    def test_grow_and_shrink(self):
+        """Test the page size follows the observed latency."""
+        page_size = AdaptivePageSize(initial=100, target_latency=1.0)
+        page_size.update(100, 100, latency=0.1, num_bytes=1000)
+        self.assertEqual(page_size.size, 200)
+        page_size.update(200, 200, latency=4.0, num_bytes=2000)
+        self.assertEqual(page_size.size, 100)
+
+    def test_partial_page_ignored(self):
+        """Test the last, partial, page does not change the page size."""
+        page_size = AdaptivePageSize(initial=100)
+        page_size.update(100, 20, latency=10.0, num_bytes=1000)
+        self.assertEqual(page_size.size, 100)
+
+    def test_limits(self):
+        """Test the page size is bounded by size limits."""
+        page_size = AdaptivePageSize(initial=100, maximum=150, max_bytes=10000)
+        page_size.update(100, 100, latency=0.01, num_bytes=1000)
+        self.assertEqual(page_size.size, 150)
+        page_size.update(150, 150, latency=0.01, num_bytes=30000)
+        self.assertEqual(page_size.size, 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Lazy experiment record tests."""
+
+import copy
+import json
+import pickle
+import unittest
+from test.service.ibm_test_case import IBMTestCase
+from test.service.local_client import local_service
+from unittest import mock
+
+from qiskit_ibm_experiment.service import (
+    ExperimentRecord,
+    AnalysisResultRecord,
+    ResultQuality,
+)
+from qiskit_ibm_experiment.service.utils import utc_to_local
+
+RAW_EXPERIMENT = {
+    "uuid": "exp-1",
+    "type": "T1",
+    "device_name": "ibmq_lima",
+    "jobs": ["job-1"],
+    "tags": ["foo"],
+    "visibility": "private",
+    "created_at": "2022-01-01T00:00:00Z",
+    "start_time": "2022-01-01T01:00:00Z",
+}
+
+RAW_ANALYSIS_RESULT = {
+    "uuid": "res-1",
+    "experiment_uuid": "exp-1",
+    "type": "T1",
+    "device_name": "ibmq_lima",
+    "quality": "Good",
+    "fit": {"value": 1},
+    "chisq": 1.5,
+    "created_at": "2022-01-01T00:00:00Z",
+}
+
+
+class TestExperimentRecords(IBMTestCase):
+    """Test lazily converted records."""
+
+    def test_experiment_record(self):
+        """Test experiment records hold the converted experiment data."""
+        record = ExperimentRecord(RAW_EXPERIMENT)
+        self.assertEqual(
+            record.to_dict(),
+            {
+                "experiment_type": "T1",
+                "backend": "ibmq_lima",
+                "experiment_id": "exp-1",
+                "parent_id": None,
+                "tags": ["foo"],
+                "job_ids": ["job-1"],
+                "share_level": "private",
+                "metadata": None,
+                "figure_names": None,
+                "notes": "",
+                "hub": "",
+                "group": "",
+                "project": "",
+                "owner": "",
+                "creation_datetime": utc_to_local("2022-01-01T00:00:00Z"),
+                "start_datetime": utc_to_local("2022-01-01T01:00:00Z"),
+            },
+        )
+        self.assertNotIn("end_datetime", record)
+        self.assertIsNone(record.get("end_datetime"))
+        self.assertEqual(record.experiment_id, "exp-1")
+        with self.assertRaises(AttributeError):
+            _ = record.end_datetime
+
+    def test_analysis_result_record(self):
+        """Test analysis result records hold the converted analysis result data."""
+        service = mock.MagicMock()
+        record = AnalysisResultRecord(RAW_ANALYSIS_RESULT, service)
+        self.assertEqual(record["quality"], ResultQuality.GOOD)
+        self.assertEqual(record["result_data"], {"value": 1})
+        self.assertEqual(record["chisq"], 1.5)
+        self.assertEqual(record["backend_name"], "ibmq_lima")
+        self.assertIs(record["service"], service)
+        self.assertEqual(record["device_components"], [])
+        self.assertFalse(record["verified"])
+
+    def test_lazy_conversion(self):
+        """Test timestamps are converted once, on first access."""
+        with mock.patch(
+            "qiskit_ibm_experiment.service.records.utc_to_local",
+            side_effect=utc_to_local,
+        ) as convert:
+            record = ExperimentRecord(RAW_EXPERIMENT)
+            self.assertEqual(record["experiment_id"], "exp-1")
+            convert.assert_not_called()
+            start = record["start_datetime"]
+            self.assertIs(record["start_datetime"], start)
+            convert.assert_called_once_with("2022-01-01T01:00:00Z")
+
+    def test_modify_record(self):
+        """Test records can be modified without modifying the API data or copies."""
+        record = AnalysisResultRecord(dict(RAW_ANALYSIS_RESULT))
+        record["notes"] = "some notes"
+        record["result_data"] = {"value": 2}
+        del record["chisq"]
+        record_copy = record.copy()
+        record_copy["result_data"] = {"value": 3}
+        self.assertEqual(record["notes"], "some notes")
+        self.assertEqual(record["result_data"], {"value": 2})
+        self.assertNotIn("chisq", record)
+        self.assertIn("notes", list(record))
+        self.assertEqual(record_copy["result_data"], {"value": 3})
+        self.assertEqual(RAW_ANALYSIS_RESULT["fit"], {"value": 1})
+
+        record["device_components"].append("Q0")
+        self.assertEqual(record["device_components"], ["Q0"])
+
+    def test_dict_compatible(self):
+        """Test records can be used as dictionaries."""
+        record = ExperimentRecord(RAW_EXPERIMENT)
+        self.assertEqual(record, record.to_dict())
+        self.assertEqual(dict(**record), record.to_dict())
+        self.assertEqual(len(record), len(record.to_dict()))
+        self.assertEqual(pickle.loads(pickle.dumps(record)), record)
+        self.assertEqual(copy.deepcopy(record), record)
+
+    def test_dict_instance(self):
+        """Test records are dictionaries, including for code bypassing their methods."""
+        record = ExperimentRecord(RAW_EXPERIMENT, utc=True)
+        self.assertIsInstance(record, dict)
+        self.assertEqual(
+            json.loads(json.dumps(record, default=str)),
+            json.loads(json.dumps(record.to_dict(), default=str)),
+        )
+        record = ExperimentRecord(RAW_EXPERIMENT)
+        self.assertEqual({**record}, record.to_dict())
+        record = ExperimentRecord(RAW_EXPERIMENT)
+        merged = {"extra": 1}
+        merged.update(record)
+        self.assertEqual(merged, {"extra": 1, **record.to_dict()})
+
+    def test_service_returns_records(self):
+        """Test the service returns records."""
+        service = local_service()
+        result_id = service.create_analysis_result(
+            experiment_id=service._api_client.experiment_upload(
+                '{"type": "T1", "device_name": "ibmq_lima"}'
+            )["uuid"],
+            result_data={},
+            result_type="T1",
+        )
+        record = service.analysis_result(result_id)
+        self.assertIsInstance(record, AnalysisResultRecord)
+        self.assertIsInstance(service.experiments()[0], ExperimentRecord)
+        self.assertEqual(record.result_id, result_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
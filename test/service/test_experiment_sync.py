@@ -0,0 +1,163 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Experiment delta sync tests."""
+
+import json
+import unittest
+import uuid
+from test.service.ibm_test_case import IBMTestCase
+from test.service.local_client import LocalExperimentClient, local_service
+from unittest import mock
+
+from qiskit_ibm_experiment.exceptions import (
+    IBMExperimentEntryExists,
+    IBMExperimentEntryNotFound,
+)
+
+
+class TestExperimentSync(IBMTestCase):
+    """Test incremental sync of experiments and analysis results."""
+
+    def setUp(self):
+        """Test level setup."""
+        super().setUp()
+        self.service = local_service()
+        self.client = self.service._api_client
+
+    def _create_experiment(self, backend_name="ibmq_lima", **kwargs):
+        """Create an experiment in the local client."""
+        data = {"uuid": str(uuid.uuid4()), "type": "T1", "device_name": backend_name}
+        data.update(kwargs)
+        return self.client.experiment_upload(json.dumps(data))["uuid"]
+
+    def test_local_client(self):
+        """Test the local client stores entries in memory."""
+        self.assertIsInstance(self.client, LocalExperimentClient)
+        exp_id = self._create_experiment(tags=["foo"])
+        self.service.update_experiment(exp_id, notes="some notes")
+        experiment = self.service.experiment(exp_id)
+        self.assertEqual(experiment["notes"], "some notes")
+        self.assertEqual(experiment["tags"], ["foo"])
+        self.assertEqual(
+            [exp["experiment_id"] for exp in self.service.experiments(tags=["foo"])],
+            [exp_id],
+        )
+        self.assertFalse(self.service.experiments(tags=["bar"]))
+
+        result_id = self.service.create_analysis_result(
+            experiment_id=exp_id, result_data={"value": 1}, result_type="T1"
+        )
+        result = self.service.analysis_result(result_id)
+        self.assertEqual(result["result_data"], {"value": 1})
+        self.assertEqual(result["backend_name"], "ibmq_lima")
+
+    def test_local_client_errors(self):
+        """Test the local client raises the same errors as the server."""
+        exp_id = self._create_experiment()
+        with self.assertRaises(IBMExperimentEntryExists):
+            self.service.create_analysis_result(
+                experiment_id=exp_id,
+                result_data={},
+                result_type="T1",
+                result_id=self.service.create_analysis_result(
+                    experiment_id=exp_id, result_data={}, result_type="T1"
+                ),
+            )
+        with self.assertRaises(IBMExperimentEntryNotFound):
+            self.service.experiment(str(uuid.uuid4()))
+        with self.assertRaises(IBMExperimentEntryNotFound):
+            self.service.update_experiment(str(uuid.uuid4()), notes="some notes")
+
+    def test_sync_experiments(self):
+        """Test only changed experiments are returned after the first sync."""
+        exp_ids = [self._create_experiment() for _ in range(3)]
+        self._create_experiment(backend_name="ibmq_manila")
+
+        records, watermark = self.service.sync_experiments(backend_name="ibmq_lima")
+        self.assertCountEqual([rec["experiment_id"] for rec in records], exp_ids)
+        self.assertEqual(
+            watermark.timestamp, max(rec["updated_datetime"] for rec in records)
+        )
+
+        records, new_watermark = self.service.sync_experiments(
+            since=watermark, backend_name="ibmq_lima"
+        )
+        self.assertFalse(records)
+        self.assertEqual(new_watermark, watermark)
+
+        self.service.update_experiment(exp_ids[1], notes="some notes")
+        new_id = self._create_experiment()
+        records, new_watermark = self.service.sync_experiments(
+            since=watermark, backend_name="ibmq_lima"
+        )
+        self.assertCountEqual(
+            [rec["experiment_id"] for rec in records], [exp_ids[1], new_id]
+        )
+        self.assertGreater(new_watermark.timestamp, watermark.timestamp)
+
+    def test_sync_analysis_results(self):
+        """Test only changed analysis results are returned after the first sync."""
+        exp_id = self._create_experiment()
+        result_ids = [
+            self.service.create_analysis_result(
+                experiment_id=exp_id, result_data={}, result_type="T1"
+            )
+            for _ in range(2)
+        ]
+        _, watermark = self.service.sync_analysis_results(experiment_id=exp_id)
+        self.service.update_analysis_result(result_ids[0], tags=["updated"])
+        records, _ = self.service.sync_analysis_results(
+            since=watermark, experiment_id=exp_id
+        )
+        self.assertEqual([rec["result_id"] for rec in records], [result_ids[0]])
+
+    def test_sync_same_timestamp(self):
+        """Test entries updated at the watermark time are returned exactly once."""
+        with mock.patch(
+            "test.service.local_client._now",
+            return_value="2022-01-01T00:00:00Z",
+        ):
+            first_id = self._create_experiment()
+            records, watermark = self.service.sync_experiments()
+            self.assertEqual(watermark.ids, {first_id})
+            second_id = self._create_experiment()
+            records, new_watermark = self.service.sync_experiments(since=watermark)
+        self.assertEqual([rec["experiment_id"] for rec in records], [second_id])
+        self.assertEqual(new_watermark.timestamp, watermark.timestamp)
+        self.assertEqual(new_watermark.ids, {first_id, second_id})
+
+        records, _ = self.service.sync_experiments(since=new_watermark)
+        self.assertFalse(records)
+        records, _ = self.service.sync_experiments(since=new_watermark.timestamp)
+        self.assertEqual(len(records), 2)
+
+    def test_sync_server_filter(self):
+        """Test the watermark is sent to the server."""
+        _, watermark = self.service.sync_experiments()
+        self._create_experiment()
+        _, watermark = self.service.sync_experiments()
+        with mock.patch.object(
+            self.client, "experiments", wraps=self.client.experiments
+        ) as experiments:
+            self.service.sync_experiments(since=watermark)
+        self.assertEqual(len(experiments.call_args.kwargs["updated_at"]), 1)
+        self.assertTrue(experiments.call_args.kwargs["updated_at"][0].startswith("ge:"))
+
+        query = self.service._experiments_query()
+        with mock.patch.object(self.service, "_experiments_query", return_value=query):
+            self.service.sync_experiments(since=watermark)
+        self.assertNotIn("updated_at", query.params)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Service handle tests."""
+
+import copy
+import multiprocessing
+import os
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from test.service.fake_server import (
+    FakeResultsDBServer,
+    create_experiment,
+    service_for,
+)
+from test.service.ibm_test_case import IBMTestCase
+
+from qiskit_ibm_experiment import IBMExperimentService
+from qiskit_ibm_experiment.client import token_manager
+
+
+def _experiment_type(handle, experiment_id):
+    """Return the type of an experiment, using the service of a handle."""
+    return handle.service().experiment(experiment_id)["experiment_type"]
+
+
+class TestServiceHandle(IBMTestCase):
+    """Test the picklable service handles."""
+
+    def setUp(self):
+        """Test level setup."""
+        super().setUp()
+        self.server = FakeResultsDBServer().__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+        token_manager._TOKENS.clear()
+        self.addCleanup(token_manager._TOKENS.clear)
+        self.service = service_for(self.server, page_size=3)
+        self.addCleanup(self.service.close)
+        self.experiment_ids = [
+            create_experiment(self.service, experiment_type=f"T{index}")
+            for index in range(4)
+        ]
+
+    def test_round_trip(self):
+        """Test a handle gives a service using the same token and options."""
+        data = pickle.dumps(self.service.handle())
+        self.assertLess(len(data), 2048)
+        self.assertNotIn(b"Lock", data)
+
+        token_manager._TOKENS.clear()
+        handle = pickle.loads(data)
+        service = handle.service()
+        self.addCleanup(service.close)
+        self.assertIs(pickle.loads(data).service(), service)
+        self.assertEqual(service.options["page_size"], 3)
+        self.assertEqual(
+            service.experiment(self.experiment_ids[0])["experiment_type"], "T0"
+        )
+        self.assertEqual(self.server.logins, 1)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "Requires os.fork.")
+    def test_process_pool(self):
+        """Test the services of a handle in forked worker processes."""
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(2, mp_context=context) as executor:
+            types = list(
+                executor.map(
+                    _experiment_type, repeat(self.service.handle()), self.experiment_ids
+                )
+            )
+        self.assertEqual(types, ["T0", "T1", "T2", "T3"])
+        self.assertEqual(self.server.logins, 1)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "Requires os.fork.")
+    def test_fork(self):
+        """Test a forked process does not reuse the connections of its parent."""
+        pool = self.service._api_client._session
+        parent_session = pool.session()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            try:
+                reused = pool.session() is parent_session
+                found = self.service.experiment(self.experiment_ids[1])
+                os.write(write_fd, b"%d%d" % (reused, found is not None))
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd, "rb") as pipe:
+            result = pipe.read()
+        os.waitpid(pid, 0)
+        self.assertEqual(result, b"01")
+        self.assertIs(pool.session(), parent_session)
+
+    def test_unsupported(self):
+        """Test local services have no handles and services are not picklable."""
+        with self.assertRaises(ValueError):
+            IBMExperimentService(local=True).handle()
+        with self.assertRaises(TypeError):
+            pickle.dumps(self.service)
+
+    def test_copy(self):
+        """Test copies of services, and of records holding them, share the service."""
+        self.assertIs(copy.copy(self.service), self.service)
+        self.assertIs(copy.deepcopy(self.service), self.service)
+        result_id = self.service.create_analysis_result(
+            self.experiment_ids[0], {"value": 1}, "T1"
+        )
+        result = self.service.analysis_result(result_id)
+        result_copy = copy.deepcopy(result)
+        self.assertEqual(result_copy, result)
+        self.assertIs(result_copy["service"], self.service)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""HTTP revalidation cache tests."""
+
+import os
+import tempfile
+import unittest
+from test.service.fake_server import (
+    FakeResultsDBServer,
+    create_experiment,
+    service_for,
+)
+from test.service.ibm_test_case import IBMTestCase
+
+from qiskit_ibm_experiment.client.http_cache import HttpCache, CachedResponse
+
+
+def _entry(content):
+    """Return a cached response with the given body."""
+    return CachedResponse('"etag"', None, "application/json", content)
+
+
+class TestHttpCache(IBMTestCase):
+    """Test the HTTP revalidation cache."""
+
+    def test_revalidation(self):
+        """Test unchanged entries are served from the cache."""
+        with FakeResultsDBServer() as server:
+            with service_for(server) as service:
+                experiment_id = create_experiment(service, notes="Some notes")
+                first = service.experiment(experiment_id)
+                second = service.experiment(experiment_id)
+                self.assertEqual(server.not_modified, 1)
+                self.assertEqual(first, second)
+
+                service.update_experiment(experiment_id, notes="New notes")
+                self.assertEqual(
+                    service.experiment(experiment_id)["notes"], "New notes"
+                )
+                self.assertEqual(
+                    service.experiment(experiment_id)["notes"], "New notes"
+                )
+                info = service._api_client._session.http_cache.info()
+
+        self.assertEqual(server.not_modified, 2)
+        self.assertEqual((info.hits, info.misses), (2, 0))
+
+    def test_last_modified(self):
+        """Test revalidation with only the Last-Modified validator."""
+        with FakeResultsDBServer() as server:
+            with service_for(server) as service:
+                experiment_id = create_experiment(service, notes="Some notes")
+                service.experiment(experiment_id)
+                session = service._api_client._session
+                url = session.base_url + f"/experiments/{experiment_id}"
+                cached = session.http_cache.get(url)
+                session.http_cache.put(url, cached._replace(etag=None))
+                service.experiment(experiment_id)
+
+        self.assertEqual(server.not_modified, 1)
+
+    def test_list_not_cached(self):
+        """Test lists of entries are not cached."""
+        with FakeResultsDBServer() as server:
+            with service_for(server) as service:
+                create_experiment(service)
+                service.experiments()
+                service.experiments()
+                info = service._api_client._session.http_cache.info()
+
+        self.assertEqual(server.not_modified, 0)
+        self.assertEqual((info.hits, info.misses, info.memory_size), (0, 0, 0))
+
+    def test_disabled(self):
+        """Test the cache can be disabled."""
+        with FakeResultsDBServer() as server:
+            with service_for(server, session_options={"http_cache_size": 0}) as service:
+                experiment_id = create_experiment(service, notes="Some notes")
+                service.experiment(experiment_id)
+                service.experiment(experiment_id)
+                self.assertIsNone(service._api_client._session.http_cache)
+
+        self.assertEqual(server.not_modified, 0)
+
+    def test_memory_limit(self):
+        """Test the least recently used entries are evicted from memory."""
+        cache = HttpCache(max_memory_size=25)
+        for key in "abc":
+            cache.put(key, _entry(b"0123456789"))
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("c"))
+        cache.put("d", _entry(b"x" * 26))
+        self.assertIsNone(cache.get("d"))
+        self.assertEqual(cache.info().memory_size, 20)
+
+    def test_disk_cache(self):
+        """Test entries are kept on disk across caches, within the size limit."""
+        with tempfile.TemporaryDirectory() as directory:
+            cache = HttpCache(directory=directory, max_disk_size=450)
+            for key in "abc":
+                cache.put(key, _entry(key.encode("utf-8") * 100))
+            self.assertLessEqual(cache.info().disk_size, 450)
+            self.assertEqual(len(os.listdir(directory)), 2)
+
+            other_cache = HttpCache(directory=directory, max_disk_size=450)
+            self.assertIsNone(other_cache.get("a"))
+            self.assertEqual(other_cache.get("c"), _entry(b"c" * 100))
+            other_cache.clear()
+            self.assertEqual(os.listdir(directory), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Package import time tests."""
+
+import json
+import subprocess
+import sys
+import unittest
+from test.service.ibm_test_case import IBMTestCase
+
+# Modules the package does not import itself, because they are slow to import or
+# only needed by some features. Qiskit may import some of them, such as numpy.
+DEFERRED_MODULES = [
+    "numpy",
+    "dateutil",
+    "pkg_resources",
+    "requests_ntlm",
+    "aiohttp",
+    "opentelemetry",
+]
+
+_IMPORT_CODE = """
+import json, logging, sys
+import qiskit
+modules = set(sys.modules)
+import qiskit_ibm_experiment
+print(json.dumps({
+    "imported": sorted(set(sys.modules) - modules),
+    "handlers": str(logging.getLogger("qiskit_ibm_experiment").handlers),
+}))
+"""
+
+
+class TestImportTime(IBMTestCase):
+    """Test importing the package is fast.
+
+    The import time itself is measured by the ``benchmarks/import_time.py``
+    benchmarks, as timing is unreliable on shared test machines.
+    """
+
+    def test_deferred_imports(self):
+        """Test importing the package has no side effects and skips slow modules."""
+        result = subprocess.run(
+            [sys.executable, "-c", _IMPORT_CODE],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        output = json.loads(result.stdout)
+        imported = {module.split(".")[0] for module in output["imported"]}
+        for module in DEFERRED_MODULES:
+            self.assertNotIn(module, imported)
+        self.assertEqual(output["handlers"], "[]")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Streaming JSON decoding tests."""
+
+import json
+import unittest
+import uuid
+from test.service.ibm_test_case import IBMTestCase
+from test.service.local_client import local_service
+
+from qiskit_ibm_experiment.service.json_stream import StreamedPage
+
+
+def _chunks(data, size):
+    """Split a JSON document into encoded chunks."""
+    encoded = json.dumps(data).encode("utf-8")
+    return [encoded[i : i + size] for i in range(0, len(encoded), size)]
+
+
+class TestStreamedPage(IBMTestCase):
+    """Test incremental decoding of pages."""
+
+    def test_decode_chunks(self):
+        """Test pages are decoded regardless of how they are split."""
+        data = {
+            "experiments": [
+                {"uuid": str(i), "notes": "ünïcödé ✓", "value": i * 1.5, "tags": []}
+                for i in range(20)
+            ],
+            "marker": "next",
+        }
+        for size in [1, 3, 64, 10**6]:
+            with self.subTest(size=size):
+                page = StreamedPage(_chunks(data, size), "experiments")
+                self.assertEqual(list(page), data["experiments"])
+                self.assertEqual(page.marker, "next")
+                self.assertEqual(page.num_records, 20)
+                self.assertEqual(page.num_bytes, len(json.dumps(data).encode("utf-8")))
+
+    def test_marker_before_records(self):
+        """Test fields before the records are decoded."""
+        data = {"marker": "next", "analysis_results": [], "extra": {"a": [1, 2]}}
+        page = StreamedPage(_chunks(data, 5), "analysis_results")
+        self.assertEqual(list(page), [])
+        self.assertEqual(page.fields, {"marker": "next", "extra": {"a": [1, 2]}})
+
+    def test_records_are_streamed(self):
+        """Test records are returned before the whole page is received."""
+        received = []
+
+        def chunks():
+            for chunk in _chunks({"experiments": [{"uuid": "1"}, {"uuid": "2"}]}, 8):
+                received.append(chunk)
+                yield chunk
+
+        records = iter(StreamedPage(chunks(), "experiments"))
+        self.assertEqual(next(records), {"uuid": "1"})
+        self.assertLess(len(received), 5)
+
+    def test_json_decoder(self):
+        """Test the JSON decoder is used to decode the records."""
+
+        class Decoder(json.JSONDecoder):
+            """Decoder marking decoded objects."""
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, object_hook=self.hook, **kwargs)
+
+            @staticmethod
+            def hook(obj):
+                """Mark the object."""
+                return dict(obj, decoded=True)
+
+        page = StreamedPage(
+            _chunks({"experiments": [{"uuid": "1"}]}, 4), "experiments", Decoder
+        )
+        self.assertEqual(list(page), [{"uuid": "1", "decoded": True}])
+
+    def test_invalid_json(self):
+        """Test invalid responses raise an error."""
+        for text in ['{"experiments": [{"uuid": 1}', '{"experiments": [1 2]}', "[]"]:
+            with self.subTest(text=text):
+                with self.assertRaises(json.JSONDecodeError):
+                    list(StreamedPage([text.encode("utf-8")], "experiments"))
+
+    def test_service_stream_pages(self):
+        """Test the service returns the same records when streaming pages."""
+        service = local_service(page_size=3)
+        for _ in range(10):
+            service._api_client.experiment_upload(
+                json.dumps(
+                    {"uuid": str(uuid.uuid4()), "type": "T1", "device_name": "lima"}
+                )
+            )
+        expected = service.experiments(limit=None)
+        service.set_option(stream_pages=True)
+        self.assertEqual(service.experiments(limit=None), expected)
+        self.assertEqual(service.experiments(limit=4), expected[:4])
+        self.assertEqual(len(expected), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Request metrics tests."""
+
+import unittest
+import uuid
+from test.service.fake_server import (
+    FakeResultsDBServer,
+    create_experiment,
+    service_for,
+)
+from test.service.ibm_test_case import IBMTestCase
+
+from qiskit_ibm_experiment import IBMExperimentEntryNotFound
+from qiskit_ibm_experiment.client.experiment_rest_adapter import ExperimentRestAdapter
+from qiskit_ibm_experiment.client.metrics import RequestMetrics
+
+
+class TestMetrics(IBMTestCase):
+    """Test the request metrics."""
+
+    def test_endpoint(self):
+        """Test request URLs are labeled with their endpoint template."""
+        metrics = RequestMetrics(ExperimentRestAdapter.URL_MAP.values())
+        self.assertEqual(metrics.endpoint("/experiments?limit=10"), "/experiments")
+        self.assertEqual(metrics.endpoint("/experiments/1234"), "/experiments/{uuid}")
+        self.assertEqual(
+            metrics.endpoint("/experiments/1234/files/upload/dir/file.json"),
+            "/experiments/{uuid}/files/upload/{path}",
+        )
+        self.assertEqual(metrics.endpoint("/unknown"), "other")
+        self.assertEqual(metrics.endpoint(None), "external")
+
+    def test_prometheus(self):
+        """Test the Prometheus text format."""
+        metrics = RequestMetrics(["/experiments"], buckets=(0.1, 1.0))
+        metrics.record("/experiments", "get", 0.5, bytes_received=100, retries=2)
+        metrics.record("/experiments", "get", 2.0, error=True)
+        text = metrics.to_prometheus()
+        labels = 'endpoint="/experiments",method="GET"'
+        for line in [
+            f"qiskit_ibm_experiment_requests_total{{{labels}}} 2",
+            f"qiskit_ibm_experiment_request_errors_total{{{labels}}} 1",
+            f"qiskit_ibm_experiment_request_retries_total{{{labels}}} 2",
+            f"qiskit_ibm_experiment_response_bytes_received_total{{{labels}}} 100",
+            f'qiskit_ibm_experiment_request_duration_seconds_bucket{{{labels},le="0.1"}} 0',
+            f'qiskit_ibm_experiment_request_duration_seconds_bucket{{{labels},le="1.0"}} 1',
+            f'qiskit_ibm_experiment_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2',
+            f"qiskit_ibm_experiment_request_duration_seconds_sum{{{labels}}} 2.5",
+            f"qiskit_ibm_experiment_request_duration_seconds_count{{{labels}}} 2",
+        ]:
+            self.assertIn(line, text.splitlines())
+
+    def test_service_metrics(self):
+        """Test the service collects the metrics of its requests."""
+        with FakeResultsDBServer() as server:
+            with service_for(
+                server,
+                session_options={"collect_metrics": True, "backoff_factor": 0},
+            ) as service:
+                experiment_id = create_experiment(service)
+                server.fail_next(503)
+                service.experiment(experiment_id)
+                with self.assertRaises(IBMExperimentEntryNotFound):
+                    service.experiment(str(uuid.uuid4()))
+                snapshot = service.metrics().snapshot()
+                service.metrics().reset()
+                self.assertEqual(service.metrics().snapshot(), {})
+
+        created = snapshot[("/experiments", "POST")]
+        self.assertEqual((created.requests, created.errors), (1, 0))
+        self.assertGreater(created.bytes_sent, 0)
+        fetched = snapshot[("/experiments/{uuid}", "GET")]
+        self.assertEqual((fetched.requests, fetched.errors, fetched.retries), (2, 1, 1))
+        self.assertGreater(fetched.bytes_received, 0)
+        self.assertEqual(fetched.latency_buckets[-1][1], 2)
+
+    def test_disabled(self):
+        """Test metrics are not collected by default."""
+        with FakeResultsDBServer() as server:
+            with service_for(server) as service:
+                self.assertIsNone(service.metrics())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Retry policy tests."""
+
+import time
+import unittest
+from test.service.fake_server import (
+    FakeResultsDBServer,
+    create_experiment,
+    service_for,
+)
+from test.service.ibm_test_case import IBMTestCase
+
+from urllib3.response import HTTPResponse
+
+from qiskit_ibm_experiment.client.session import PostForcelistRetry, RetryBudget
+from qiskit_ibm_experiment.exceptions import IBMApiError
+
+
+class TestRetry(IBMTestCase):
+    """Test the retry policy."""
+
+    def _service(self, server, **session_options):
+        """Return a service connected to the server, with an experiment."""
+        service = service_for(server, session_options=session_options)
+        self.addCleanup(service.close)
+        return service, create_experiment(service)
+
+    def test_retry_after(self):
+        """Test throttled requests are retried after the Retry-After delay."""
+        with FakeResultsDBServer() as server:
+            service, experiment_id = self._service(server)
+            server.fail_next(429, headers={"Retry-After": "1"})
+            start = time.monotonic()
+            service.experiment(experiment_id)
+            self.assertGreaterEqual(time.monotonic() - start, 0.9)
+
+    def test_retry_after_max(self):
+        """Test the Retry-After delay is capped."""
+        with FakeResultsDBServer() as server:
+            service, experiment_id = self._service(server, retry_after_max=0)
+            server.fail_next(429, headers={"Retry-After": "3600"})
+            start = time.monotonic()
+            service.experiment(experiment_id)
+            self.assertLess(time.monotonic() - start, 5)
+
+    def test_full_jitter(self):
+        """Test the backoff is drawn between zero and the exponential backoff."""
+        retry = PostForcelistRetry(total=10, backoff_factor=1, max_backoff=3)
+        for _ in range(3):
+            retry = retry.increment("GET", "/", response=HTTPResponse(status=503))
+        self.assertIsInstance(retry, PostForcelistRetry)
+        times = {retry.get_backoff_time() for _ in range(20)}
+        self.assertTrue(all(0 <= value <= 3 for value in times))
+        self.assertGreater(len(times), 1)
+
+        fixed = retry.new(full_jitter=False)
+        self.assertEqual(fixed.get_backoff_time(), 3)
+
+    def test_retry_budget(self):
+        """Test the retry budget limits the number of retries."""
+        budget = RetryBudget(ratio=0.5, min_rate=0.1)
+        self.assertTrue(budget.try_retry())
+        self.assertFalse(budget.try_retry())
+        budget.record_request()
+        budget.record_request()
+        self.assertTrue(budget.try_retry())
+        self.assertFalse(budget.try_retry())
+
+    def test_service_retry_budget(self):
+        """Test requests fail once the shared retry budget is exhausted."""
+        with FakeResultsDBServer() as server:
+            service, experiment_id = self._service(
+                server,
+                backoff_factor=0,
+                retry_budget_ratio=0,
+                retry_budget_min_rate=0.1,
+            )
+            server.fail_next(503, count=3)
+            with self.assertRaises(IBMApiError):
+                service.experiment(experiment_id)
+            path = f"/resultsdb/experiments/{experiment_id}"
+            self.assertEqual(server.requests[("GET", path)], 2)
+
+    def test_service_retry_options(self):
+        """Test the retry options are passed to the session."""
+        with FakeResultsDBServer() as server:
+            service, _ = self._service(
+                server, retries_total=2, backoff_factor=0.1, backoff_jitter=False
+            )
+            session = service._api_client._session.session()
+            retry = session.get_adapter(server.url).max_retries
+            self.assertEqual(retry.total, 2)
+            self.assertEqual(retry.backoff_factor, 0.1)
+            self.assertFalse(retry.full_jitter)
+            self.assertIs(retry.budget, service._api_client._session.retry_budget)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""HTTP session tests."""
+
+import threading
+import unittest
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from test.service.fake_server import (
+    FakeResultsDBServer,
+    create_experiment,
+    service_for,
+)
+from test.service.ibm_test_case import IBMTestCase
+from unittest import mock
+
+from qiskit_ibm_experiment import IBMExperimentService
+from qiskit_ibm_experiment.client.session import RetrySession, SessionPool
+from qiskit_ibm_experiment.exceptions import IBMApiError
+
+API_URL = "https://api.example.com/resultsdb"
+STORAGE_URL = "https://s3.example.com/bucket/file.json?signature=abc"
+
+
+def _set_access_token(service, auth_url, api_token=None):
+    """Replacement of ``get_access_token`` that does not connect to the server."""
+    # pylint: disable=unused-argument
+    service._access_token = "access-token"
+
+
+class TestRetrySession(IBMTestCase):
+    """Test the HTTP session."""
+
+    def test_default_pools(self):
+        """Test the API and storage hosts use separate connection pools."""
+        session = RetrySession(API_URL, "token")
+        api_adapter = session.get_adapter(API_URL + "/experiments")
+        storage_adapter = session.get_adapter(STORAGE_URL)
+        self.assertIsNot(api_adapter, storage_adapter)
+        for adapter in [api_adapter, storage_adapter]:
+            self.assertEqual(adapter._pool_maxsize, 10)
+            self.assertFalse(adapter._pool_block)
+            self.assertEqual(adapter.max_retries.total, 8)
+
+    def test_pool_options(self):
+        """Test the connection pools can be sized."""
+        session = RetrySession(
+            API_URL,
+            "token",
+            pool_maxsize=32,
+            pool_block=True,
+            host_pool_maxsize={"s3.example.com": 64, "https://API.example.com": 16},
+        )
+        api_adapter = session.get_adapter(API_URL + "/experiments")
+        self.assertEqual(api_adapter._pool_maxsize, 16)
+        self.assertEqual(session.get_adapter(STORAGE_URL)._pool_maxsize, 64)
+        other_adapter = session.get_adapter("https://other.example.com")
+        self.assertEqual(other_adapter._pool_maxsize, 32)
+        self.assertTrue(other_adapter._pool_block)
+        self.assertEqual(other_adapter.poolmanager.connection_pool_kw["maxsize"], 32)
+
+    def test_service_session_options(self):
+        """Test the service passes the session options to the session."""
+        with mock.patch.object(
+            IBMExperimentService, "get_access_token", _set_access_token
+        ):
+            service = IBMExperimentService(
+                token="api-token",
+                url="https://api.example.com",
+                session_options={"pool_maxsize": 32, "pool_block": True},
+            )
+        session = service._api_client._session.session()
+        adapter = session.get_adapter(API_URL + "/experiments")
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertTrue(adapter._pool_block)
+        self.assertEqual(session.get_adapter(STORAGE_URL)._pool_maxsize, 32)
+
+
+class TestSessionPool(IBMTestCase):
+    """Test the thread-safe session pool."""
+
+    def test_session_per_thread(self):
+        """Test each thread uses its own session, sharing the access token."""
+        pool = SessionPool(API_URL, "token", pool_maxsize=32)
+        sessions = []
+        threads = [
+            threading.Thread(target=lambda: sessions.append(pool.session()))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertIs(pool.session(), pool.session())
+        sessions.append(pool.session())
+        self.assertEqual(len({id(session) for session in sessions}), 5)
+        for session in sessions:
+            self.assertEqual(session.base_url, API_URL)
+            self.assertEqual(
+                session.get_adapter(API_URL)._pool_maxsize,
+                32,
+            )
+
+        pool.access_token = "new-token"
+        self.assertEqual(pool.session().headers["X-Access-Token"], "new-token")
+
+    def test_close(self):
+        """Test closing the pool closes the sessions of all the threads."""
+        with SessionPool(API_URL, "token") as pool:
+            session = pool.session()
+            with mock.patch.object(session, "close") as close:
+                pool.close()
+                close.assert_called_once()
+            self.assertIsNot(pool.session(), session)
+
+    def test_close_prefetching_service(self):
+        """Test closing a service while a page is being prefetched."""
+        original_shutdown = ThreadPoolExecutor.shutdown
+
+        def _shutdown(executor, wait=True):
+            """``ThreadPoolExecutor.shutdown`` of Python 3.8 and older."""
+            original_shutdown(executor, wait)
+
+        with FakeResultsDBServer() as server:
+            service = service_for(server, page_size=3, prefetch_pages=True)
+            for _ in range(7):
+                create_experiment(service)
+            experiments = service.iter_experiments(limit=None)
+            next(experiments)
+            self.assertIsNotNone(service._executor)
+            with mock.patch.object(ThreadPoolExecutor, "shutdown", _shutdown):
+                service.close()
+            experiments.close()
+            self.assertIsNone(service._executor)
+            self.assertEqual(service._background, set())
+            self.assertEqual(len(service.experiments(limit=None)), 7)
+            service.close()
+
+    def test_lazy_connect(self):
+        """Test a lazy service authenticates on its first request."""
+        with FakeResultsDBServer() as server:
+            with IBMExperimentService(
+                token=str(uuid.uuid4()), url=server.url, lazy=True
+            ) as service:
+                self.assertEqual(service.preferences, {"auto_save": False})
+                self.assertIsNone(service.transfer_stats())
+                self.assertEqual(server.logins, 0)
+                service.backends()
+                service.connect()
+                self.assertEqual(server.logins, 1)
+
+            with IBMExperimentService(
+                token=str(uuid.uuid4()), url=server.url, lazy=True
+            ) as service:
+                service.connect()
+                self.assertEqual(server.logins, 2)
+                service.backends()
+                self.assertEqual(server.logins, 2)
+
+    def test_local_connect(self):
+        """Test a local service does not connect to the result DB."""
+        service = IBMExperimentService(local=True)
+        with self.assertRaises(IBMApiError):
+            service.connect()
+        with self.assertRaises(IBMApiError):
+            service.experiments()
+
+    def test_shared_service(self):
+        """Test a service can be used concurrently from many threads."""
+        num_threads = 32
+        with FakeResultsDBServer() as server:
+            with service_for(
+                server, session_options={"pool_maxsize": num_threads}
+            ) as service:
+
+                def _work(index):
+                    experiment_id = create_experiment(service, notes=str(index))
+                    for _ in range(5):
+                        experiment = service.experiment(experiment_id)
+                        self.assertEqual(experiment["notes"], str(index))
+                    service.update_experiment(experiment_id, tags=[str(index)])
+                    return experiment_id
+
+                with ThreadPoolExecutor(max_workers=num_threads) as executor:
+                    experiment_ids = list(executor.map(_work, range(num_threads * 4)))
+                experiments = service.experiments(limit=None)
+
+        self.assertEqual(server.logins, 1)
+        self.assertEqual(len(set(experiment_ids)), num_threads * 4)
+        self.assertCountEqual(
+            [experiment["experiment_id"] for experiment in experiments],
+            experiment_ids,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
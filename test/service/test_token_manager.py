@@ -0,0 +1,97 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Access token manager tests."""
+
+import os
+import tempfile
+import time
+import unittest
+from test.service.fake_server import (
+    FakeResultsDBServer,
+    create_experiment,
+    service_for,
+)
+from test.service.ibm_test_case import IBMTestCase
+
+from qiskit_ibm_experiment.client import token_manager
+from qiskit_ibm_experiment.client.token_manager import TokenManager
+
+
+class TestTokenManager(IBMTestCase):
+    """Test the access token manager."""
+
+    def setUp(self):
+        """Test level setup."""
+        super().setUp()
+        self.server = FakeResultsDBServer().__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+        self.auth_url = self.server.url + "/v2/users/loginWithToken"
+        token_manager._TOKENS.clear()
+        self.addCleanup(token_manager._TOKENS.clear)
+
+    def _service(self, **session_options):
+        """Return a service connected to the server."""
+        service = service_for(self.server, session_options=session_options)
+        self.addCleanup(service.close)
+        return service
+
+    def test_shared_login(self):
+        """Test services using the same API token log in once."""
+        for _ in range(3):
+            self._service().backends()
+        self.assertEqual(self.server.logins, 1)
+
+    def test_reauthenticate(self):
+        """Test a rejected access token is replaced and the request sent again."""
+        service = self._service()
+        experiment_id = create_experiment(service)
+        self.server.revoke_tokens()
+        self.assertEqual(
+            service.experiment(experiment_id)["experiment_id"], experiment_id
+        )
+        self.assertEqual(self.server.logins, 2)
+
+    def test_proactive_refresh(self):
+        """Test the access token is replaced before it expires."""
+        self.server.token_ttl = 1
+        service = self._service()
+        service.backends()
+        time.sleep(0.6)
+        service.backends()
+        self.assertEqual(self.server.logins, 2)
+
+    def test_file_cache(self):
+        """Test processes share the access tokens cached in files."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            manager = TokenManager(self.auth_url, "api-token", cache_dir=cache_dir)
+            self.addCleanup(manager.close)
+            token = manager.token()
+            (path,) = [name for name in os.listdir(cache_dir) if name.endswith("json")]
+            if os.name == "posix":
+                mode = os.stat(os.path.join(cache_dir, path)).st_mode
+                self.assertEqual(mode & 0o777, 0o600)
+
+            # Another process only finds the token on disk.
+            token_manager._TOKENS.clear()
+            other = TokenManager(self.auth_url, "api-token", cache_dir=cache_dir)
+            self.addCleanup(other.close)
+            self.assertEqual(other.token(), token)
+            self.assertEqual(self.server.logins, 1)
+
+            self.assertNotEqual(other.refresh(stale=token), token)
+            self.assertEqual(manager.refresh(stale=token), other.token())
+            self.assertEqual(self.server.logins, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Request tracing tests."""
+
+import unittest
+import uuid
+from test.service.fake_server import (
+    FakeResultsDBServer,
+    create_experiment,
+    service_for,
+)
+from test.service.ibm_test_case import IBMTestCase
+
+from qiskit_ibm_experiment import IBMExperimentEntryNotFound
+from qiskit_ibm_experiment.client.tracing import (
+    RecordingTracer,
+    OpenTelemetryTracer,
+    set_tracer,
+)
+
+
+class TestTracing(IBMTestCase):
+    """Test the request tracing."""
+
+    def setUp(self):
+        """Test level setup."""
+        super().setUp()
+        self.server = FakeResultsDBServer().__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+        self.service = service_for(self.server, page_size=3, prefetch_pages=True)
+        self.addCleanup(self.service.close)
+        for _ in range(7):
+            create_experiment(self.service)
+        self.tracer = RecordingTracer()
+        set_tracer(self.tracer)
+        self.addCleanup(set_tracer, None)
+
+    def test_span_hierarchy(self):
+        """Test a query is traced with its pages, requests and decoding."""
+        self.server.received.clear()
+        self.assertEqual(len(self.service.experiments(limit=None)), 7)
+
+        spans = self.tracer.spans
+        root = spans[-1]
+        self.assertEqual(root.name, "IBMExperimentService.experiments")
+        self.assertIsNone(root.parent_id)
+        self.assertTrue(all(span.trace_id == root.trace_id for span in spans))
+
+        by_id = {span.span_id: span for span in spans}
+        pages = [span for span in spans if span.name == "page"]
+        decodes = [span for span in spans if span.name == "decode"]
+        requests = [span for span in spans if span.name == "HTTP GET"]
+        self.assertEqual((len(pages), len(decodes), len(requests)), (3, 3, 3))
+        for span in pages + decodes:
+            self.assertEqual(span.parent_id, root.span_id)
+        for span in requests:
+            self.assertEqual(by_id[span.parent_id].name, "page")
+            self.assertEqual(span.attributes["http.status_code"], 200)
+
+        # The server receives the context of the request spans.
+        traceparents = [item[4] for item in self.server.received]
+        self.assertEqual(
+            traceparents,
+            [f"00-{root.trace_id}-{span.span_id}-01" for span in requests],
+        )
+
+    def test_error(self):
+        """Test the failed requests are recorded in their spans."""
+        with self.assertRaises(IBMExperimentEntryNotFound):
+            self.service.experiment(str(uuid.uuid4()))
+        request, root = self.tracer.spans
+        self.assertEqual(request.attributes["http.status_code"], 404)
+        self.assertEqual(
+            root.attributes["exception.type"], "IBMExperimentEntryNotFound"
+        )
+
+    def test_disabled(self):
+        """Test nothing is traced when tracing is disabled."""
+        set_tracer(None)
+        self.server.received.clear()
+        self.service.experiments(limit=None)
+        self.assertEqual(self.tracer.spans, [])
+        self.assertTrue(all(item[4] is None for item in self.server.received))
+
+    def test_opentelemetry(self):
+        """Test the OpenTelemetry tracer."""
+        try:
+            tracer = OpenTelemetryTracer()
+        except ImportError:
+            self.skipTest("opentelemetry-api is not installed.")
+        set_tracer(tracer)
+        self.assertEqual(len(self.service.experiments(limit=None)), 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
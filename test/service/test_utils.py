@@ -0,0 +1,85 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Experiment service utility tests."""
+
+import unittest
+from datetime import datetime, timezone
+from test.service.ibm_test_case import IBMTestCase
+from test.service.local_client import local_service
+
+import dateutil.parser
+import dateutil.tz
+
+from qiskit_ibm_experiment.service.utils import (
+    parse_timestamp,
+    utc_to_local,
+    utc_to_local_many,
+    str_to_utc,
+)
+
+
+class TestTimestampConversion(IBMTestCase):
+    """Test timestamp conversion."""
+
+    def test_parse_timestamp(self):
+        """Test timestamps are parsed like dateutil does."""
+        for timestamp in [
+            "2022-01-01T10:00:00Z",
+            "2022-01-01T10:00:00.123456Z",
+            "2022-01-01T10:00:00.5Z",
+            "2022-01-01T10:00:00+02:00",
+            "2022-01-01T10:00:00",
+            "2022-01-01",
+            "Jan 1 2022 10:00",
+        ]:
+            with self.subTest(timestamp=timestamp):
+                self.assertEqual(
+                    parse_timestamp(timestamp), dateutil.parser.parse(timestamp)
+                )
+
+    def test_utc_to_local(self):
+        """Test UTC timestamps are converted to the local time zone."""
+        local_dt = utc_to_local("2022-01-01T10:00:00.25Z")
+        self.assertEqual(local_dt.tzinfo, dateutil.tz.tzlocal())
+        self.assertEqual(
+            local_dt, datetime(2022, 1, 1, 10, 0, 0, 250000, tzinfo=timezone.utc)
+        )
+
+    def test_utc_to_local_many(self):
+        """Test converting many timestamps."""
+        timestamps = ["2022-01-01T10:00:00Z", None, "2022-01-02T10:00:00Z"]
+        self.assertEqual(
+            utc_to_local_many(timestamps),
+            [utc_to_local(timestamps[0]), None, utc_to_local(timestamps[2])],
+        )
+        utc_dts = utc_to_local_many(timestamps, utc=True)
+        self.assertEqual(utc_dts[0], str_to_utc(timestamps[0]))
+        self.assertIs(utc_dts[0].tzinfo, timezone.utc)
+
+    def test_utc_timestamps_option(self):
+        """Test the service can return UTC timestamps."""
+        service = local_service(utc_timestamps=True)
+        service._api_client.experiment_upload(
+            '{"type": "T1", "device_name": "ibmq_lima",'
+            ' "start_time": "2022-01-01T10:00:00Z"}'
+        )
+        experiment = service.experiments()[0]
+        self.assertIs(experiment["start_datetime"].tzinfo, timezone.utc)
+        self.assertIs(experiment["creation_datetime"].tzinfo, timezone.utc)
+        self.assertEqual(
+            experiment["start_datetime"], datetime(2022, 1, 1, 10, tzinfo=timezone.utc)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Write-behind queue tests."""
+
+import threading
+import unittest
+import uuid
+from test.service.fake_server import (
+    FakeResultsDBServer,
+    create_experiment,
+    service_for,
+)
+from test.service.ibm_test_case import IBMTestCase
+from test.service.local_client import local_service
+
+from qiskit_ibm_experiment import (
+    IBMExperimentEntryNotFound,
+    IBMExperimentQueueFull,
+)
+from qiskit_ibm_experiment.service.write_queue import WriteQueue
+
+
+class TestWriteBehind(IBMTestCase):
+    """Test the write-behind mode of the service."""
+
+    def setUp(self):
+        """Test level setup."""
+        super().setUp()
+        self.server = FakeResultsDBServer().__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+        self.failures = []
+        self.service = service_for(
+            self.server,
+            write_behind=True,
+            write_workers=3,
+            on_write_error=self.failures.append,
+        )
+        self.addCleanup(self.service.close)
+
+    def test_ordering(self):
+        """Test the writes of an experiment are sent in order."""
+        experiments = {}
+        for index in range(6):
+            experiment_id = create_experiment(self.service, experiment_type=f"T{index}")
+            result_ids = [
+                self.service.create_analysis_result(
+                    experiment_id,
+                    {"value": qubit},
+                    "T1",
+                    device_components=[f"Q{qubit}"],
+                )
+                for qubit in range(8)
+            ]
+            self.service.update_analysis_result(result_ids[0], tags=["updated"])
+            self.service.update_experiment(experiment_id, notes="done")
+            experiments[experiment_id] = result_ids
+        self.assertGreater(self.service.pending(), 0)
+
+        self.assertTrue(self.service.flush(timeout=30))
+        self.assertEqual(self.service.pending(), 0)
+        self.assertEqual(self.failures, [])
+        for experiment_id, result_ids in experiments.items():
+            self.assertEqual(self.service.experiment(experiment_id)["notes"], "done")
+            results = self.service.analysis_results(
+                experiment_id=experiment_id, limit=None
+            )
+            self.assertEqual(
+                sorted(result.result_id for result in results), sorted(result_ids)
+            )
+            self.assertEqual(
+                self.service.analysis_result(result_ids[0]).tags, ["updated"]
+            )
+
+    def test_error_callback(self):
+        """Test failed writes are reported without stopping the others."""
+        experiment_id = create_experiment(self.service)
+        failed_id = self.service.create_analysis_result(str(uuid.uuid4()), {}, "T1")
+        result_id = self.service.create_analysis_result(experiment_id, {}, "T1")
+        self.assertTrue(self.service.flush(timeout=30))
+
+        (failure,) = self.failures
+        self.assertEqual(failure.operation, "create_analysis_result")
+        self.assertEqual(failure.key, failed_id)
+        self.assertIsInstance(failure.error, IBMExperimentEntryNotFound)
+        self.assertEqual(self.service.analysis_result(result_id).result_id, result_id)
+
+    def test_local_figures(self):
+        """Test figures and files are written behind with the local client."""
+        service = local_service(write_behind=True)
+        self.addCleanup(service.close)
+        experiment_id = create_experiment(service)
+        name, size = service.create_figure(experiment_id, b"<svg/>", "figure")
+        self.assertEqual((name, size), ("figure.svg", None))
+        service.file_upload(experiment_id, "data", {"key": "value"})
+        service.close()
+        self.assertEqual(service.pending(), 0)
+        self.assertEqual(service.figure(experiment_id, name), b"<svg/>")
+        self.assertEqual(
+            service.file_download(experiment_id, "data.json"), {"key": "value"}
+        )
+
+
+class TestWriteQueue(IBMTestCase):
+    """Test the write queue."""
+
+    def test_backpressure(self):
+        """Test writes are refused while the queue is full."""
+        queue = WriteQueue(max_pending=2, max_workers=1)
+        self.addCleanup(queue.close)
+        release = threading.Event()
+        queue.submit("a", "write", release.wait)
+        queue.submit("b", "write", release.wait)
+        self.assertEqual(queue.pending(), 2)
+        with self.assertRaises(IBMExperimentQueueFull):
+            queue.submit("c", "write", release.wait, timeout=0.05)
+        self.assertFalse(queue.flush(timeout=0.05))
+        release.set()
+        self.assertTrue(queue.flush(timeout=5))
+        self.assertEqual(queue.pending(), 0)
+
+    def test_dependencies(self):
+        """Test writes wait for the writes of the entries they depend on."""
+        queue = WriteQueue(max_workers=4)
+        self.addCleanup(queue.close)
+        release = threading.Event()
+        order = []
+        queue.submit("experiment", "create", lambda: (release.wait(), order.append(1)))
+        queue.submit("result1", "create", lambda: order.append(2), after="experiment")
+        queue.submit("result2", "create", lambda: order.append(2), after="experiment")
+        queue.submit("result1", "update", lambda: order.append(3))
+        queue.submit("other", "create", lambda: order.append(0))
+        # Writes of other entries are not held up.
+        self.assertFalse(queue.flush(timeout=0.05))
+        self.assertEqual(order, [0])
+        release.set()
+        self.assertTrue(queue.flush(timeout=5))
+        self.assertEqual(order[:2], [0, 1])
+        self.assertLess(order.index(2), order.index(3))
+        self.assertEqual(sorted(order), [0, 1, 2, 2, 3])
+
+        # An experiment update waits for the writes depending on the experiment.
+        order.clear()
+        release.clear()
+        queue.submit("result3", "create", release.wait, after="experiment")
+        queue.submit("experiment", "update", lambda: order.append(1))
+        self.assertFalse(queue.flush(timeout=0.05))
+        self.assertEqual(order, [])
+        release.set()
+        self.assertTrue(queue.flush(timeout=5))
+        self.assertEqual(order, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()